@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import json
+import subprocess
 import sys
+import time
 from pathlib import Path
 
 import pytest
@@ -13,6 +15,7 @@ if str(SCRIPT_DIR) not in sys.path:
     sys.path.insert(0, str(SCRIPT_DIR))
 
 import advanced_video_editor as editor  # noqa: E402
+from auto_editor_config import AutoEditorConfig  # noqa: E402
 from ass_render import build_ass  # noqa: E402
 from edit_plan import (  # noqa: E402
     Chapter,
@@ -25,7 +28,19 @@ from edit_plan import (  # noqa: E402
 )
 from highlight_plan import Highlight  # noqa: E402
 from sound_design import build_sfx_command, build_sound_cues  # noqa: E402
-from timeline import BODY, HIGHLIGHT, build_timeline, map_range, total_duration  # noqa: E402
+from timeline import (  # noqa: E402
+    BODY,
+    HIGHLIGHT,
+    build_timeline,
+    clip_slices,
+    cut_slices,
+    map_range,
+    resolve_slices,
+    segment_windows,
+    to_cut_master,
+    to_recording,
+    total_duration,
+)
 
 
 def segment(start: float, end: float, text: str) -> dict[str, object]:
@@ -80,6 +95,54 @@ def test_a_timeline_without_highlights_is_just_the_body():
     assert map_range(slices, 5.0, 7.0) == ((5.0, 7.0),)
 
 
+def test_a_cut_list_lays_the_kept_stretches_end_to_end():
+    cut = cut_slices([(20.0, 30.0), (0.0, 5.0), (4.0, 8.0), (40.0, 40.0)])
+    assert [(item.source_start, item.source_end, item.output_start) for item in cut] == [
+        (0.0, 8.0, 0.0),
+        (20.0, 30.0, 8.0),
+    ]
+    assert total_duration(cut) == pytest.approx(18.0)
+
+
+def test_a_cut_master_range_across_a_cut_plays_two_recording_ranges():
+    cut = cut_slices([(0.0, 8.0), (20.0, 30.0)])
+    assert to_recording(cut, 6.0, 10.0) == ((6.0, 8.0), (20.0, 22.0))
+    assert to_cut_master(cut, 6.0, 22.0) == (6.0, 10.0)
+    assert to_cut_master(cut, 10.0, 18.0) is None
+
+
+def test_resolved_slices_render_the_same_video_from_the_recording():
+    cut = cut_slices([(0.0, 8.0), (20.0, 30.0)])
+    slices = build_timeline((Highlight(6.0, 10.0, "a"),), total_duration(cut))
+    resolved = resolve_slices(slices, cut)
+    assert [(item.source_start, item.source_end, item.kind) for item in resolved] == [
+        (6.0, 8.0, HIGHLIGHT),
+        (20.0, 22.0, HIGHLIGHT),
+        (0.0, 8.0, BODY),
+        (20.0, 30.0, BODY),
+    ]
+    assert total_duration(resolved) == pytest.approx(total_duration(slices))
+
+
+def test_render_windows_cover_the_video_on_frame_boundaries():
+    windows = segment_windows(125.0, 4, frame_rate=30.0)
+    assert len(windows) == 4
+    assert windows[0][0] == 0.0 and windows[-1][1] == 125.0
+    assert all(left[1] == right[0] for left, right in zip(windows, windows[1:]))
+    assert all(round(end * 30.0, 6).is_integer() for _, end in windows[:-1])
+    assert segment_windows(50.0, 8) == ((0.0, 50.0),)
+    assert segment_windows(0.0, 4) == ()
+
+
+def test_a_window_shows_the_end_of_the_reel_and_the_start_of_the_body():
+    slices = build_timeline((Highlight(30.0, 40.0, "a"),), 300.0)
+    clipped = clip_slices(slices, 5.0, 20.0)
+    assert [
+        (item.source_start, item.source_end, item.output_start, item.kind)
+        for item in clipped
+    ] == [(35.0, 40.0, 5.0, HIGHLIGHT), (0.0, 10.0, 10.0, BODY)]
+
+
 # --- captions ---------------------------------------------------------------
 
 
@@ -300,6 +363,34 @@ def test_render_command_trims_highlights_and_keeps_the_whole_body():
     assert "amix" not in graph
 
 
+def test_render_command_from_the_recording_trims_every_body_piece():
+    cut = cut_slices([(0.0, 8.0), (20.0, 30.0)])
+    slices = resolve_slices(build_timeline((), total_duration(cut)), cut)
+    command = editor.build_render_command(
+        Path("/tmp/recording.mkv"),
+        Path("/tmp/overlays.ass"),
+        Path("/tmp/out.mp4"),
+        slices,
+        from_recording=True,
+    )
+    graph = command[command.index("-filter_complex") + 1]
+    assert "[0:v]trim=start=0.000:end=8.000" in graph
+    assert "[0:a]atrim=start=20.000:end=30.000" in graph
+    assert "[0:v]setpts=PTS-STARTPTS[v0]" not in graph
+    assert "concat=n=2:v=1:a=1[basev][basea]" in graph
+
+
+def test_render_command_renders_a_reel_alone_for_a_pipelined_run():
+    slices = build_timeline((Highlight(10.0, 14.0, "a"),), 300.0)
+    reel = [item for item in slices if item.kind == HIGHLIGHT]
+    command = editor.build_render_command(
+        Path("/tmp/cut.mp4"), Path("/tmp/overlays.ass"), Path("/tmp/reel.mp4"), reel
+    )
+    graph = command[command.index("-filter_complex") + 1]
+    assert "concat=n=1:v=1:a=1[basev][basea]" in graph
+    assert "setpts=PTS-STARTPTS[v1]" not in graph
+
+
 def test_render_command_mixes_the_sound_track_without_ducking_speech():
     slices = build_timeline((), 300.0)
     command = editor.build_render_command(
@@ -314,6 +405,95 @@ def test_render_command_mixes_the_sound_track_without_ducking_speech():
     assert command.count("-i") == 2
 
 
+def test_segment_command_seeks_to_its_window_and_draws_it_at_its_place():
+    slices = build_timeline((Highlight(30.0, 40.0, "a"),), 300.0)
+    command = editor.build_segment_command(
+        Path("/tmp/cut.mp4"),
+        Path("/tmp/overlays.ass"),
+        Path("/tmp/out.part001.mp4"),
+        clip_slices(slices, 5.0, 20.0),
+        window_start=5.0,
+        frame_rate=30000 / 1001,
+        threads=8,
+    )
+    graph = command[command.index("-filter_complex") + 1]
+    assert command[command.index("-ss") + 1] == "0.000000"
+    assert command[command.index("-t") + 1] == "40.000000"
+    assert "[0:v]trim=start=35.000000:end=40.000000" in graph
+    assert "concat=n=2:v=1:a=0,setpts=PTS+5.000000/TB,ass=overlays.ass," in graph
+    assert graph.endswith("setpts=PTS-STARTPTS[outv]")
+    assert command[command.index("-r") + 1] == "30000/1001"
+    assert command[command.index("-threads") + 1] == "8"
+    assert "-an" in command
+
+
+def test_soundtrack_command_renders_the_whole_timeline_in_one_piece():
+    slices = build_timeline((Highlight(10.0, 14.0, "a"),), 300.0)
+    command = editor.build_soundtrack_command(
+        Path("/tmp/cut.mp4"),
+        Path("/tmp/out.soundtrack.m4a"),
+        slices,
+        sfx=Path("/tmp/sfx.wav"),
+    )
+    graph = command[command.index("-filter_complex") + 1]
+    assert "[0:a]atrim=start=10.000:end=14.000" in graph
+    assert "concat=n=2:v=0:a=1[basea]" in graph
+    assert "[basea][1:a]amix=inputs=2" in graph
+    assert "-vn" in command
+
+
+def test_join_command_copies_the_windows_and_the_soundtrack():
+    command = editor.build_join_command(
+        Path("/tmp/parts.txt"), Path("/tmp/sound.m4a"), Path("/tmp/out.mp4")
+    )
+    assert command[command.index("-c") + 1] == "copy"
+    assert command[command.index("-map") + 1] == "0:v"
+    assert "1:a" in command
+
+
+def test_one_failed_window_stops_the_rest_of_a_segmented_render(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    def slow(output: Path) -> list[str]:
+        return [
+            sys.executable,
+            "-c",
+            f"import time; open({str(output)!r}, 'wb').write(b'x'); time.sleep(60)",
+        ]
+
+    def segment_command(source, subtitle, output, pieces, **kwargs):
+        if kwargs["window_start"] == 0.0:
+            return [sys.executable, "-c", "import sys; sys.exit('window exploded')"]
+        return slow(output)
+
+    monkeypatch.setattr(editor, "build_segment_command", segment_command)
+    monkeypatch.setattr(
+        editor,
+        "build_soundtrack_command",
+        lambda source, output, slices, **kwargs: slow(output),
+    )
+    output = tmp_path / "recording.edited.mp4"
+    started = time.monotonic()
+
+    with pytest.raises(subprocess.CalledProcessError) as error:
+        editor._render_segmented(
+            tmp_path / "cut.mp4",
+            tmp_path / "overlays.ass",
+            output,
+            build_timeline((), 120.0),
+            sfx=None,
+            advanced=editor.AdvancedConfig(render_workers=2),
+            frame_rate=30.0,
+            from_recording=False,
+            reporter=editor.ProgressReporter(enabled=False),
+        )
+
+    assert "window exploded" in error.value.output
+    assert time.monotonic() - started < 30
+    assert not (tmp_path / "recording.edited.part001.mp4").exists()
+    assert not (tmp_path / "recording.edited.soundtrack.m4a").exists()
+
+
 # --- plan assembly ----------------------------------------------------------
 
 
@@ -367,6 +547,46 @@ def test_disabled_layers_are_really_empty():
     assert plan.captions == () and plan.telops == () and plan.chapters == ()
 
 
+def test_a_failed_cut_list_run_falls_back_to_the_same_silence_cut(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+):
+    source = tmp_path / "recording.mp4"
+    source.write_bytes(b"recording")
+    settings = AutoEditorConfig(threshold_percent=6.0, margin_seconds=0.1)
+    used: dict[str, AutoEditorConfig] = {}
+
+    def fake_export(src, out, reporter=None, auto_editor=AutoEditorConfig()):
+        used["cut_list"] = auto_editor
+        return None
+
+    def fake_cut(src, out, reporter=None, auto_editor=AutoEditorConfig()):
+        used["fallback"] = auto_editor
+        target = out / f"{src.stem}.cut_master.mp4"
+        target.write_bytes(b"cut")
+        return target
+
+    def failed_transcription(*_args, **_kwargs):
+        raise RuntimeError("whisper crashed")
+
+    monkeypatch.setattr(editor, "export_cut_list", fake_export)
+    monkeypatch.setattr(editor, "render_cut_master", fake_cut)
+    monkeypatch.setattr(editor, "wants_audio", lambda _template: False)
+    monkeypatch.setattr(
+        editor, "probe_video", lambda _path: editor.VideoInfo(60.0, 1280, 720)
+    )
+    monkeypatch.setattr(editor, "transcribe_cut_master", failed_transcription)
+
+    result = editor.run_pipeline(
+        source,
+        tmp_path / "out",
+        editor.PipelineConfig(cut_list_only=True, auto_editor=settings),
+        editor.AdvancedConfig(),
+    )
+
+    assert result.name == "recording.cut_master.mp4"
+    assert used == {"cut_list": settings, "fallback": settings}
+
+
 def test_advanced_config_reads_its_own_section(tmp_path: Path):
     config_file = tmp_path / "config.local.json"
     config_file.write_text(
@@ -374,7 +594,11 @@ def test_advanced_config_reads_its_own_section(tmp_path: Path):
             {
                 "working_dirs": [str(tmp_path)],
                 "opening_highlight": {"maximum_highlights": 2},
-                "advanced_edit": {"captions": False, "maximum_telops": 5},
+                "advanced_edit": {
+                    "captions": False,
+                    "maximum_telops": 5,
+                    "render_workers": 6,
+                },
             }
         ),
         encoding="utf-8",
@@ -383,6 +607,7 @@ def test_advanced_config_reads_its_own_section(tmp_path: Path):
     assert config.maximum_highlights == 2
     assert advanced.captions is False
     assert advanced.maximum_telops == 5
+    assert advanced.render_workers == 6
 
 
 def test_a_chapter_landing_on_a_cut_does_not_fire_two_effects():
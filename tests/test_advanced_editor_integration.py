@@ -7,10 +7,12 @@ because those are exactly the parts a unit test cannot prove.
 
 from __future__ import annotations
 
+import functools
 import json
 import shutil
 import subprocess
 import sys
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
@@ -20,6 +22,7 @@ if str(SCRIPT_DIR) not in sys.path:
     sys.path.insert(0, str(SCRIPT_DIR))
 
 import advanced_video_editor as editor  # noqa: E402
+import timeline  # noqa: E402
 
 TOOLS_AVAILABLE = bool(shutil.which("ffmpeg") and shutil.which("ffprobe"))
 requires_ffmpeg = pytest.mark.skipif(
@@ -68,13 +71,15 @@ def prepared(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> tuple[Path, Pat
     source = make_clip(tmp_path / "recording.mp4")
     output_dir = tmp_path / "out"
 
-    def fake_cut(src: Path, out: Path, reporter=None) -> Path:
+    def fake_cut(src: Path, out: Path, reporter=None, auto_editor=None) -> Path:
         out.mkdir(parents=True, exist_ok=True)
         target = out / f"{src.stem}.cut_master.mp4"
         shutil.copy(src, target)
         return target
 
-    def fake_transcribe(src: Path, out: Path, template=(), reporter=None) -> Path:
+    def fake_transcribe(
+        src: Path, out: Path, template=(), reporter=None, audio=None
+    ) -> Path:
         transcript = out / f"{src.stem}.json"
         transcript.write_text(json.dumps(TRANSCRIPT), encoding="utf-8")
         return transcript
@@ -215,3 +220,53 @@ def test_switching_every_layer_off_still_produces_the_highlight_first_cut(
     assert manifest["caption_count"] == 0
     assert manifest["sound_cues"] == []
     assert manifest["highlights"]
+
+
+@requires_ffmpeg
+def test_a_pipelined_run_joins_the_reel_to_a_body_encoded_alongside(
+    prepared: tuple[Path, Path],
+) -> None:
+    source, output_dir = prepared
+    result = editor.run_pipeline(
+        source,
+        output_dir,
+        editor.PipelineConfig(font_name="DejaVu Sans", font_size=28, pipelined=True),
+        editor.AdvancedConfig(
+            captions=False,
+            telops=False,
+            chapters=False,
+            video_preset="ultrafast",
+            video_crf=30,
+        ),
+    )
+
+    manifest = json.loads((output_dir / "edit_plan.json").read_text(encoding="utf-8"))
+    body = editor.probe_video(output_dir / "recording.body.mp4").duration
+    reel = sum(item["end"] - item["start"] for item in manifest["highlights"])
+    assert manifest["status"] == "success"
+    assert editor.probe_video(result).duration == pytest.approx(body + reel, abs=0.35)
+
+
+@requires_ffmpeg
+def test_a_segmented_render_joins_windows_into_one_continuous_video(
+    prepared: tuple[Path, Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source, output_dir = prepared
+    monkeypatch.setattr(
+        editor,
+        "segment_windows",
+        functools.partial(timeline.segment_windows, minimum_seconds=1.0),
+    )
+    result = editor.run_pipeline(
+        source,
+        output_dir,
+        pipeline_config(),
+        replace(advanced_config(), render_workers=3),
+    )
+
+    manifest = json.loads((output_dir / "edit_plan.json").read_text(encoding="utf-8"))
+    assert manifest["status"] == "success"
+    assert len(list(output_dir.glob("recording.edited.part*.mp4"))) == 3
+    assert editor.probe_video(result).duration == pytest.approx(
+        manifest["final_duration_seconds"], abs=0.35
+    )
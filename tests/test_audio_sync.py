@@ -1,7 +1,9 @@
 import importlib.util
 import json
+import os
 import subprocess
 import sys
+import threading
 from pathlib import Path
 
 import numpy as np
@@ -57,6 +59,38 @@ def test_envelope_is_one_value_per_step():
     assert envelope.size == pytest.approx(2.0 * ENVELOPE_RATE, abs=1)
 
 
+def test_the_envelope_keeps_the_precision_of_its_samples():
+    samples = speech_like_samples(2.0)
+
+    assert AUDIO_SYNC.loudness_envelope(samples.astype(np.float32)).dtype == np.float32
+    assert AUDIO_SYNC.loudness_envelope(samples).dtype == np.float64
+
+
+def test_the_float32_path_chooses_the_same_lag_as_the_float64_path():
+    shift_steps = int(2.4 * ENVELOPE_RATE)
+    session = speech_like_samples(120.0)
+    noise = np.random.default_rng(11).normal(0.0, 0.02, session.size)
+    head = np.zeros(shift_steps * SAMPLE_RATE // ENVELOPE_RATE)
+    target_samples = np.concatenate((head, session * 0.25 + noise))
+
+    results = {}
+    for dtype in (np.float64, np.float32):
+        reference = AUDIO_SYNC.loudness_envelope(session.astype(dtype), SAMPLE_RATE)
+        target = AUDIO_SYNC.loudness_envelope(target_samples.astype(dtype), SAMPLE_RATE)
+        np.testing.assert_allclose(
+            reference, AUDIO_SYNC.loudness_envelope(session, SAMPLE_RATE), rtol=1e-5, atol=1e-5
+        )
+        results[dtype] = AUDIO_SYNC.correlate_envelopes(reference, target, ENVELOPE_RATE)
+
+    # The whole-step lag is identical, and the sub-step refinement and the
+    # coefficient move by far less than anything a frame could show.
+    assert round(results[np.float32][0] * ENVELOPE_RATE) == round(
+        results[np.float64][0] * ENVELOPE_RATE
+    )
+    assert results[np.float32][0] == pytest.approx(results[np.float64][0], abs=1e-4)
+    assert results[np.float32][1] == pytest.approx(results[np.float64][1], abs=1e-5)
+
+
 def test_positive_lag_means_the_target_has_to_be_entered_later():
     shift_seconds = 1.5
     shift_steps = int(shift_seconds * ENVELOPE_RATE)
@@ -96,6 +130,215 @@ def test_offset_survives_different_gain_and_microphone_noise():
     assert confidence > AUDIO_SYNC.DEFAULT_MINIMUM_CONFIDENCE
 
 
+@pytest.mark.parametrize("shift_seconds", [37.35, -12.8])
+def test_the_coarse_search_finds_the_same_lag_as_the_full_search(shift_seconds):
+    shift_steps = int(round(abs(shift_seconds) * ENVELOPE_RATE))
+    clean = AUDIO_SYNC.loudness_envelope(speech_like_samples(300.0), SAMPLE_RATE)
+    noise = np.random.default_rng(11).normal(0.0, 0.05, clean.size + shift_steps)
+    head = np.zeros(shift_steps)
+    if shift_seconds > 0:
+        reference, target = clean, np.concatenate((head, clean * 0.3)) + noise
+    else:
+        reference, target = np.concatenate((head, clean)), clean * 0.3 + noise[: clean.size]
+
+    full = AUDIO_SYNC.correlate_envelopes(reference, target, ENVELOPE_RATE)
+    coarse = AUDIO_SYNC.correlate_envelopes(
+        reference, target, ENVELOPE_RATE, coarse_rate=AUDIO_SYNC.DEFAULT_COARSE_RATE
+    )
+
+    # The refined answer is the same lag and the same coefficient, not just close.
+    assert coarse[0] == pytest.approx(full[0], abs=1e-9)
+    assert coarse[0] == pytest.approx(shift_seconds, abs=0.01)
+    assert coarse[1] == pytest.approx(full[1], rel=1e-9)
+
+
+def test_the_coarse_search_still_rejects_unrelated_recordings():
+    reference = AUDIO_SYNC.loudness_envelope(speech_like_samples(120.0, seed=1), SAMPLE_RATE)
+    target = AUDIO_SYNC.loudness_envelope(speech_like_samples(120.0, seed=2), SAMPLE_RATE)
+
+    _, confidence = AUDIO_SYNC.correlate_envelopes(
+        reference, target, ENVELOPE_RATE, coarse_rate=AUDIO_SYNC.DEFAULT_COARSE_RATE
+    )
+
+    assert confidence < AUDIO_SYNC.DEFAULT_MINIMUM_CONFIDENCE
+
+
+def test_the_lag_is_resolved_to_a_fraction_of_an_envelope_step():
+    fine_rate = ENVELOPE_RATE * 10
+    fine = AUDIO_SYNC.loudness_envelope(speech_like_samples(60.0), SAMPLE_RATE, fine_rate)
+    # Shifting by 25 fine steps is 2.5 coarse steps, which no whole step can express.
+    reference = AUDIO_SYNC.decimate_envelope(fine, 10)
+    target = AUDIO_SYNC.decimate_envelope(np.concatenate((np.zeros(25), fine)), 10)
+
+    lag, _ = AUDIO_SYNC.correlate_envelopes(reference, target, ENVELOPE_RATE)
+
+    assert lag == pytest.approx(2.5 / ENVELOPE_RATE, abs=0.2 / ENVELOPE_RATE)
+
+
+def drifting_copy(envelope: np.ndarray, offset_seconds: float, drift: float) -> np.ndarray:
+    """Play an envelope back on a clock that runs `drift` faster, after a head."""
+    steps = np.arange(int((envelope.size / ENVELOPE_RATE * (1 + drift) + offset_seconds) * ENVELOPE_RATE))
+    reference_time = (steps / ENVELOPE_RATE - offset_seconds) / (1 + drift)
+    source = np.arange(envelope.size) / ENVELOPE_RATE
+    return np.interp(reference_time, source, envelope, left=0.0, right=0.0)
+
+
+def test_a_clock_drift_is_measured_along_the_whole_recording():
+    reference = AUDIO_SYNC.loudness_envelope(speech_like_samples(1200.0), SAMPLE_RATE)
+    target = drifting_copy(reference, 2.0, 0.001)
+
+    drift = AUDIO_SYNC.measure_drift(reference, target, ENVELOPE_RATE, 2.0)
+
+    assert drift.drift == pytest.approx(0.001, abs=5e-5)
+    assert drift.offset_seconds == pytest.approx(2.0, abs=0.02)
+    assert drift.offset_at(1200.0) == pytest.approx(3.2, abs=0.05)
+    assert len(drift.windows) == AUDIO_SYNC.DEFAULT_DRIFT_WINDOWS
+
+
+def test_matched_clocks_measure_no_drift():
+    reference = AUDIO_SYNC.loudness_envelope(speech_like_samples(600.0), SAMPLE_RATE)
+    target = np.concatenate((np.zeros(400), reference * 0.5))
+
+    drift = AUDIO_SYNC.measure_drift(reference, target, ENVELOPE_RATE, 2.0)
+
+    assert drift.drift == pytest.approx(0.0, abs=2e-5)
+    assert drift.offset_seconds == pytest.approx(2.0, abs=0.01)
+
+
+def test_a_drift_is_not_claimed_from_unrelated_recordings():
+    reference = AUDIO_SYNC.loudness_envelope(speech_like_samples(300.0, seed=1), SAMPLE_RATE)
+    target = AUDIO_SYNC.loudness_envelope(speech_like_samples(300.0, seed=2), SAMPLE_RATE)
+
+    with pytest.raises(AUDIO_SYNC.AudioSyncError, match="Too few windows"):
+        AUDIO_SYNC.measure_drift(reference, target, ENVELOPE_RATE, 0.0)
+
+
+def brute_force_peak(reference: np.ndarray, target: np.ndarray) -> tuple[int, float]:
+    """Score every lag with a plain dot product, the definition the FFT must match."""
+    first = (reference - reference.mean()) / reference.std()
+    second = (target - target.mean()) / target.std()
+    minimum = max(200, 0.5 * min(first.size, second.size))
+    best = (0, -np.inf)
+    for lag in range(-(first.size - 1), second.size):
+        if lag >= 0:
+            a, b = first[: second.size - lag], second[lag : lag + first.size]
+        else:
+            a, b = first[-lag : -lag + second.size], second[: first.size + lag]
+        overlap = min(a.size, b.size)
+        if overlap >= minimum:
+            score = float(np.dot(a[:overlap], b[:overlap])) / overlap
+            if score > best[1]:
+                best = (lag, score)
+    return best
+
+
+@pytest.mark.parametrize("reference_seconds, target_seconds", [(15.0, 40.0), (40.0, 15.0)])
+def test_the_streamed_correlation_matches_a_brute_force_search(
+    reference_seconds, target_seconds
+):
+    # Envelopes of different lengths make the longer one stream past the
+    # shorter one in several blocks, whichever of the two is the reference.
+    full = AUDIO_SYNC.loudness_envelope(speech_like_samples(60.0), SAMPLE_RATE)
+    noise = np.random.default_rng(3).normal(0.0, 0.05, full.size)
+    reference = full[700 : 700 + int(reference_seconds * ENVELOPE_RATE)]
+    target = (full + noise)[1500 : 1500 + int(target_seconds * ENVELOPE_RATE)]
+
+    lag, confidence = AUDIO_SYNC.correlate_envelopes(reference, target, ENVELOPE_RATE)
+    expected_lag, expected_confidence = brute_force_peak(reference, target)
+
+    assert lag == pytest.approx(expected_lag / ENVELOPE_RATE, abs=0.5 / ENVELOPE_RATE)
+    assert confidence == pytest.approx(expected_confidence, rel=1e-9)
+
+
+def test_the_runner_up_peaks_are_distinct_and_ranked():
+    reference = AUDIO_SYNC.loudness_envelope(speech_like_samples(60.0), SAMPLE_RATE)
+    target = np.concatenate((np.zeros(300), reference))
+
+    peaks = AUDIO_SYNC.correlation_peaks(reference, target, ENVELOPE_RATE, count=3)
+
+    assert peaks[0][0] == pytest.approx(1.5, abs=0.01)
+    scores = [score for _, score in peaks]
+    assert scores == sorted(scores, reverse=True)
+    lags = [lag for lag, _ in peaks]
+    assert min(abs(a - b) for a in lags for b in lags if a is not b) >= 1.0
+
+
+def test_a_repeated_passage_is_flagged_as_ambiguous():
+    # The talk repeats one passage, so the slides line up just as well with
+    # either of its two takes on the camera.
+    passage = AUDIO_SYNC.loudness_envelope(speech_like_samples(40.0), SAMPLE_RATE)
+    filler = AUDIO_SYNC.loudness_envelope(speech_like_samples(20.0, seed=5), SAMPLE_RATE)
+    target = np.concatenate((passage, filler, passage))
+
+    peaks = AUDIO_SYNC.correlation_peaks(passage, target, ENVELOPE_RATE)
+    result = AUDIO_SYNC.SyncResult(
+        offset_seconds=peaks[0][0],
+        confidence=peaks[0][1],
+        envelope_rate=ENVELOPE_RATE,
+        analyzed_seconds=100.0,
+        peaks=tuple(peaks),
+    )
+
+    assert sorted(round(lag) for lag, _ in peaks[:2]) == [0, 60]
+    assert result.peak_to_sidelobe < AUDIO_SYNC.DEFAULT_MINIMUM_PEAK_RATIO
+    assert result.is_ambiguous()
+
+
+def test_a_wide_single_peak_is_not_its_own_runner_up():
+    # A slowly varying envelope correlates with itself over several seconds,
+    # so the winning peak still stands high one exclusion width away.
+    rng = np.random.default_rng(7)
+    kernel = np.hanning(6 * ENVELOPE_RATE)
+    reference = np.convolve(rng.standard_normal(240 * ENVELOPE_RATE), kernel, "same")
+    target = np.concatenate((np.zeros(2 * ENVELOPE_RATE), reference))
+
+    peaks = AUDIO_SYNC.correlation_peaks(reference, target, ENVELOPE_RATE)
+    result = AUDIO_SYNC.SyncResult(
+        offset_seconds=peaks[0][0],
+        confidence=peaks[0][1],
+        envelope_rate=ENVELOPE_RATE,
+        analyzed_seconds=240.0,
+        peaks=tuple(peaks),
+    )
+
+    assert result.offset_seconds == pytest.approx(2.0, abs=0.01)
+    assert all(abs(lag - 2.0) > 1.5 for lag, _ in peaks[1:])
+    assert not result.is_ambiguous()
+
+
+def test_a_clean_match_is_not_ambiguous(tmp_path):
+    session = speech_like_samples(40.0)
+    slides = write_media(tmp_path / "slides.wav", session, codec="pcm_s16le")
+    camera = write_media(
+        tmp_path / "camera.wav",
+        np.concatenate((np.zeros(int(2.0 * SAMPLE_RATE)), session * 0.5)),
+        codec="pcm_s16le",
+    )
+
+    result = AUDIO_SYNC.estimate_offset(slides, camera)
+
+    assert len(result.peaks) == AUDIO_SYNC.DEFAULT_PEAK_COUNT
+    assert result.peaks[0] == (result.offset_seconds, result.confidence)
+    assert result.sidelobe < 0.5
+    assert not result.is_ambiguous()
+
+
+def test_a_sync_result_survives_a_round_trip_through_json():
+    result = AUDIO_SYNC.SyncResult(
+        offset_seconds=2.125,
+        confidence=0.81,
+        envelope_rate=200,
+        analyzed_seconds=240.0,
+        peaks=((2.125, 0.81), (14.0, 0.22)),
+    )
+
+    document = json.loads(json.dumps(result.to_document()))
+
+    assert AUDIO_SYNC.SyncResult.from_document(document) == result
+    with pytest.raises(AUDIO_SYNC.AudioSyncError, match="cannot be read"):
+        AUDIO_SYNC.SyncResult.from_document({"offset_seconds": 1.0})
+
+
 def test_unrelated_recordings_report_low_confidence():
     reference = AUDIO_SYNC.loudness_envelope(speech_like_samples(60.0, seed=1), SAMPLE_RATE)
     target = AUDIO_SYNC.loudness_envelope(speech_like_samples(60.0, seed=2), SAMPLE_RATE)
@@ -120,6 +363,182 @@ def test_missing_file_is_reported_clearly(tmp_path):
         AUDIO_SYNC.read_mono_audio(tmp_path / "absent.mkv")
 
 
+def test_the_streamed_envelope_matches_the_one_built_from_all_samples(tmp_path):
+    recording = write_media(
+        tmp_path / "talk.wav", speech_like_samples(12.0), codec="pcm_s16le"
+    )
+
+    whole = AUDIO_SYNC.loudness_envelope(
+        AUDIO_SYNC.read_mono_audio(recording), SAMPLE_RATE, ENVELOPE_RATE
+    )
+    # A chunk that is not a whole number of envelope steps makes every chunk
+    # boundary carry a few samples over into the next one.
+    streamed = AUDIO_SYNC.read_loudness_envelope(recording, chunk_seconds=0.3337)
+
+    assert streamed.shape == whole.shape
+    np.testing.assert_allclose(streamed, whole, rtol=1e-9)
+
+
+def test_the_streamed_envelope_stops_at_max_seconds(tmp_path):
+    recording = write_media(
+        tmp_path / "talk.wav", speech_like_samples(6.0), codec="pcm_s16le"
+    )
+
+    envelope = AUDIO_SYNC.read_loudness_envelope(
+        recording, max_seconds=2.0, chunk_seconds=0.5
+    )
+
+    assert envelope.size == 2 * ENVELOPE_RATE
+
+
+def test_one_analysis_gives_the_envelope_and_the_peaks(tmp_path):
+    samples = speech_like_samples(6.0)
+    recording = write_media(tmp_path / "talk.wav", samples, codec="pcm_s16le")
+
+    analysis = AUDIO_SYNC.analyze_recording(recording, chunk_seconds=0.3337)
+
+    np.testing.assert_allclose(
+        analysis.envelope, AUDIO_SYNC.read_loudness_envelope(recording), rtol=1e-9
+    )
+    decoded = AUDIO_SYNC.read_mono_audio(recording)
+    step = SAMPLE_RATE // ENVELOPE_RATE
+    expected = np.abs(decoded[: analysis.peaks.size * step]).reshape(-1, step).max(axis=1)
+    np.testing.assert_allclose(analysis.peaks, expected, rtol=1e-6)
+    assert analysis.seconds == pytest.approx(6.0)
+
+
+def test_the_envelope_and_the_peaks_share_one_buffer(tmp_path):
+    recording = write_media(
+        tmp_path / "talk.wav", speech_like_samples(3.0), codec="pcm_s16le"
+    )
+
+    analysis = AUDIO_SYNC.analyze_recording(recording)
+
+    assert analysis.envelope.dtype == analysis.peaks.dtype == np.float32
+    assert analysis.envelope.base is not None
+    assert analysis.envelope.base is analysis.peaks.base
+
+
+def test_the_recording_analysis_reads_to_the_end_unless_capped(tmp_path, monkeypatch):
+    recording = write_media(
+        tmp_path / "talk.wav", speech_like_samples(8.0), codec="pcm_s16le"
+    )
+    commands = []
+    popen = AUDIO_SYNC.subprocess.Popen
+    monkeypatch.setattr(
+        AUDIO_SYNC.subprocess,
+        "Popen",
+        lambda command, **kwargs: commands.append(command) or popen(command, **kwargs),
+    )
+
+    whole = AUDIO_SYNC.analyze_recording(recording)
+    capped = AUDIO_SYNC.analyze_recording(recording, max_seconds=5.0)
+
+    assert "-t" not in commands[0]
+    assert whole.seconds == pytest.approx(8.0)
+    assert capped.seconds == pytest.approx(5.0)
+
+
+def test_a_cached_analysis_is_mapped_instead_of_decoded(tmp_path, monkeypatch):
+    recording = write_media(
+        tmp_path / "talk.wav", speech_like_samples(5.0), codec="pcm_s16le"
+    )
+    cache = AUDIO_SYNC.EnvelopeCache(tmp_path / "cache")
+    first = AUDIO_SYNC.analyze_recording(recording, cache=cache)
+
+    def no_decoding(*args, **kwargs):
+        raise AssertionError("ffmpeg should not run for an analyzed recording")
+
+    monkeypatch.setattr(AUDIO_SYNC, "_step_blocks", no_decoding)
+    second = AUDIO_SYNC.analyze_recording(recording, cache=cache)
+
+    assert isinstance(second.envelope.base, np.memmap)
+    np.testing.assert_array_equal(second.envelope, first.envelope)
+    np.testing.assert_array_equal(second.peaks, first.peaks)
+
+
+def test_a_target_envelope_already_in_hand_is_not_decoded_again(tmp_path, monkeypatch):
+    session = speech_like_samples(60.0)
+    slides = write_media(tmp_path / "slides.wav", session, codec="pcm_s16le")
+    camera = write_media(
+        tmp_path / "camera.wav",
+        np.concatenate((np.zeros(int(2.0 * SAMPLE_RATE)), session)),
+        codec="pcm_s16le",
+    )
+    analysis = AUDIO_SYNC.analyze_recording(camera)
+    decoded = []
+    step_blocks = AUDIO_SYNC._step_blocks
+    monkeypatch.setattr(
+        AUDIO_SYNC,
+        "_step_blocks",
+        lambda path, *args: decoded.append(path) or step_blocks(path, *args),
+    )
+
+    result = AUDIO_SYNC.estimate_offset(slides, camera, target_envelope=analysis.envelope)
+
+    assert decoded == [slides]
+    assert result.offset_seconds == pytest.approx(2.0, abs=0.01)
+
+
+def test_the_slides_read_for_the_drift_also_serve_the_sync(tmp_path, monkeypatch):
+    session = speech_like_samples(60.0)
+    slides = write_media(tmp_path / "slides.wav", session, codec="pcm_s16le")
+    camera = write_media(
+        tmp_path / "camera.wav",
+        np.concatenate((np.zeros(int(2.0 * SAMPLE_RATE)), session)),
+        codec="pcm_s16le",
+    )
+    decoded = []
+    step_blocks = AUDIO_SYNC._step_blocks
+    monkeypatch.setattr(
+        AUDIO_SYNC,
+        "_step_blocks",
+        lambda path, *args: decoded.append(path) or step_blocks(path, *args),
+    )
+
+    analysis = AUDIO_SYNC.analyze_recording(camera)
+    slides_envelope = AUDIO_SYNC.read_cached_envelope(
+        slides, max_seconds=AUDIO_SYNC.DEFAULT_DRIFT_MAX_SECONDS
+    )
+    sync = AUDIO_SYNC.estimate_offset(
+        slides,
+        camera,
+        target_envelope=analysis.envelope,
+        reference_envelope=slides_envelope,
+    )
+    drift = AUDIO_SYNC.estimate_drift(
+        slides,
+        camera,
+        sync,
+        target_envelope=analysis.envelope,
+        reference_envelope=slides_envelope,
+    )
+
+    assert decoded == [camera, slides]
+    assert sync.offset_seconds == pytest.approx(2.0, abs=0.01)
+    assert drift.drift == pytest.approx(0.0, abs=1e-3)
+
+
+def test_envelopes_both_in_hand_are_correlated_without_checkpoints(monkeypatch):
+    reference = AUDIO_SYNC.loudness_envelope(speech_like_samples(60.0), SAMPLE_RATE)
+    target = np.concatenate((np.zeros(2 * ENVELOPE_RATE), reference * 0.5))
+
+    def no_checkpoints(*_args, **_kwargs):
+        raise AssertionError("nothing is decoded, so nothing should be re-checked")
+
+    monkeypatch.setattr(AUDIO_SYNC, "_settles", no_checkpoints)
+    monkeypatch.setattr(AUDIO_SYNC, "_step_blocks", no_checkpoints)
+
+    result = AUDIO_SYNC.estimate_offset(
+        Path("slides.wav"),
+        Path("camera.wav"),
+        target_envelope=target,
+        reference_envelope=reference,
+    )
+
+    assert result.offset_seconds == pytest.approx(2.0, abs=0.02)
+
+
 def test_estimate_offset_on_losslessly_encoded_files(tmp_path):
     shift_seconds = 3.2
     session = speech_like_samples(45.0)
@@ -154,6 +573,158 @@ def test_estimate_offset_across_the_obs_container_pair(tmp_path):
     assert result.confidence > AUDIO_SYNC.DEFAULT_MINIMUM_CONFIDENCE
 
 
+def test_both_recordings_are_decoded_at_the_same_time(tmp_path, monkeypatch):
+    # Each fake decode waits for the other one to start, which only succeeds
+    # when the two run side by side rather than one after the other.
+    both_started = threading.Barrier(2, timeout=5.0)
+
+    def fake_read(path, *args):
+        both_started.wait()
+        return np.full(10, float(len(Path(path).name)))
+
+    monkeypatch.setattr(AUDIO_SYNC, "read_loudness_envelope", fake_read)
+
+    reference, target = AUDIO_SYNC.read_envelope_pair(
+        tmp_path / "slides.mkv", tmp_path / "camera.mp4"
+    )
+
+    assert reference[0] == len("slides.mkv")
+    assert target[0] == len("camera.mp4")
+
+
+def test_a_clear_match_stops_decoding_after_the_first_window(tmp_path):
+    session = speech_like_samples(400.0)
+    slides = write_media(tmp_path / "slides.wav", session, codec="pcm_s16le")
+    camera = write_media(
+        tmp_path / "camera.wav",
+        np.concatenate((np.zeros(int(3.0 * SAMPLE_RATE)), session * 0.5)),
+        codec="pcm_s16le",
+    )
+
+    result = AUDIO_SYNC.estimate_offset(slides, camera)
+
+    assert result.offset_seconds == pytest.approx(3.0, abs=0.02)
+    assert result.analyzed_seconds == pytest.approx(
+        AUDIO_SYNC.DEFAULT_FIRST_WINDOW_SECONDS, abs=0.1
+    )
+
+
+def test_a_long_silent_pre_roll_keeps_decoding_until_the_talk(tmp_path):
+    session = speech_like_samples(400.0)
+    slides = write_media(tmp_path / "slides.wav", session, codec="pcm_s16le")
+    # The camera rolls through three minutes of setup before the slides start.
+    pre_roll = np.random.default_rng(3).normal(0.0, 0.001, int(180.0 * SAMPLE_RATE))
+    camera = write_media(
+        tmp_path / "camera.wav",
+        np.concatenate((pre_roll, session * 0.5)),
+        codec="pcm_s16le",
+    )
+
+    result = AUDIO_SYNC.estimate_offset(slides, camera)
+
+    assert result.offset_seconds == pytest.approx(180.0, abs=0.02)
+    assert result.analyzed_seconds > AUDIO_SYNC.DEFAULT_FIRST_WINDOW_SECONDS
+
+
+def test_an_early_stop_is_reused_from_the_cache(tmp_path, monkeypatch):
+    session = speech_like_samples(300.0)
+    slides = write_media(tmp_path / "slides.wav", session, codec="pcm_s16le")
+    camera = write_media(
+        tmp_path / "camera.wav",
+        np.concatenate((np.zeros(int(1.5 * SAMPLE_RATE)), session)),
+        codec="pcm_s16le",
+    )
+    cache = AUDIO_SYNC.EnvelopeCache(tmp_path / "cache")
+    first = AUDIO_SYNC.estimate_offset(slides, camera, cache=cache)
+
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("ffmpeg should not run on a cache hit")
+
+    monkeypatch.setattr(AUDIO_SYNC, "_decode_chunks", fail_decode)
+    second = AUDIO_SYNC.estimate_offset(slides, camera, cache=cache)
+
+    assert second == first
+
+
+def test_a_cached_envelope_skips_ffmpeg_on_the_next_run(tmp_path, monkeypatch):
+    recording = write_media(
+        tmp_path / "talk.wav", speech_like_samples(5.0), codec="pcm_s16le"
+    )
+    cache = AUDIO_SYNC.EnvelopeCache(tmp_path / "cache")
+    first = AUDIO_SYNC.read_cached_envelope(recording, cache=cache)
+
+    def no_decoding(*args, **kwargs):
+        raise AssertionError("ffmpeg should not run for a cached recording")
+
+    monkeypatch.setattr(AUDIO_SYNC, "read_loudness_envelope", no_decoding)
+    second = AUDIO_SYNC.read_cached_envelope(recording, cache=cache)
+
+    np.testing.assert_allclose(second, first, rtol=1e-6)
+
+
+def test_a_changed_setting_or_file_is_a_cache_miss(tmp_path):
+    recording = write_media(
+        tmp_path / "talk.wav", speech_like_samples(5.0), codec="pcm_s16le"
+    )
+    cache = AUDIO_SYNC.EnvelopeCache(tmp_path / "cache")
+    envelope = AUDIO_SYNC.read_cached_envelope(recording, cache=cache)
+
+    assert cache.load(recording, SAMPLE_RATE, ENVELOPE_RATE, 60.0) is None
+    assert cache.load(recording, SAMPLE_RATE, 100, AUDIO_SYNC.DEFAULT_MAX_SECONDS) is None
+
+    # Re-recording the file changes its size and time, which retires the entry.
+    write_media(recording, speech_like_samples(4.0, seed=3), codec="pcm_s16le")
+    assert cache.load(
+        recording, SAMPLE_RATE, ENVELOPE_RATE, AUDIO_SYNC.DEFAULT_MAX_SECONDS
+    ) is None
+    assert envelope.size > 0
+
+
+def test_the_least_recently_used_envelope_is_evicted_first(tmp_path):
+    cache = AUDIO_SYNC.EnvelopeCache(tmp_path / "cache", max_bytes=3000)
+    files = []
+    for index in range(3):
+        path = tmp_path / f"talk{index}.wav"
+        path.write_bytes(bytes([index]) * 10)
+        os.utime(path, (1_000_000, 1_000_000))
+        files.append(path)
+
+    cache.store(files[0], SAMPLE_RATE, ENVELOPE_RATE, 900.0, np.ones(250))
+    cache.store(files[1], SAMPLE_RATE, ENVELOPE_RATE, 900.0, np.ones(250))
+    entries = sorted((tmp_path / "cache").glob("*.npy"))
+    for age, entry in enumerate(entries):
+        os.utime(entry, (2_000_000 + age, 2_000_000 + age))
+    # Reading the older entry makes the other one the least recently used.
+    assert cache.load(files[0], SAMPLE_RATE, ENVELOPE_RATE, 900.0) is not None
+    cache.store(files[2], SAMPLE_RATE, ENVELOPE_RATE, 900.0, np.ones(250))
+
+    assert cache.load(files[0], SAMPLE_RATE, ENVELOPE_RATE, 900.0) is not None
+    assert cache.load(files[1], SAMPLE_RATE, ENVELOPE_RATE, 900.0) is None
+    assert cache.load(files[2], SAMPLE_RATE, ENVELOPE_RATE, 900.0) is not None
+
+
+def test_a_damaged_cache_entry_is_decoded_again(tmp_path):
+    recording = write_media(
+        tmp_path / "talk.wav", speech_like_samples(5.0), codec="pcm_s16le"
+    )
+    cache = AUDIO_SYNC.EnvelopeCache(tmp_path / "cache")
+    expected = AUDIO_SYNC.read_cached_envelope(recording, cache=cache)
+    for entry in (tmp_path / "cache").glob("*.npy"):
+        entry.write_bytes(b"not an array")
+
+    assert cache.load(
+        recording, SAMPLE_RATE, ENVELOPE_RATE, AUDIO_SYNC.DEFAULT_MAX_SECONDS
+    ) is None
+    np.testing.assert_allclose(
+        AUDIO_SYNC.read_cached_envelope(recording, cache=cache), expected, rtol=1e-6
+    )
+
+
+def test_a_failing_reference_is_reported_before_a_failing_target(tmp_path):
+    with pytest.raises(AUDIO_SYNC.AudioSyncError, match="slides.mkv"):
+        AUDIO_SYNC.estimate_offset(tmp_path / "slides.mkv", tmp_path / "camera.mp4")
+
+
 def test_a_file_without_audio_is_reported_clearly(tmp_path):
     silent_video = tmp_path / "noaudio.mp4"
     subprocess.run(
@@ -170,6 +741,8 @@ def test_a_file_without_audio_is_reported_clearly(tmp_path):
     # decode error naming the file rather than as an empty result.
     with pytest.raises(AUDIO_SYNC.AudioSyncError, match="noaudio.mp4"):
         AUDIO_SYNC.read_mono_audio(silent_video)
+    with pytest.raises(AUDIO_SYNC.AudioSyncError, match="noaudio.mp4"):
+        AUDIO_SYNC.read_loudness_envelope(silent_video)
 
 
 def test_a_missing_ffmpeg_is_reported_clearly(tmp_path):
@@ -197,6 +770,7 @@ def test_the_command_line_prints_the_offset_in_frames(tmp_path, capsys, monkeypa
         np.concatenate((head, speech_like_samples(30.0))),
         codec="pcm_s16le",
     )
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "cache"))
     monkeypatch.setattr(sys, "argv", ["audio_sync.py", str(slides), str(camera)])
 
     assert AUDIO_SYNC.main() == 0
@@ -208,8 +782,102 @@ def test_the_command_line_prints_the_offset_in_frames(tmp_path, capsys, monkeypa
 def test_the_command_line_reports_a_failure_without_a_traceback(tmp_path, capsys, monkeypatch):
     first = write_media(tmp_path / "one.wav", speech_like_samples(30.0, seed=1), codec="pcm_s16le")
     second = write_media(tmp_path / "two.wav", speech_like_samples(30.0, seed=2), codec="pcm_s16le")
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "cache"))
     monkeypatch.setattr(sys, "argv", ["audio_sync.py", str(first), str(second)])
 
     assert AUDIO_SYNC.main() == 1
 
     assert "error" in json.loads(capsys.readouterr().out)
+
+
+def lecture_folder(root: Path, name: str, shift_seconds: float, seed: int) -> Path:
+    folder = root / name
+    folder.mkdir()
+    session = speech_like_samples(30.0, seed=seed)
+    head = np.zeros(int(shift_seconds * SAMPLE_RATE))
+    write_media(folder / "PPT.mkv", session, codec="pcm_s16le")
+    write_media(folder / "camera.mp4", np.concatenate((head, session * 0.5)))
+    return folder
+
+
+@pytest.fixture
+def batch_workers(monkeypatch):
+    """Point worker processes at this module even if another test reloaded it.
+
+    Workers find the sync function by its module name, and the integration
+    tests load their own copy of audio_sync under the same name.
+    """
+    monkeypatch.setitem(sys.modules, "audio_sync", AUDIO_SYNC)
+
+
+def test_a_batch_syncs_every_lecture_folder_into_one_report(
+    tmp_path, monkeypatch, batch_workers
+):
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "cache"))
+    course = tmp_path / "course"
+    course.mkdir()
+    lecture_folder(course, "az900-1", 1.5, seed=1)
+    lecture_folder(course, "az900-2", 2.5, seed=2)
+    broken = course / "az900-3"
+    broken.mkdir()
+    (broken / "PPT.mkv").write_bytes(b"")
+    (broken / "camera.mp4").write_bytes(b"")
+    (course / "notes").mkdir()
+    report_path = tmp_path / "report.jsonl"
+
+    reports = AUDIO_SYNC.batch_sync(course, report_path, workers=2)
+
+    lines = [json.loads(line) for line in report_path.read_text(encoding="utf-8").splitlines()]
+    assert lines == list(reports)
+    assert [Path(line["folder"]).name for line in lines] == ["az900-1", "az900-2", "az900-3"]
+    assert lines[0]["offset_frames"] == 45
+    assert lines[1]["offset_seconds"] == pytest.approx(2.5, abs=0.25)
+    assert "error" in lines[2]
+    assert all(line["seconds"] >= 0 for line in lines)
+
+
+def test_an_unexpected_error_in_a_worker_becomes_one_report_line(tmp_path, monkeypatch):
+    def vanished(*_args, **_kwargs):
+        raise FileNotFoundError("camera.mp4 was moved")
+
+    monkeypatch.setattr(AUDIO_SYNC, "estimate_offset", vanished)
+
+    report = AUDIO_SYNC._sync_report(
+        tmp_path,
+        tmp_path / "PPT.mkv",
+        tmp_path / "camera.mp4",
+        30.0,
+        AUDIO_SYNC.DEFAULT_MAX_SECONDS,
+        AUDIO_SYNC.DEFAULT_MINIMUM_CONFIDENCE,
+        False,
+    )
+
+    assert report["error"] == "camera.mp4 was moved"
+    assert report["folder"] == str(tmp_path)
+
+
+def test_the_batch_command_line_fails_when_any_folder_fails(
+    tmp_path, capsys, monkeypatch, batch_workers
+):
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "cache"))
+    lecture_folder(tmp_path, "az900-1", 1.5, seed=1)
+    broken = tmp_path / "az900-2"
+    broken.mkdir()
+    (broken / "PPT.mkv").write_bytes(b"")
+    (broken / "camera.mp4").write_bytes(b"")
+    monkeypatch.setattr(sys, "argv", ["audio_sync.py", "--batch", str(tmp_path)])
+
+    assert AUDIO_SYNC.main() == 1
+
+    summary = json.loads(capsys.readouterr().out)
+    assert summary == {
+        "report": str(tmp_path / "audio_sync.jsonl"),
+        "folders": 2,
+        "failed": 1,
+        "ambiguous": 0,
+    }
+
+
+def test_a_batch_without_any_lecture_folder_is_reported(tmp_path):
+    with pytest.raises(AUDIO_SYNC.AudioSyncError, match="No folder"):
+        AUDIO_SYNC.batch_sync(tmp_path, tmp_path / "report.jsonl")
@@ -3,6 +3,7 @@ import json
 import sys
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 SCRIPT_PATH = Path(__file__).parents[1] / "有償版用スクリプト" / "dual_source.py"
@@ -129,6 +130,85 @@ def test_an_empty_cut_list_is_refused(tmp_path):
         DUAL_SOURCE.parse_cut_list(path)
 
 
+def auto_editor_timeline(clips: int) -> dict:
+    """Build a v3 timeline with the members auto-editor writes around the cuts."""
+    source = "C:\\Youtube動画作成場所\\表示テスト\\C2059.MP4"
+    return {
+        "version": "3",
+        "timebase": "60000/1001",
+        "background": "#000000",
+        "resolution": [1920, 1080],
+        "samplerate": 48000,
+        "v": [
+            [
+                {"name": "video", "src": source, "start": 90 * i, "dur": 60 - (i % 3) * 30,
+                 "offset": 120 * i, "speed": 1.0, "stream": 0}
+                for i in range(clips)
+            ],
+            [{"name": "video", "src": source, "start": 0, "dur": 5, "offset": 0}],
+        ],
+        "a": [[{"name": "audio", "src": source, "start": 0, "dur": 5, "offset": 0}]],
+    }
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "cp932"])
+def test_a_cut_list_file_is_streamed_into_the_same_segments(tmp_path, encoding):
+    document = auto_editor_timeline(50)
+    path = tmp_path / "cuts.v3"
+    # 表 ends in the byte of a backslash in CP932, which must not end the string.
+    path.write_bytes(json.dumps(document, ensure_ascii=False, indent=2).encode(encoding))
+
+    streamed = tuple(DUAL_SOURCE.iter_cut_list(path, chunk_bytes=7))
+
+    assert streamed == DUAL_SOURCE.parse_cut_list(document)
+    assert DUAL_SOURCE.parse_cut_list(path) == streamed
+
+
+def test_only_the_needed_members_of_a_cut_list_are_kept(tmp_path):
+    path = tmp_path / "cuts.v3"
+    path.write_bytes(json.dumps(auto_editor_timeline(2), ensure_ascii=False).encode("cp932"))
+
+    document = DUAL_SOURCE.read_cut_list_document(path)
+
+    assert document == {
+        "version": "3",
+        "timebase": "60000/1001",
+        "v": [[{"start": 0, "dur": 60, "offset": 0}, {"start": 90, "dur": 30, "offset": 120}]],
+    }
+
+
+def test_a_clip_with_nested_members_is_still_read(tmp_path):
+    path = tmp_path / "cuts.v3"
+    path.write_text(
+        '{"version": "3", "timebase": "30/1", "v": [[{"start": 0, "effects": [{"name": "x"}], '
+        '"dur": 650, "offset": 3104}]]}'
+    )
+
+    assert DUAL_SOURCE.parse_cut_list(path) == segments((0, 650, 3104))
+
+
+def test_segments_are_available_before_the_whole_cut_list_is_read(tmp_path):
+    path = tmp_path / "cuts.v3"
+    path.write_bytes(
+        b'{"version": "3", "timebase": "30/1", "v": [[{"start": 0, "dur": 650, "offset": 3104}, '
+        b'{"start": 650, "dur": '
+    )
+
+    segments = DUAL_SOURCE.iter_cut_list(path, chunk_bytes=16)
+
+    assert next(segments).source_end == 3754
+    with pytest.raises(DUAL_SOURCE.DualSourceError, match="not valid JSON"):
+        next(segments)
+
+
+def test_an_unknown_version_is_refused_while_streaming(tmp_path):
+    path = tmp_path / "cuts.v3"
+    path.write_text(json.dumps({"version": "2", "v": [[{"start": 0, "dur": 5, "offset": 0}]]}))
+
+    with pytest.raises(DUAL_SOURCE.DualSourceError, match="version: 2"):
+        DUAL_SOURCE.parse_cut_list(path)
+
+
 def test_both_tracks_are_cut_at_the_same_timeline_frames():
     plan = plan_of((0, 650, 3104), (650, 363, 4016), offset_seconds=3.0)
 
@@ -241,6 +321,19 @@ def test_the_audio_matches_the_camera_video_frame_for_frame():
     ]
 
 
+def test_a_drifting_camera_clock_moves_only_the_slide_entry_points():
+    # At 1000 ppm the camera is 3.6 seconds ahead after an hour of slides.
+    plan = plan_of((0, 300, 300), (300, 300, 108000), offset_seconds=2.0, slides_drift=0.001)
+
+    slides = [p for p in plan.placements if p.role == "slides"]
+    camera = [p for p in plan.placements if p.role == "camera"]
+    assert slides[0].start_frame == 240
+    # One hour into the camera is 3598 s of slide clock scaled back by 1.001.
+    assert slides[1].start_frame == DUAL_SOURCE.seconds_to_frames(3598 / 1.001, 30.0)
+    assert [p.start_frame for p in camera] == [300, 108000]
+    assert [p.end_frame - p.start_frame for p in slides] == [300, 300]
+
+
 def test_a_recording_that_does_not_divide_into_the_timeline_is_refused():
     with pytest.raises(DUAL_SOURCE.DualSourceError, match="whole frames"):
         DUAL_SOURCE.conform_factor(25.0, 60.0)
@@ -334,6 +427,215 @@ def test_a_slide_capture_shorter_than_the_first_segment_is_refused():
         plan_of((0, 100, 0), slides_frame_count=10)
 
 
+def test_segment_columns_give_the_same_plan_as_segments():
+    triples = ((0, 40, 10), (40, 650, 3104), (690, 363, 4016), (1053, 90, 9000))
+    arguments = dict(
+        rates=rates(timeline=60.0, camera=59.94),
+        slides_offset_seconds=3.0,
+        slides_frame_count=8000,
+    )
+
+    from_segments = DUAL_SOURCE.build_placements(segments(*triples), **arguments)
+    from_columns = DUAL_SOURCE.build_placements(np.array(triples), **arguments)
+
+    assert from_columns == from_segments
+    assert from_columns.placements == from_segments.placements
+
+
+def test_a_long_talk_is_planned_as_columns_without_holes():
+    # An hour cut at short margins: thousands of segments, the first few of
+    # them recorded before the slide capture started.
+    generator = np.random.default_rng(3)
+    durations = generator.integers(6, 120, 6000)
+    gaps = generator.integers(3, 30, 6000)
+    sources = np.cumsum(durations + gaps) - durations - gaps
+    records = np.concatenate(([0], np.cumsum(durations)[:-1]))
+    columns = np.column_stack((records, durations, sources))
+
+    plan = DUAL_SOURCE.build_placements(
+        columns,
+        rates(timeline=60.0),
+        slides_offset_seconds=20.0,
+        timeline_start_frame=186,
+        slides_frame_count=int(sources[-1] - 3000),
+    )
+
+    placed = plan.columns
+    assert placed.start_frames.dtype == np.int64
+    assert len(placed) == plan.segments_placed < plan.segments_total
+    assert placed.record_frames[0] == 186
+    lengths = np.diff(np.append(placed.record_frames, plan.end_frame))
+    np.testing.assert_array_equal(
+        (placed.end_frames - placed.start_frames) * 2, lengths[:, None].repeat(3, axis=1)
+    )
+    assert plan.head_trim_seconds > 0
+    assert len(plan.placements) == 3 * plan.segments_placed
+    assert all(type(p.start_frame) is int for p in plan.placements[:3])
+
+
+def peaks_of(*stretches: tuple[float, float]) -> np.ndarray:
+    """Build 200 Hz step peaks from (seconds, amplitude) stretches."""
+    return np.concatenate(
+        [np.full(round(seconds * 200), amplitude, dtype=np.float32) for seconds, amplitude in stretches]
+    )
+
+
+def test_silence_is_cut_and_the_margin_is_kept_around_the_talk():
+    peaks = peaks_of((2.0, 0.001), (3.0, 0.5), (4.0, 0.001), (1.0, 0.4), (2.0, 0.001))
+
+    found = DUAL_SOURCE.find_talking_segments(peaks, 200, 4.0, 0.2)
+
+    # Frames of 50 fps: the talk starts at 100 and 450, each widened by 10.
+    assert found == segments((0, 170, 90), (170, 70, 440))
+
+
+def test_margins_that_meet_become_one_segment():
+    peaks = peaks_of((1.0, 0.0), (1.0, 0.5), (0.3, 0.0), (1.0, 0.5), (1.0, 0.0))
+
+    found = DUAL_SOURCE.find_talking_segments(peaks, 200, 4.0, 0.2)
+
+    assert found == segments((0, 135, 40))
+
+
+def test_a_breath_is_not_cut_and_a_click_is_not_kept():
+    peaks = peaks_of(
+        (1.0, 0.0), (1.0, 0.5), (0.06, 0.0), (1.0, 0.5), (2.0, 0.0), (0.02, 0.9), (2.0, 0.0)
+    )
+
+    found = DUAL_SOURCE.find_talking_segments(peaks, 200, 4.0, 0.0)
+
+    assert found == segments((0, 103, 50))
+
+
+def test_the_threshold_is_relative_to_the_loudest_moment():
+    quiet = peaks_of((1.0, 0.0), (1.0, 0.02), (1.0, 0.0))
+
+    assert DUAL_SOURCE.find_talking_segments(quiet, 200, 4.0, 0.0) == segments((0, 50, 50))
+    assert DUAL_SOURCE.find_talking_segments(quiet * 10, 200, 4.0, 0.0) == segments(
+        (0, 50, 50)
+    )
+
+
+def test_a_recording_without_sound_cannot_be_cut():
+    with pytest.raises(DUAL_SOURCE.DualSourceError, match="no sound"):
+        DUAL_SOURCE.find_talking_segments(np.zeros(400, dtype=np.float32), 200, 4.0, 0.1)
+
+
+def test_a_silence_timebase_must_divide_the_envelope_rate():
+    with pytest.raises(DUAL_SOURCE.DualSourceError, match="cannot be built"):
+        DUAL_SOURCE.find_talking_segments(peaks_of((1.0, 0.5)), 200, 4.0, 0.1, timebase=30)
+
+
+def test_segments_split_by_a_short_silence_become_one_clip_per_track():
+    # 30 fps cut list on a 60 fps timeline: gaps of 3, 20 and 4 cut-list frames.
+    plan = plan_of(
+        (0, 90, 0), (90, 60, 93), (150, 30, 173), (180, 45, 207),
+        rates=rates(timeline=60.0),
+        merge_gap_frames=10,
+    )
+
+    assert plan.segments_placed == 4
+    assert plan.segments_merged == 2
+    assert plan.clips_saved == 6
+    assert plan.columns.record_frames.tolist() == [0, 306]
+    # The kept silences are placed too: 0-153 and 173-252 of the camera.
+    assert plan.columns.start_frames[:, 1].tolist() == [0, 173]
+    assert (plan.columns.end_frames[:, 1] - plan.columns.start_frames[:, 1]).tolist() == [
+        153, 79,
+    ]
+    assert plan.end_frame == 306 + 158
+    assert "2 merged across short gaps, 6 clips saved" in plan.describe()
+
+
+def test_merging_is_off_unless_a_gap_is_given():
+    plan = plan_of((0, 90, 0), (90, 60, 91))
+
+    assert plan.segments_merged == 0
+    assert len(plan.columns) == 2
+
+
+def test_merged_lengths_still_round_to_the_common_step():
+    plan = plan_of(
+        (0, 100, 0), (100, 100, 101),
+        rates=rates(timeline=60.0, camera=59.94),
+        merge_gap_frames=5,
+    )
+
+    lengths = np.diff(np.append(plan.columns.record_frames, plan.end_frame))
+    assert lengths.tolist() == [402]
+    assert all(length % 2 == 0 for length in lengths)
+
+
+def test_a_merge_never_reaches_past_the_end_of_the_slide_capture():
+    # The third segment overruns the slides and is dropped before merging, so
+    # the first two merge and nothing beyond the capture is placed.
+    plan = plan_of(
+        (0, 30, 0), (30, 30, 32), (60, 300, 64),
+        merge_gap_frames=5,
+        slides_frame_count=100,
+    )
+
+    assert plan.segments_placed == 2
+    assert plan.segments_merged == 1
+    assert int(plan.columns.end_frames[0, 0]) <= 100
+
+
+def saved_plan(*triples, **kwargs) -> object:
+    plan_rates = rates(timeline=60.0)
+    return DUAL_SOURCE.SavedPlan(
+        plan=plan_of(*triples, offset_seconds=0.5, rates=plan_rates, timeline_start_frame=120),
+        rates=plan_rates,
+        timeline_start_frame=120,
+        slides_offset_seconds=0.5,
+        slides_drift=2e-5,
+        recordings={"slides": ["PPT.mkv", 10, 1], "camera": ["camera.mp4", 20, 2]},
+        **kwargs,
+    )
+
+
+def test_a_saved_plan_reads_back_unchanged(tmp_path):
+    saved = saved_plan((0, 90, 30), (90, 45, 300), sync={"offset_seconds": 0.5, "peaks": []})
+    path = tmp_path / "plan.npz"
+
+    DUAL_SOURCE.save_plan(saved, path)
+
+    assert DUAL_SOURCE.load_plan(path) == saved
+    assert not list(tmp_path.glob("*.partial"))
+
+
+def test_a_saved_plan_is_moved_to_where_the_opening_ends():
+    saved = saved_plan((0, 90, 30), (90, 45, 300))
+
+    moved = saved.placed_at(300)
+
+    assert moved.columns.record_frames.tolist() == [
+        frame + 180 for frame in saved.plan.columns.record_frames.tolist()
+    ]
+    assert moved.end_frame == saved.plan.end_frame + 180
+    np.testing.assert_array_equal(moved.columns.start_frames, saved.plan.columns.start_frames)
+    assert saved.placed_at(120) is saved.plan
+
+
+def test_a_plan_from_another_format_version_is_refused(tmp_path, monkeypatch):
+    path = tmp_path / "plan.npz"
+    monkeypatch.setattr(DUAL_SOURCE, "PLAN_FORMAT_VERSION", 1)
+    DUAL_SOURCE.save_plan(saved_plan((0, 90, 30)), path)
+    monkeypatch.undo()
+
+    with pytest.raises(DUAL_SOURCE.DualSourceError, match="Plan the folder again"):
+        DUAL_SOURCE.load_plan(path)
+
+
+def test_a_missing_or_damaged_plan_is_reported(tmp_path):
+    with pytest.raises(DUAL_SOURCE.DualSourceError, match="No saved plan"):
+        DUAL_SOURCE.load_plan(tmp_path / "absent.npz")
+
+    damaged = tmp_path / "damaged.npz"
+    damaged.write_bytes(b"PK not really a zip")
+    with pytest.raises(DUAL_SOURCE.DualSourceError, match="cannot be read"):
+        DUAL_SOURCE.load_plan(damaged)
+
+
 def test_clip_info_carries_the_media_pool_item():
     placement = plan_of((0, 650, 3104)).placements[0]
 
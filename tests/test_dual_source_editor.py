@@ -5,10 +5,12 @@ touches is replaced by a small stand-in that records what was asked of it.
 """
 
 import importlib.util
+import io
 import json
 import sys
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from auto_editor_config import AutoEditorConfig
@@ -155,27 +157,52 @@ def pair(tmp_path):
     return EDITOR.dual_source.RecordingPair(folder=folder, slides=slides, camera=camera)
 
 
+STUB_CUT_LIST = {
+    "version": "3",
+    "timebase": "30/1",
+    "v": [[
+        {"start": 0, "dur": 300, "offset": 90},
+        {"start": 300, "dur": 200, "offset": 500},
+    ]],
+}
+
+
 @pytest.fixture
 def stub_pipeline(monkeypatch):
-    """Replace the two external tools with predictable answers."""
+    """Replace the camera analysis, the sync and the silence cut with fixed answers."""
+
+    def fake_analysis(path, **kwargs):
+        return EDITOR.audio_sync.RecordingAnalysis(
+            envelope=np.zeros(1000, dtype=np.float32),
+            peaks=np.zeros(1000, dtype=np.float32),
+            envelope_rate=200,
+        )
+
+    def fake_envelope(path, **kwargs):
+        return np.zeros(1000, dtype=np.float32)
 
     def fake_offset(reference, target, **kwargs):
         return EDITOR.audio_sync.SyncResult(
             offset_seconds=2.0, confidence=12.0, envelope_rate=200, analyzed_seconds=60.0
         )
 
-    def fake_cut_list(camera_path, output_path):
-        return {
-            "version": "3",
-            "timebase": "30/1",
-            "v": [[
-                {"start": 0, "dur": 300, "offset": 90},
-                {"start": 300, "dur": 200, "offset": 500},
-            ]],
-        }
+    def fake_drift(reference, target, sync, **kwargs):
+        return EDITOR.audio_sync.DriftResult(
+            offset_seconds=sync.offset_seconds, drift=0.0, confidence=12.0, windows=()
+        )
+
+    def fake_cut_list(camera_path, output_path, cache=None):
+        return STUB_CUT_LIST
+
+    def fake_cut(camera, auto_editor):
+        return EDITOR.dual_source.parse_cut_list(STUB_CUT_LIST), 30.0
 
+    monkeypatch.setattr(EDITOR.audio_sync, "analyze_recording", fake_analysis)
+    monkeypatch.setattr(EDITOR.audio_sync, "read_cached_envelope", fake_envelope)
     monkeypatch.setattr(EDITOR.audio_sync, "estimate_offset", fake_offset)
+    monkeypatch.setattr(EDITOR.audio_sync, "estimate_drift", fake_drift)
     monkeypatch.setattr(EDITOR, "run_auto_editor_cut_list", fake_cut_list)
+    monkeypatch.setattr(EDITOR, "cut_silence", fake_cut)
     monkeypatch.setattr(EDITOR, "first_existing_path", lambda candidates: None)
 
 
@@ -241,6 +268,73 @@ def test_a_faster_timeline_still_places_the_recordings(pair, stub_pipeline):
     assert [c["recordFrame"] for c in camera] == [0, 600]
 
 
+def test_a_measured_clock_drift_moves_the_late_slide_entries(pair, stub_pipeline, monkeypatch):
+    def drifting(reference, target, sync, **kwargs):
+        return EDITOR.audio_sync.DriftResult(
+            offset_seconds=2.0, drift=0.01, confidence=0.9, windows=()
+        )
+
+    monkeypatch.setattr(EDITOR.audio_sync, "estimate_drift", drifting)
+    media_pool = FakeMediaPool({"PPT.mkv": 100000, "camera.mp4": 100000})
+
+    assert EDITOR.build_dual_source_timeline(FakeProject(), media_pool, FakeTimeline([]), pair, 0)
+
+    slides = [c for c in media_pool.appended[0] if c["trackIndex"] == 1 and c["mediaType"] == 1]
+    camera = [c for c in media_pool.appended[0] if c["trackIndex"] == 2]
+    # Frame 500 of the camera is 16.67 s in; minus the 2 s offset that is 14.67 s
+    # of camera clock, which a 1% faster camera reaches after 14.52 s of slides.
+    assert camera[1]["startFrame"] == 500
+    assert slides[1]["startFrame"] == 436
+
+
+def test_a_drift_that_cannot_be_measured_keeps_the_constant_offset(
+    pair, stub_pipeline, monkeypatch, capsys
+):
+    def unmeasurable(reference, target, sync, **kwargs):
+        raise EDITOR.audio_sync.AudioSyncError("too short")
+
+    monkeypatch.setattr(EDITOR.audio_sync, "estimate_drift", unmeasurable)
+    media_pool = FakeMediaPool({"PPT.mkv": 100000, "camera.mp4": 100000})
+
+    assert EDITOR.build_dual_source_timeline(FakeProject(), media_pool, FakeTimeline([]), pair, 0)
+
+    slides = [c for c in media_pool.appended[0] if c["trackIndex"] == 1 and c["mediaType"] == 1]
+    assert slides[1]["startFrame"] == 440
+    assert "時計のずれは測れませんでした" in capsys.readouterr().out
+
+
+def test_an_ambiguous_sync_is_placed_but_flagged(pair, stub_pipeline, monkeypatch, capsys):
+    def close_call(reference, target, **kwargs):
+        return EDITOR.audio_sync.SyncResult(
+            offset_seconds=2.0,
+            confidence=0.8,
+            envelope_rate=200,
+            analyzed_seconds=60.0,
+            peaks=((2.0, 0.8), (62.0, 0.7)),
+        )
+
+    monkeypatch.setattr(EDITOR.audio_sync, "estimate_offset", close_call)
+    media_pool = FakeMediaPool({"PPT.mkv": 100000, "camera.mp4": 100000})
+
+    assert EDITOR.build_dual_source_timeline(FakeProject(), media_pool, FakeTimeline([]), pair, 0)
+
+    assert "次点の候補 62.000 秒" in capsys.readouterr().out
+
+
+def test_a_merge_gap_places_fewer_longer_clips(pair, stub_pipeline, capsys):
+    media_pool = FakeMediaPool({"PPT.mkv": 100000, "camera.mp4": 100000})
+
+    assert EDITOR.build_dual_source_timeline(
+        FakeProject(), media_pool, FakeTimeline([]), pair, 0, merge_gap_frames=120
+    )
+
+    clip_infos = media_pool.appended[0]
+    assert len(clip_infos) == 3
+    camera = next(c for c in clip_infos if c["trackIndex"] == 2)
+    assert (camera["startFrame"], camera["endFrame"]) == (90, 700)
+    assert "3 clips saved" in capsys.readouterr().out
+
+
 def test_the_camera_timecode_is_zeroed_before_anything_is_placed(pair, stub_pipeline):
     """Resolve reads startFrame against the clip's timecode, not its first frame.
 
@@ -308,6 +402,135 @@ def test_the_measured_placement_is_applied_to_every_clip(pair, stub_pipeline):
     assert pans == [-300.0, -300.0, 626.0, 626.0]
 
 
+class PickyMediaPool(FakeMediaPool):
+    """Rejects a whole call when it holds a bad clip, and fails some calls once."""
+
+    def __init__(self, bad_frames=(), flaky_calls=()):
+        super().__init__({})
+        self.bad_frames = set(bad_frames)
+        self.flaky_calls = set(flaky_calls)
+        self.calls = 0
+
+    def AppendToTimeline(self, clip_infos):
+        self.calls += 1
+        if self.calls in self.flaky_calls:
+            raise RuntimeError("Resolve is busy")
+        if any(info["recordFrame"] in self.bad_frames for info in clip_infos):
+            return []
+        return super().AppendToTimeline(clip_infos)
+
+
+def clip_infos_at(*record_frames):
+    return [
+        {"recordFrame": frame, "trackIndex": 1, "startFrame": 0, "endFrame": 10}
+        for frame in record_frames
+    ]
+
+
+def test_clips_are_appended_in_bounded_chunks_in_record_frame_order():
+    media_pool = PickyMediaPool()
+    clip_infos = clip_infos_at(*range(70, 0, -10))
+    reporter = EDITOR.ProgressReporter(stream=io.StringIO())
+
+    appended = EDITOR.append_clips_with_retry(
+        media_pool, clip_infos, delay=0, chunk_size=3, reporter=reporter
+    )
+
+    assert [[info["recordFrame"] for info in chunk] for chunk in media_pool.appended] == [
+        [10, 20, 30], [40, 50, 60], [70],
+    ]
+    assert len(appended) == len(clip_infos) and all(appended)
+    assert reporter.results[-1].note == "7/7 clips"
+
+
+def test_only_the_failing_chunk_is_retried(monkeypatch):
+    monkeypatch.setattr(EDITOR.time, "sleep", lambda seconds: None)
+    media_pool = PickyMediaPool(flaky_calls={2})
+
+    appended = EDITOR.append_clips_with_retry(
+        media_pool, clip_infos_at(*range(6)), chunk_size=3,
+        reporter=EDITOR.ProgressReporter(enabled=False),
+    )
+
+    assert media_pool.calls == 3
+    assert all(appended)
+
+
+def test_a_clip_resolve_refuses_is_isolated_and_the_rest_is_placed(monkeypatch, capsys):
+    monkeypatch.setattr(EDITOR.time, "sleep", lambda seconds: None)
+    media_pool = PickyMediaPool(bad_frames={5})
+    clip_infos = clip_infos_at(*range(8))
+
+    appended = EDITOR.append_clips_with_retry(
+        media_pool, clip_infos, chunk_size=4, reporter=EDITOR.ProgressReporter(enabled=False)
+    )
+
+    assert [item is not None for item in appended] == [True] * 5 + [False] + [True] * 2
+    placed = [info["recordFrame"] for chunk in media_pool.appended for info in chunk]
+    assert sorted(placed) == [0, 1, 2, 3, 4, 6, 7]
+    assert "記録フレーム 5" in capsys.readouterr().out
+
+
+def test_nothing_placed_at_all_is_a_failure(monkeypatch):
+    monkeypatch.setattr(EDITOR.time, "sleep", lambda seconds: None)
+    media_pool = PickyMediaPool(bad_frames={0, 1})
+
+    assert (
+        EDITOR.append_clips_with_retry(
+            media_pool, clip_infos_at(0, 1), reporter=EDITOR.ProgressReporter(enabled=False)
+        )
+        is None
+    )
+
+
+class BrokenItem(FakeItem):
+    def SetProperty(self, properties) -> bool:
+        raise RuntimeError("item is locked")
+
+
+def test_one_clip_that_refuses_its_transform_does_not_stop_the_rest(capsys):
+    items = [FakeItem("a"), BrokenItem("b"), FakeItem("c"), BrokenItem("d")]
+
+    applied = EDITOR.apply_clip_properties(
+        items, {"Pan": 626.0}, "カメラ", reporter=EDITOR.ProgressReporter(enabled=False)
+    )
+
+    assert applied == 2
+    assert items[2].properties == {"Pan": 626.0}
+    output = capsys.readouterr().out
+    assert "カメラの変形設定でエラー（2件）: item is locked" in output
+    assert "2/4クリップに適用" in output
+
+
+def test_the_silence_is_cut_from_the_camera_audio_that_was_synced():
+    peaks = np.zeros(2000, dtype=np.float32)
+    peaks[400:1200] = 0.5
+    camera = EDITOR.audio_sync.RecordingAnalysis(
+        envelope=np.zeros(2000, dtype=np.float32), peaks=peaks, envelope_rate=200
+    )
+
+    segments, cut_frame_rate = EDITOR.cut_silence(
+        camera, AutoEditorConfig(threshold_percent=4.0, margin_seconds=0.2)
+    )
+
+    assert cut_frame_rate == 50.0
+    assert segments == (
+        EDITOR.dual_source.Segment(record_frame=0, duration=220, source_frame=90),
+    )
+
+
+def test_the_auto_editor_route_is_still_available(pair, stub_pipeline, monkeypatch):
+    monkeypatch.setattr(EDITOR, "cut_silence", lambda *args: pytest.fail("built-in cut used"))
+    media_pool = FakeMediaPool({"PPT.mkv": 100000, "camera.mp4": 100000})
+
+    assert EDITOR.build_dual_source_timeline(
+        FakeProject(), media_pool, FakeTimeline([]), pair, 0, use_auto_editor=True
+    )
+
+    camera = [c for c in media_pool.appended[0] if c["trackIndex"] == 2]
+    assert [c["startFrame"] for c in camera] == [90, 500]
+
+
 def test_the_cut_list_is_written_next_to_the_recording(pair, tmp_path, monkeypatch):
     recorded = {}
 
@@ -346,6 +569,218 @@ def test_the_cut_list_is_written_next_to_the_recording(pair, tmp_path, monkeypat
     )
 
 
+def counting_auto_editor(monkeypatch):
+    """Stand in for auto-editor and count how often it really runs."""
+    runs = []
+
+    def fake_run(command, **run_options):
+        runs.append(command)
+        Path(command[command.index("--output") + 1]).write_text(
+            json.dumps(
+                {"version": "3", "timebase": "30/1", "v": [[{"start": 0, "dur": 9, "offset": 4}]]}
+            ),
+            encoding="utf-8",
+        )
+
+        class Result:
+            stdout = ""
+            stderr = ""
+
+        return Result()
+
+    monkeypatch.setattr(EDITOR.subprocess, "run", fake_run)
+    return runs
+
+
+def test_a_cached_cut_list_is_reused_without_running_auto_editor(
+    pair, tmp_path, monkeypatch, capsys
+):
+    runs = counting_auto_editor(monkeypatch)
+    cache = EDITOR.CutListCache(tmp_path / "cut_lists")
+    output = pair.folder / "_auto_editor_cuts.json"
+
+    first = EDITOR.run_auto_editor_cut_list(pair.camera, output, cache=cache)
+    second = EDITOR.run_auto_editor_cut_list(pair.camera, output, cache=cache)
+
+    assert len(runs) == 1
+    assert second == first
+    assert "auto-editorは実行しません" in capsys.readouterr().out
+
+
+def test_a_changed_threshold_or_recording_runs_auto_editor_again(pair, tmp_path, monkeypatch):
+    runs = counting_auto_editor(monkeypatch)
+    cache = EDITOR.CutListCache(tmp_path / "cut_lists")
+    output = pair.folder / "_auto_editor_cuts.json"
+    settings = {"value": AutoEditorConfig(threshold_percent=3.0, margin_seconds=0.3)}
+    monkeypatch.setattr(EDITOR, "load_auto_editor_config", lambda: settings["value"])
+
+    EDITOR.run_auto_editor_cut_list(pair.camera, output, cache=cache)
+    settings["value"] = AutoEditorConfig(threshold_percent=4.0, margin_seconds=0.3)
+    EDITOR.run_auto_editor_cut_list(pair.camera, output, cache=cache)
+    settings["value"] = AutoEditorConfig(threshold_percent=4.0, margin_seconds=0.2)
+    EDITOR.run_auto_editor_cut_list(pair.camera, output, cache=cache)
+    pair.camera.write_bytes(b"re-recorded")
+    EDITOR.run_auto_editor_cut_list(pair.camera, output, cache=cache)
+    EDITOR.run_auto_editor_cut_list(pair.camera, output, cache=cache)
+
+    assert len(runs) == 4
+
+
+def test_a_damaged_cached_cut_list_is_analyzed_again(pair, tmp_path, monkeypatch):
+    runs = counting_auto_editor(monkeypatch)
+    cache = EDITOR.CutListCache(tmp_path / "cut_lists")
+    output = pair.folder / "_auto_editor_cuts.json"
+    EDITOR.run_auto_editor_cut_list(pair.camera, output, cache=cache)
+    for entry in (tmp_path / "cut_lists").glob("*.json"):
+        entry.write_text("{not json", encoding="utf-8")
+
+    document = EDITOR.run_auto_editor_cut_list(pair.camera, output, cache=cache)
+
+    assert len(runs) == 2
+    assert document["v"][0][0]["offset"] == 4
+
+
+@pytest.fixture
+def plan_workers(monkeypatch):
+    """Point worker processes at this module even if another test reloaded it."""
+    monkeypatch.setitem(sys.modules, "dual_source_video_editor", EDITOR)
+
+
+def lecture_pair(course: Path, name: str) -> None:
+    folder = course / name
+    folder.mkdir()
+    (folder / "PPT.mkv").write_bytes(b"")
+    (folder / "camera.mp4").write_bytes(b"")
+
+
+def test_a_saved_plan_is_placed_again_without_any_analysis(pair, stub_pipeline, monkeypatch):
+    media_pool = FakeMediaPool({"PPT.mkv": 100000, "camera.mp4": 100000})
+    assert EDITOR.build_dual_source_timeline(
+        FakeProject(), media_pool, FakeTimeline([]), pair, 0
+    )
+
+    def no_analysis(*args, **kwargs):
+        raise AssertionError("a saved plan should not be analyzed again")
+
+    monkeypatch.setattr(EDITOR, "analyze_pair", no_analysis)
+    replayed = FakeMediaPool({"PPT.mkv": 100000, "camera.mp4": 100000})
+
+    assert EDITOR.replay_dual_source_plan(
+        FakeProject(), replayed, FakeTimeline([]), pair, 300
+    )
+
+    first, second = media_pool.appended[0], replayed.appended[0]
+    assert [c["startFrame"] for c in second] == [c["startFrame"] for c in first]
+    assert [c["recordFrame"] for c in second] == [c["recordFrame"] + 300 for c in first]
+
+
+def test_a_plan_for_recordings_that_changed_is_not_placed(
+    pair, stub_pipeline, monkeypatch, capsys
+):
+    media_pool = FakeMediaPool({"PPT.mkv": 100000, "camera.mp4": 100000})
+    EDITOR.build_dual_source_timeline(FakeProject(), media_pool, FakeTimeline([]), pair, 0)
+    pair.camera.write_bytes(b"re-recorded")
+
+    assert not EDITOR.replay_dual_source_plan(
+        FakeProject(), FakeMediaPool({}), FakeTimeline([]), pair, 0
+    )
+    assert "録画が変わっています" in capsys.readouterr().out
+
+
+def test_a_plan_for_another_timeline_rate_is_not_placed(pair, stub_pipeline, capsys):
+    media_pool = FakeMediaPool({"PPT.mkv": 100000, "camera.mp4": 100000})
+    EDITOR.build_dual_source_timeline(FakeProject(), media_pool, FakeTimeline([]), pair, 0)
+    faster = FakeTimeline([])
+    faster.frame_rate = 60.0
+
+    assert not EDITOR.replay_dual_source_plan(
+        FakeProject(), FakeMediaPool({}), faster, pair, 0
+    )
+    assert "計画時の 30.0 と違います" in capsys.readouterr().out
+
+
+def test_a_folder_that_was_never_planned_cannot_be_replayed(pair, capsys):
+    assert not EDITOR.replay_dual_source_plan(
+        FakeProject(), FakeMediaPool({}), FakeTimeline([]), pair, 0
+    )
+    assert "配置計画を読めません" in capsys.readouterr().out
+
+
+def test_a_course_is_planned_folder_by_folder_without_resolve(
+    tmp_path, stub_pipeline, plan_workers, monkeypatch, capsys
+):
+    course = tmp_path / "course"
+    course.mkdir()
+    for name in ("az900-1", "az900-2", "az900-3"):
+        lecture_pair(course, name)
+    (course / "notes").mkdir()
+
+    def fake_probe(path):
+        if path.parent.name == "az900-3":
+            print("✗ 録画の情報を読めません")
+            return None
+        return (30.0, 100000) if path.suffix == ".mkv" else (30.0, None)
+
+    monkeypatch.setattr(EDITOR, "probe_recording", fake_probe)
+
+    reports = EDITOR.plan_course(course, timeline_frame_rate=30.0, workers=2)
+
+    assert [Path(r["folder"]).name for r in reports] == ["az900-1", "az900-2", "az900-3"]
+    assert [r["planned"] for r in reports] == [True, True, False]
+    saved = EDITOR.dual_source.load_plan(course / "az900-1" / EDITOR.PLAN_NAME)
+    assert saved.timeline_start_frame == 0
+    assert saved.sync["offset_seconds"] == 2.0
+    plan = saved.plan
+    assert plan.columns.record_frames.tolist() == [0, 300]
+    assert plan.columns.start_frames[:, 0].tolist() == [30, 440]
+    assert not (course / "az900-3" / EDITOR.PLAN_NAME).exists()
+    output = capsys.readouterr().out
+    # Each folder's log is printed whole, in folder order, not interleaved.
+    assert output.index("az900-1") < output.index("az900-2") < output.index("録画の情報")
+    assert "計画済み 2 / 3 フォルダ" in output
+
+
+def test_the_plan_all_entry_point_fails_when_a_folder_fails(
+    tmp_path, stub_pipeline, plan_workers, monkeypatch
+):
+    lecture_pair(tmp_path, "az900-1")
+    monkeypatch.setattr(EDITOR, "probe_recording", lambda path: None)
+
+    assert EDITOR.main(["--plan-all", "--recording-dir", str(tmp_path), "--workers", "1"]) == 1
+
+
+def test_a_slide_capture_without_a_frame_count_is_measured_from_its_length(
+    tmp_path, monkeypatch
+):
+    def fake_run(command, **run_options):
+        class Result:
+            stdout = json.dumps(
+                {
+                    "streams": [{"avg_frame_rate": "30000/1001"}],
+                    "format": {"duration": "10.01"},
+                }
+            ).encode()
+
+        return Result()
+
+    monkeypatch.setattr(EDITOR.subprocess, "run", fake_run)
+
+    frame_rate, frames = EDITOR.probe_recording(tmp_path / "PPT.mkv")
+
+    assert frame_rate == pytest.approx(29.97, abs=0.001)
+    assert frames == 300
+
+
+def test_a_recording_ffprobe_cannot_read_is_reported(tmp_path, monkeypatch, capsys):
+    def fake_run(command, **run_options):
+        raise EDITOR.subprocess.CalledProcessError(1, command)
+
+    monkeypatch.setattr(EDITOR.subprocess, "run", fake_run)
+
+    assert EDITOR.probe_recording(tmp_path / "PPT.mkv") is None
+    assert "録画の情報を読めません" in capsys.readouterr().out
+
+
 def test_the_entry_point_refuses_a_folder_that_is_not_a_pair(tmp_path, capsys):
     folder = tmp_path / "single"
     folder.mkdir()
@@ -2,6 +2,8 @@ import importlib.util
 import json
 import os
 import subprocess
+import sys
+import time
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -200,6 +202,105 @@ def test_ffmpeg_command_prepends_copies_then_the_complete_main_body(
     assert command[-1] == str(output)
 
 
+def test_pipelined_commands_split_the_reel_from_the_body(tmp_path: Path) -> None:
+    plan = HIGHLIGHT_VIDEO.HighlightPlan(
+        "結論", (HIGHLIGHT_VIDEO.Highlight(10.0, 16.0, "first"),)
+    )
+    cut = HIGHLIGHT_VIDEO.cut_slices([(0.0, 8.0), (20.0, 30.0)])
+
+    reel = HIGHLIGHT_VIDEO.build_ffmpeg_command(
+        tmp_path / "cut.mp4", tmp_path / "title.ass", tmp_path / "reel.mp4", plan, body=False
+    )
+    body = HIGHLIGHT_VIDEO.build_body_command(tmp_path / "cut.mp4", tmp_path / "body.mp4")
+    cut_body = HIGHLIGHT_VIDEO.build_body_command(
+        tmp_path / "recording.mkv", tmp_path / "body.mp4", cut=cut
+    )
+    reel_graph = reel[reel.index("-filter_complex") + 1]
+    body_graph = body[body.index("-filter_complex") + 1]
+    cut_graph = cut_body[cut_body.index("-filter_complex") + 1]
+
+    assert "vmain" not in reel_graph
+    assert "concat=n=1:v=1:a=1" in reel_graph
+    assert "ass=title.ass" in reel_graph
+    assert body_graph == "[0:v]setpts=PTS-STARTPTS[outv];[0:a]asetpts=PTS-STARTPTS[outa]"
+    assert "ass=" not in cut_graph
+    assert "[0:v]trim=start=20.000:end=30.000" in cut_graph
+    assert "concat=n=2:v=1:a=1[outv][outa]" in cut_graph
+    for command in (reel, body):
+        assert command[command.index("-crf") + 1] == "16"
+        assert command[command.index("-preset") + 1] == "medium"
+        assert command[command.index("-movflags") + 1] == "+faststart"
+
+
+def test_stitch_copies_every_stream_listed_in_the_playlist(tmp_path: Path) -> None:
+    playlist = HIGHLIGHT_VIDEO.write_concat_list(
+        (tmp_path / "reel.mp4", tmp_path / "it's the body.mp4"), tmp_path / "parts.txt"
+    )
+
+    command = HIGHLIGHT_VIDEO.build_stitch_command(playlist, tmp_path / "final.mp4")
+    mixed = HIGHLIGHT_VIDEO.build_stitch_command(
+        playlist, tmp_path / "final.mp4", sfx=tmp_path / "sfx.wav"
+    )
+
+    lines = playlist.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == f"file '{tmp_path / 'reel.mp4'}'"
+    assert lines[1] == "file '" + str(tmp_path) + "/it'\\''s the body.mp4'"
+    assert command[command.index("-f") + 1] == "concat"
+    assert command[command.index("-c") + 1] == "copy"
+    assert mixed[mixed.index("-c:v") + 1] == "copy"
+    assert "amix=inputs=2:normalize=0" in mixed[mixed.index("-filter_complex") + 1]
+
+
+def test_background_render_reports_its_output_or_its_log(tmp_path: Path) -> None:
+    output = tmp_path / "body.mp4"
+    writer = HIGHLIGHT_VIDEO.BackgroundRender(
+        [sys.executable, "-c", f"open({str(output)!r}, 'wb').write(b'body')"],
+        output,
+        cwd=tmp_path,
+    )
+    assert writer.wait() == output
+
+    failing = HIGHLIGHT_VIDEO.BackgroundRender(
+        [sys.executable, "-c", "import sys; sys.exit('encoder exploded')"],
+        tmp_path / "broken.mp4",
+        cwd=tmp_path,
+    )
+    with pytest.raises(subprocess.CalledProcessError) as error:
+        failing.wait()
+    assert "encoder exploded" in error.value.output
+
+
+def test_closing_a_background_render_stops_only_an_unfinished_encode(
+    tmp_path: Path,
+) -> None:
+    output = tmp_path / "body.mp4"
+    finished = HIGHLIGHT_VIDEO.BackgroundRender(
+        [sys.executable, "-c", f"open({str(output)!r}, 'wb').write(b'body')"],
+        output,
+        cwd=tmp_path,
+    )
+    finished.wait()
+    finished.close()
+    assert output.read_bytes() == b"body"
+
+    partial = tmp_path / "slow.mp4"
+    slow = HIGHLIGHT_VIDEO.BackgroundRender(
+        [
+            sys.executable,
+            "-c",
+            f"import time; open({str(partial)!r}, 'wb').write(b'part'); time.sleep(60)",
+        ],
+        partial,
+        cwd=tmp_path,
+    )
+    for _ in range(200):
+        if partial.exists():
+            break
+        time.sleep(0.05)
+    slow.close()
+    assert slow._process.poll() is not None
+    assert not partial.exists()
+
 def test_opening_ass_displays_large_takeaway_during_first_highlight(
     tmp_path: Path,
 ) -> None:
@@ -249,7 +350,7 @@ def test_pipeline_writes_review_plan_and_returns_rendered_output(
         lambda _path: HIGHLIGHT_VIDEO.VideoInfo(3600.0, 1920, 1080),
     )
 
-    def fake_render(_source, _ass, output, _plan, _reporter=None):
+    def fake_render(_source, _ass, output, _plan, _reporter=None, **_kwargs):
         output.write_bytes(b"rendered")
         return output
 
@@ -296,7 +397,7 @@ def test_manual_pipeline_does_not_require_whisper_or_claude(
         lambda *_args, **_kwargs: pytest.fail("manual ranges must bypass Claude"),
     )
 
-    def fake_render(_source, _subtitle, output, _plan, _reporter=None):
+    def fake_render(_source, _subtitle, output, _plan, _reporter=None, **_kwargs):
         output.write_bytes(b"rendered")
         return output
 
@@ -331,6 +432,7 @@ def test_transcription_failure_keeps_cut_master_and_records_reason(
         "transcribe_cut_master",
         lambda *_args: (_ for _ in ()).throw(FileNotFoundError("whisper missing")),
     )
+    monkeypatch.setattr(HIGHLIGHT_VIDEO.shutil, "which", lambda _name: None)
 
     result = HIGHLIGHT_VIDEO.run_pipeline(
         source,
@@ -370,7 +472,7 @@ def test_render_failure_deletes_partial_and_keeps_cut_master(
         lambda _path: HIGHLIGHT_VIDEO.VideoInfo(3600.0, 1920, 1080),
     )
 
-    def failing_render(_source, _subtitle, output, _plan, _reporter=None):
+    def failing_render(_source, _subtitle, output, _plan, _reporter=None, **_kwargs):
         output.write_bytes(b"partial")
         raise subprocess.CalledProcessError(1, ["ffmpeg"])
 
@@ -392,6 +494,240 @@ def test_render_failure_deletes_partial_and_keeps_cut_master(
     assert "render_failed" in manifest["fallback_reason"]
 
 
+class FakeBodyRender:
+    def __init__(self, output: Path) -> None:
+        self.output = output
+        self.cancelled = False
+        self.closed = False
+
+    def wait(self) -> Path:
+        self.output.write_bytes(b"body")
+        return self.output
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_pipelined_run_encodes_the_body_before_the_plan_exists(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    source = tmp_path / "recording.mkv"
+    source.write_bytes(b"source")
+    cut_master = tmp_path / "cut.mp4"
+    cut_master.write_bytes(b"cut")
+    events = []
+    body = FakeBodyRender(tmp_path / "recording.body.mp4")
+
+    def fake_start(media, _output_dir, stem, cut):
+        events.append(("body", media, stem, cut))
+        return body
+
+    def fake_stitched(media, _subtitle, output, _plan, body_render, _reporter=None, **_kwargs):
+        events.append(("stitch", media, body_render))
+        output.write_bytes(b"stitched")
+        return output
+
+    monkeypatch.setattr(HIGHLIGHT_VIDEO, "render_cut_master", lambda *_args: cut_master)
+    monkeypatch.setattr(
+        HIGHLIGHT_VIDEO,
+        "probe_video",
+        lambda _path: HIGHLIGHT_VIDEO.VideoInfo(100.0, 1920, 1080),
+    )
+    monkeypatch.setattr(HIGHLIGHT_VIDEO, "start_body_render", fake_start)
+    monkeypatch.setattr(HIGHLIGHT_VIDEO, "render_stitched_video", fake_stitched)
+    monkeypatch.setattr(
+        HIGHLIGHT_VIDEO,
+        "render_highlight_video",
+        lambda *_args, **_kwargs: pytest.fail("a pipelined run renders only the reel"),
+    )
+    config = HIGHLIGHT_VIDEO.PipelineConfig(
+        manual_title="結論を先に見せる",
+        manual_highlights=({"start": 10, "end": 16},),
+        pipelined=True,
+    )
+
+    result = HIGHLIGHT_VIDEO.run_pipeline(source, tmp_path / "output", config)
+
+    assert result.read_bytes() == b"stitched"
+    assert events == [
+        ("body", cut_master, "recording", ()),
+        ("stitch", cut_master, body),
+    ]
+
+
+def test_pipelined_fallback_stops_the_body_encode(tmp_path: Path, monkeypatch) -> None:
+    source = tmp_path / "recording.mkv"
+    source.write_bytes(b"source")
+    cut_master = tmp_path / "cut.mp4"
+    cut_master.write_bytes(b"cut")
+    body = FakeBodyRender(tmp_path / "recording.body.mp4")
+    monkeypatch.setattr(HIGHLIGHT_VIDEO, "render_cut_master", lambda *_args: cut_master)
+    monkeypatch.setattr(
+        HIGHLIGHT_VIDEO,
+        "probe_video",
+        lambda _path: HIGHLIGHT_VIDEO.VideoInfo(100.0, 1920, 1080),
+    )
+    monkeypatch.setattr(HIGHLIGHT_VIDEO, "start_body_render", lambda *_args: body)
+    monkeypatch.setattr(
+        HIGHLIGHT_VIDEO,
+        "transcribe_cut_master",
+        lambda *_args: (_ for _ in ()).throw(FileNotFoundError("whisper missing")),
+    )
+    monkeypatch.setattr(HIGHLIGHT_VIDEO.shutil, "which", lambda _name: None)
+
+    result = HIGHLIGHT_VIDEO.run_pipeline(
+        source,
+        tmp_path / "output",
+        HIGHLIGHT_VIDEO.PipelineConfig(pipelined=True),
+    )
+
+    assert result == cut_master
+    assert body.cancelled
+
+
+def test_an_interrupted_pipelined_run_does_not_leave_the_body_encoding(
+    tmp_path: Path, monkeypatch
+) -> None:
+    source = tmp_path / "recording.mkv"
+    source.write_bytes(b"source")
+    cut_master = tmp_path / "cut.mp4"
+    cut_master.write_bytes(b"cut")
+    body = FakeBodyRender(tmp_path / "recording.body.mp4")
+    monkeypatch.setattr(HIGHLIGHT_VIDEO, "render_cut_master", lambda *_args: cut_master)
+    monkeypatch.setattr(
+        HIGHLIGHT_VIDEO,
+        "probe_video",
+        lambda _path: HIGHLIGHT_VIDEO.VideoInfo(100.0, 1920, 1080),
+    )
+    monkeypatch.setattr(HIGHLIGHT_VIDEO, "start_body_render", lambda *_args: body)
+    monkeypatch.setattr(
+        HIGHLIGHT_VIDEO,
+        "transcribe_cut_master",
+        lambda *_args: (_ for _ in ()).throw(KeyboardInterrupt()),
+    )
+    monkeypatch.setattr(HIGHLIGHT_VIDEO.shutil, "which", lambda _name: None)
+
+    with pytest.raises(KeyboardInterrupt):
+        HIGHLIGHT_VIDEO.run_pipeline(
+            source,
+            tmp_path / "output",
+            HIGHLIGHT_VIDEO.PipelineConfig(pipelined=True),
+        )
+
+    assert body.closed
+
+def cached_stage_stubs(tmp_path: Path, monkeypatch) -> dict[str, int]:
+    counts = {"cut": 0, "probe": 0, "audio": 0, "transcript": 0}
+    cut_master = tmp_path / "cut.mp4"
+    transcript = tmp_path / "transcript.json"
+    audio = tmp_path / "cut.wav"
+
+    def fake_cut(*_args):
+        counts["cut"] += 1
+        cut_master.write_bytes(b"cut")
+        return cut_master
+
+    def fake_probe(_path):
+        counts["probe"] += 1
+        return HIGHLIGHT_VIDEO.VideoInfo(3600.0, 1920, 1080)
+
+    def fake_extract(_media, _output_dir):
+        counts["audio"] += 1
+        audio.write_bytes(b"pcm")
+        return audio
+
+    def fake_transcribe(_media, _output_dir, _command, _reporter, heard):
+        assert heard == audio
+        counts["transcript"] += 1
+        transcript.write_text(
+            json.dumps({"segments": transcript_segments()}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        return transcript
+
+    def fake_render(_source, _subtitle, output, _plan, _reporter=None, **_kwargs):
+        output.write_bytes(b"rendered")
+        return output
+
+    monkeypatch.setattr(HIGHLIGHT_VIDEO, "render_cut_master", fake_cut)
+    monkeypatch.setattr(HIGHLIGHT_VIDEO, "probe_video", fake_probe)
+    monkeypatch.setattr(HIGHLIGHT_VIDEO, "extract_audio", fake_extract)
+    monkeypatch.setattr(HIGHLIGHT_VIDEO, "transcribe_cut_master", fake_transcribe)
+    monkeypatch.setattr(HIGHLIGHT_VIDEO, "render_highlight_video", fake_render)
+    monkeypatch.setattr(HIGHLIGHT_VIDEO.shutil, "which", lambda _name: None)
+    return counts
+
+
+def test_second_run_reuses_cut_probe_and_transcript(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    source = tmp_path / "recording.mkv"
+    source.write_bytes(b"source")
+    output_dir = tmp_path / "output"
+    counts = cached_stage_stubs(tmp_path, monkeypatch)
+    config = HIGHLIGHT_VIDEO.PipelineConfig()
+
+    HIGHLIGHT_VIDEO.run_pipeline(source, output_dir, config)
+    first = json.loads((output_dir / "highlight_plan.json").read_text(encoding="utf-8"))
+    result = HIGHLIGHT_VIDEO.run_pipeline(source, output_dir, config)
+    second = json.loads((output_dir / "highlight_plan.json").read_text(encoding="utf-8"))
+
+    assert result.read_bytes() == b"rendered"
+    assert counts == {"cut": 1, "probe": 1, "audio": 1, "transcript": 1}
+    assert first["cache_hits"] == []
+    assert second["cache_hits"] == ["cut_master", "probe", "transcript"]
+    assert second["status"] == "success"
+
+
+def test_changed_inputs_run_their_stage_again(tmp_path: Path, monkeypatch) -> None:
+    source = tmp_path / "recording.mkv"
+    source.write_bytes(b"source")
+    output_dir = tmp_path / "output"
+    counts = cached_stage_stubs(tmp_path, monkeypatch)
+
+    HIGHLIGHT_VIDEO.run_pipeline(source, output_dir, HIGHLIGHT_VIDEO.PipelineConfig())
+    HIGHLIGHT_VIDEO.run_pipeline(
+        source,
+        output_dir,
+        HIGHLIGHT_VIDEO.PipelineConfig(transcript_command=("whisper", "{audio}")),
+    )
+    assert counts == {"cut": 1, "probe": 1, "audio": 2, "transcript": 2}
+
+    HIGHLIGHT_VIDEO.run_pipeline(
+        source,
+        output_dir,
+        HIGHLIGHT_VIDEO.PipelineConfig(
+            auto_editor=HIGHLIGHT_VIDEO.AutoEditorConfig(margin_seconds=0.5)
+        ),
+    )
+    assert counts["cut"] == 2
+
+
+def test_hand_edited_artifact_or_no_cache_runs_stage_again(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    source = tmp_path / "recording.mkv"
+    source.write_bytes(b"source")
+    output_dir = tmp_path / "output"
+    counts = cached_stage_stubs(tmp_path, monkeypatch)
+    config = HIGHLIGHT_VIDEO.PipelineConfig()
+
+    HIGHLIGHT_VIDEO.run_pipeline(source, output_dir, config)
+    transcript = tmp_path / "transcript.json"
+    transcript.write_text(transcript.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    HIGHLIGHT_VIDEO.run_pipeline(source, output_dir, config)
+    assert counts == {"cut": 1, "probe": 1, "audio": 2, "transcript": 2}
+
+    HIGHLIGHT_VIDEO.run_pipeline(source, output_dir, config, use_cache=False)
+    assert counts == {"cut": 2, "probe": 2, "audio": 3, "transcript": 3}
+
+
 def test_render_cut_master_retries_empty_timeline_without_margin(
     tmp_path: Path,
     monkeypatch,
@@ -429,6 +765,217 @@ def test_render_cut_master_retries_empty_timeline_without_margin(
     assert "--margin" not in calls[1]
 
 
+def cut_list_document() -> dict:
+    # At 10 fps: the recording keeps 0-8 s and 20-30 s, then cuts the rest.
+    return {
+        "version": "3",
+        "timebase": "10/1",
+        "v": [
+            [
+                {"start": 0, "dur": 80, "offset": 0},
+                {"start": 80, "dur": 100, "offset": 200},
+            ]
+        ],
+    }
+
+
+def test_export_cut_list_falls_back_to_the_older_export_name(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    source = tmp_path / "recording.mkv"
+    source.write_bytes(b"source")
+    calls = []
+
+    def fake_run(command, *, cwd=None, reporter=None):
+        calls.append(command)
+        if command[command.index("--export") + 1] == "v3":
+            error = subprocess.CalledProcessError(1, command)
+            error.stdout = "Invalid export format: v3"
+            error.stderr = ""
+            raise error
+        output = Path(command[command.index("-o") + 1])
+        output.with_suffix(".json").write_text(
+            json.dumps(cut_list_document()), encoding="utf-8"
+        )
+        return SimpleNamespace(stdout="", stderr="")
+
+    monkeypatch.setattr(HIGHLIGHT_VIDEO, "_run", fake_run)
+
+    result = HIGHLIGHT_VIDEO.export_cut_list(source, tmp_path / "output")
+    cut = HIGHLIGHT_VIDEO.read_cut(result, 60.0)
+
+    assert [call[call.index("--export") + 1] for call in calls] == ["v3", "json"]
+    assert "--video-codec" not in calls[-1]
+    assert result.name == "recording.cut_list.json"
+    assert [(item.source_start, item.source_end) for item in cut] == [
+        (0.0, 8.0),
+        (20.0, 30.0),
+    ]
+
+
+def test_transcript_timestamps_follow_the_cut_list() -> None:
+    cut = HIGHLIGHT_VIDEO.cut_slices([(0.0, 8.0), (20.0, 30.0)])
+    segments = [
+        {"start": 1.0, "end": 3.0, "text": "kept"},
+        {"start": 10.0, "end": 15.0, "text": "silence"},
+        {"start": 7.0, "end": 22.0, "text": "across the cut"},
+        {"start": 25.0, "end": 27.0, "text": "later"},
+    ]
+
+    mapped = HIGHLIGHT_VIDEO.map_segments_to_cut(segments, cut)
+
+    assert [(item["text"], item["start"], item["end"]) for item in mapped] == [
+        ("kept", 1.0, 3.0),
+        ("across the cut", 7.0, 10.0),
+        ("later", 13.0, 15.0),
+    ]
+
+
+def test_cut_list_command_trims_the_recording_itself(tmp_path: Path) -> None:
+    cut = HIGHLIGHT_VIDEO.cut_slices([(0.0, 8.0), (20.0, 30.0)])
+    plan = HIGHLIGHT_VIDEO.HighlightPlan(
+        "結論", (HIGHLIGHT_VIDEO.Highlight(6.0, 10.0, "across"),)
+    )
+
+    command = HIGHLIGHT_VIDEO.build_ffmpeg_command(
+        tmp_path / "recording.mkv",
+        tmp_path / "opening.ass",
+        tmp_path / "final.mp4",
+        plan,
+        cut=cut,
+    )
+    filter_graph = command[command.index("-filter_complex") + 1]
+    scripted = HIGHLIGHT_VIDEO.use_filter_script(command, tmp_path / "graph.txt")
+
+    assert command[command.index("-i") + 1] == str(tmp_path / "recording.mkv")
+    assert "trim=start=6.000:end=8.000" in filter_graph
+    assert "trim=start=20.000:end=22.000" in filter_graph
+    assert "[0:v]trim=start=0.000:end=8.000" in filter_graph
+    assert "[0:v]trim=start=20.000:end=30.000" in filter_graph
+    assert "vmain" not in filter_graph
+    assert "concat=n=4:v=1:a=1" in filter_graph
+    assert "-filter_complex" not in scripted
+    assert (tmp_path / "graph.txt").read_text(encoding="utf-8") == filter_graph
+
+
+def test_cut_list_pipeline_never_renders_a_cut_master(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    source = tmp_path / "recording.mkv"
+    source.write_bytes(b"source")
+    output_dir = tmp_path / "output"
+    cut_list = tmp_path / "recording.cut_list.v3"
+    cut_list.write_text(json.dumps(cut_list_document()), encoding="utf-8")
+    transcript = tmp_path / "recording.json"
+    transcript.write_text(
+        json.dumps(
+            {
+                "segments": [
+                    {"start": 1.0, "end": 3.0, "text": "冒頭の説明です"},
+                    {"start": 21.0, "end": 26.0, "text": "結論は一度だけ書き出すことです"},
+                ]
+            },
+            ensure_ascii=False,
+        ),
+        encoding="utf-8",
+    )
+    transcribed = []
+    renders = []
+    monkeypatch.setattr(
+        HIGHLIGHT_VIDEO,
+        "render_cut_master",
+        lambda *_args: pytest.fail("the cut list mode must not encode a cut master"),
+    )
+    monkeypatch.setattr(HIGHLIGHT_VIDEO, "export_cut_list", lambda *_args: cut_list)
+    monkeypatch.setattr(
+        HIGHLIGHT_VIDEO,
+        "probe_video",
+        lambda _path: HIGHLIGHT_VIDEO.VideoInfo(60.0, 1920, 1080),
+    )
+
+    def fake_transcribe(media, *_args):
+        transcribed.append(media)
+        return transcript
+
+    def fake_render(media, _subtitle, output, plan, _reporter=None, **kwargs):
+        renders.append((media, plan, kwargs["cut"]))
+        output.write_bytes(b"rendered")
+        return output
+
+    monkeypatch.setattr(HIGHLIGHT_VIDEO, "transcribe_cut_master", fake_transcribe)
+    monkeypatch.setattr(HIGHLIGHT_VIDEO, "render_highlight_video", fake_render)
+    config = HIGHLIGHT_VIDEO.PipelineConfig(
+        manual_title="結論を先に見せる",
+        manual_highlights=({"start": 9, "end": 12},),
+        cut_list_only=True,
+    )
+
+    result = HIGHLIGHT_VIDEO.run_pipeline(source, output_dir, config)
+
+    assert result.read_bytes() == b"rendered"
+    assert transcribed == []
+    media, plan, cut = renders[0]
+    assert media == source.resolve()
+    assert plan.highlights[0].start == 9.0
+    assert HIGHLIGHT_VIDEO.total_duration(cut) == pytest.approx(18.0)
+    manifest = json.loads((output_dir / "highlight_plan.json").read_text(encoding="utf-8"))
+    assert manifest["cut_master"] == ""
+    assert manifest["cut_list"] == str(cut_list)
+
+
+def test_cut_list_pipeline_transcribes_the_recording_on_the_cut_timeline(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    source = tmp_path / "recording.mkv"
+    source.write_bytes(b"source")
+    output_dir = tmp_path / "output"
+    cut_list = tmp_path / "recording.cut_list.v3"
+    cut_list.write_text(json.dumps(cut_list_document()), encoding="utf-8")
+    transcript = tmp_path / "recording.json"
+    transcript.write_text(
+        json.dumps(
+            {"segments": [{"start": 21.0, "end": 26.0, "text": "結論です"}]},
+            ensure_ascii=False,
+        ),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(HIGHLIGHT_VIDEO, "export_cut_list", lambda *_args: cut_list)
+    monkeypatch.setattr(
+        HIGHLIGHT_VIDEO,
+        "probe_video",
+        lambda _path: HIGHLIGHT_VIDEO.VideoInfo(60.0, 1920, 1080),
+    )
+    monkeypatch.setattr(
+        HIGHLIGHT_VIDEO, "transcribe_cut_master", lambda media, *_args: transcript
+    )
+    monkeypatch.setattr(HIGHLIGHT_VIDEO, "build_ai_plan", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(HIGHLIGHT_VIDEO.shutil, "which", lambda _name: None)
+    fallback = tmp_path / "recording.cut_master.mp4"
+    fallback.write_bytes(b"cut")
+    monkeypatch.setattr(HIGHLIGHT_VIDEO, "render_cut_master", lambda *_args: fallback)
+
+    def failing_render(*_args, **_kwargs):
+        raise subprocess.CalledProcessError(1, ["ffmpeg"])
+
+    monkeypatch.setattr(HIGHLIGHT_VIDEO, "render_highlight_video", failing_render)
+
+    result = HIGHLIGHT_VIDEO.run_pipeline(
+        source, output_dir, HIGHLIGHT_VIDEO.PipelineConfig(cut_list_only=True)
+    )
+
+    mapped = json.loads(
+        (output_dir / "recording.cut_transcript.json").read_text(encoding="utf-8")
+    )
+    assert mapped["segments"][0]["start"] == 9.0
+    assert mapped["segments"][0]["end"] == 14.0
+    assert result == fallback
+    manifest = json.loads((output_dir / "highlight_plan.json").read_text(encoding="utf-8"))
+    assert manifest["status"] == "fallback"
+    assert manifest["cut_master"] == str(fallback)
+
 def test_custom_transcript_command_expands_placeholders(
     tmp_path: Path,
     monkeypatch,
@@ -462,6 +1009,61 @@ def test_custom_transcript_command_expands_placeholders(
     ]
 
 
+def test_extract_audio_decodes_16_khz_mono_without_the_picture(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    source = tmp_path / "cut master.mp4"
+    source.write_bytes(b"cut")
+    calls = []
+
+    def fake_run(command, *, cwd=None, reporter=None):
+        calls.append(command)
+        Path(command[-1]).write_bytes(b"pcm")
+        return SimpleNamespace(stdout="", stderr="")
+
+    monkeypatch.setattr(HIGHLIGHT_VIDEO.shutil, "which", lambda _name: "ffmpeg")
+    monkeypatch.setattr(HIGHLIGHT_VIDEO, "_run", fake_run)
+
+    result = HIGHLIGHT_VIDEO.extract_audio(source, tmp_path / "output")
+
+    command = calls[0]
+    assert result == tmp_path / "output" / "cut master.wav"
+    assert result.read_bytes() == b"pcm"
+    assert "-vn" in command
+    assert command[command.index("-ac") + 1] == "1"
+    assert command[command.index("-ar") + 1] == "16000"
+    assert not list((tmp_path / "output").glob("*.partial.wav"))
+
+
+def test_transcription_listens_to_the_extracted_audio(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    source = tmp_path / "cut master.mp4"
+    audio = tmp_path / "cut master.wav"
+    output_dir = tmp_path / "transcript"
+    calls = []
+
+    def fake_run(command, *, cwd=None, reporter=None):
+        calls.append(command)
+        (output_dir / "cut master.json").write_text('{"segments": []}', encoding="utf-8")
+        return SimpleNamespace(stdout="", stderr="")
+
+    monkeypatch.setattr(HIGHLIGHT_VIDEO.shutil, "which", lambda _name: "whisper")
+    monkeypatch.setattr(HIGHLIGHT_VIDEO, "_run", fake_run)
+
+    HIGHLIGHT_VIDEO.transcribe_cut_master(source, output_dir, (), None, audio)
+    HIGHLIGHT_VIDEO.transcribe_cut_master(
+        source, output_dir, ("wrapper", "{audio}", "{input}"), None, audio
+    )
+
+    assert calls[0][1] == str(audio)
+    assert calls[1] == ["wrapper", str(audio), str(source)]
+    assert HIGHLIGHT_VIDEO.wants_audio(())
+    assert not HIGHLIGHT_VIDEO.wants_audio(("wrapper", "{input}"))
+
+
 def test_probe_video_reads_video_stream(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setattr(HIGHLIGHT_VIDEO.shutil, "which", lambda _name: "ffprobe")
     monkeypatch.setattr(
@@ -473,7 +1075,12 @@ def test_probe_video_reads_video_stream(monkeypatch, tmp_path: Path) -> None:
                     "format": {"duration": "12.5"},
                     "streams": [
                         {"codec_type": "audio"},
-                        {"codec_type": "video", "width": 1280, "height": 720},
+                        {
+                            "codec_type": "video",
+                            "width": 1280,
+                            "height": 720,
+                            "r_frame_rate": "30000/1001",
+                        },
                     ],
                 }
             )
@@ -486,6 +1093,7 @@ def test_probe_video_reads_video_stream(monkeypatch, tmp_path: Path) -> None:
         12.5,
         1280,
         720,
+        30000 / 1001,
     )
 
 
@@ -536,8 +1144,8 @@ def test_main_uses_explicit_input_and_output(tmp_path: Path, monkeypatch) -> Non
     expected = output_dir / "final.mp4"
     calls = []
 
-    def fake_pipeline(actual_source, actual_output, config, _reporter=None):
-        calls.append((actual_source, actual_output, config))
+    def fake_pipeline(actual_source, actual_output, config, _reporter=None, **kwargs):
+        calls.append((actual_source, actual_output, config, kwargs))
         return expected
 
     monkeypatch.setattr(HIGHLIGHT_VIDEO, "run_pipeline", fake_pipeline)
@@ -547,3 +1155,4 @@ def test_main_uses_explicit_input_and_output(tmp_path: Path, monkeypatch) -> Non
     assert result == 0
     assert calls[0][0] == source
     assert calls[0][1] == output_dir
+    assert calls[0][3] == {"use_cache": True}
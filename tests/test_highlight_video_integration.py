@@ -70,3 +70,102 @@ def test_ffmpeg_output_contains_highlights_and_the_complete_body(
     assert info.width == 320
     assert info.height == 180
     assert info.duration == pytest.approx(8.0, abs=0.25)
+
+
+@pytest.mark.skipif(
+    not shutil.which("ffmpeg") or not shutil.which("ffprobe"),
+    reason="FFmpeg integration tools are unavailable",
+)
+def test_cut_list_render_trims_the_recording_in_one_encode(tmp_path: Path) -> None:
+    source = tmp_path / "recording.mp4"
+    subprocess.run(
+        [
+            "ffmpeg",
+            "-y",
+            "-f",
+            "lavfi",
+            "-i",
+            "testsrc2=size=320x180:rate=30:duration=12",
+            "-f",
+            "lavfi",
+            "-i",
+            "sine=frequency=440:sample_rate=48000:duration=12",
+            "-c:v",
+            "libx264",
+            "-c:a",
+            "aac",
+            "-shortest",
+            str(source),
+        ],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subtitle = tmp_path / "opening.ass"
+    HIGHLIGHT_VIDEO.write_opening_ass(
+        subtitle,
+        title="Highlight first",
+        display_seconds=1.0,
+        resolution=(320, 180),
+        font_name="DejaVu Sans",
+        font_size=28,
+    )
+    cut = HIGHLIGHT_VIDEO.cut_slices([(0.0, 3.0), (5.0, 9.0)])
+    plan = HIGHLIGHT_VIDEO.HighlightPlan(
+        "Highlight first", (HIGHLIGHT_VIDEO.Highlight(2.0, 4.0, "across the cut"),)
+    )
+    output = tmp_path / "highlighted.mp4"
+
+    HIGHLIGHT_VIDEO.render_highlight_video(source, subtitle, output, plan, cut=cut)
+    info = HIGHLIGHT_VIDEO.probe_video(output)
+
+    assert info.duration == pytest.approx(9.0, abs=0.25)
+
+
+@pytest.mark.skipif(
+    not shutil.which("ffmpeg") or not shutil.which("ffprobe"),
+    reason="FFmpeg integration tools are unavailable",
+)
+def test_stitched_render_joins_the_reel_and_the_body(tmp_path: Path) -> None:
+    source = tmp_path / "cut_master.mp4"
+    subprocess.run(
+        [
+            "ffmpeg",
+            "-y",
+            "-f",
+            "lavfi",
+            "-i",
+            "testsrc2=size=320x180:rate=30:duration=6",
+            "-f",
+            "lavfi",
+            "-i",
+            "sine=frequency=440:sample_rate=48000:duration=6",
+            "-c:v",
+            "libx264",
+            "-c:a",
+            "aac",
+            "-shortest",
+            str(source),
+        ],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subtitle = tmp_path / "opening.ass"
+    HIGHLIGHT_VIDEO.write_opening_ass(
+        subtitle,
+        title="Highlight first",
+        display_seconds=1.0,
+        resolution=(320, 180),
+        font_name="DejaVu Sans",
+        font_size=28,
+    )
+    plan = HIGHLIGHT_VIDEO.HighlightPlan(
+        "Highlight first", (HIGHLIGHT_VIDEO.Highlight(1.0, 2.5, "first"),)
+    )
+    body = HIGHLIGHT_VIDEO.start_body_render(source, tmp_path, "cut_master")
+    output = tmp_path / "highlighted.mp4"
+
+    HIGHLIGHT_VIDEO.render_stitched_video(source, subtitle, output, plan, body)
+
+    assert HIGHLIGHT_VIDEO.probe_video(output).duration == pytest.approx(7.5, abs=0.25)
@@ -18,9 +18,12 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import subprocess
 import sys
-from dataclasses import asdict, dataclass
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, replace
+from fractions import Fraction
 from pathlib import Path
 from typing import Any, Sequence
 
@@ -50,19 +53,40 @@ from highlight_plan import (  # noqa: E402
     parse_ai_plan,
 )
 from highlight_video import (  # noqa: E402
+    AutoEditorConfig,
+    BackgroundRender,
     PipelineConfig,
     VideoInfo,
+    _extracted_audio,
     _read_segments,
     _run,
+    export_cut_list,
     latest_recording,
     load_config,
+    map_segments_to_cut,
     probe_video,
+    read_cut,
     render_cut_master,
+    build_stitch_command,
+    start_audio_extraction,
+    start_body_render,
     transcribe_cut_master,
+    use_filter_script,
+    wants_audio,
+    write_concat_list,
 )
 from progress import ProgressReporter, format_clock  # noqa: E402
-from sound_design import build_sfx_command, build_sound_cues  # noqa: E402
-from timeline import BODY, Slice, build_timeline, total_duration  # noqa: E402
+from sound_design import SFX_MIX, build_sfx_command, build_sound_cues  # noqa: E402
+from timeline import (  # noqa: E402
+    BODY,
+    HIGHLIGHT,
+    Slice,
+    build_timeline,
+    clip_slices,
+    resolve_slices,
+    segment_windows,
+    total_duration,
+)
 
 SCHEMA_VERSION = 2
 MAXIMUM_CANDIDATE_SEGMENTS = 700
@@ -71,7 +95,10 @@ CLAUDE_TIMEOUT_SECONDS = 300
 __all__ = [
     "AdvancedConfig",
     "build_edit_plan",
+    "build_join_command",
     "build_render_command",
+    "build_segment_command",
+    "build_soundtrack_command",
     "load_advanced_config",
     "main",
     "run_pipeline",
@@ -95,6 +122,7 @@ class AdvancedConfig:
     caption_maximum_characters: int = 40
     video_crf: int = 18
     video_preset: str = "medium"
+    render_workers: int = 1
 
 
 def load_advanced_config(
@@ -124,6 +152,7 @@ def load_advanced_config(
         caption_maximum_characters=int(section.get("caption_maximum_characters", 40)),
         video_crf=int(section.get("video_crf", 18)),
         video_preset=str(section.get("video_preset", "medium")),
+        render_workers=int(section.get("render_workers", 1)),
     )
     return working_dirs, output_dir, config, advanced
 
@@ -348,12 +377,17 @@ def build_render_command(
     sfx: Path | None = None,
     crf: int = 18,
     preset: str = "medium",
+    from_recording: bool = False,
 ) -> list[str]:
-    """Build the single FFmpeg command that produces the finished video."""
+    """Build the single FFmpeg command that produces the finished video.
+
+    `from_recording` marks slices that `resolve_slices` laid over the original
+    recording; the body is then many pieces and every one of them is trimmed.
+    """
     filters: list[str] = []
     concat_inputs: list[str] = []
     for index, item in enumerate(slices):
-        if item.kind == BODY and item.source_start <= 0.0:
+        if item.kind == BODY and item.source_start <= 0.0 and not from_recording:
             # The body is the whole cut master by construction, so it is used
             # untrimmed: trimming to the probed duration would drop the last
             # frames whenever the container rounds it down.
@@ -377,14 +411,7 @@ def build_render_command(
     command.extend(["-i", str(source)])
     if sfx is not None:
         command.extend(["-i", str(sfx)])
-        # normalize=0 keeps the narration at its original level; the default
-        # would halve it the moment a single effect plays.
-        # The limiter only catches the moment an effect lands on an already
-        # loud word; without it that single frame clips.
-        filters.append(
-            "[basea][1:a]amix=inputs=2:normalize=0:duration=first:"
-            "dropout_transition=0,alimiter=limit=0.95[outa]"
-        )
+        filters.append(f"[basea][1:a]{SFX_MIX}[outa]")
     else:
         filters.append("[basea]anull[outa]")
     command.extend(
@@ -413,11 +440,153 @@ def build_render_command(
     return command
 
 
+def build_segment_command(
+    source: Path,
+    subtitle: Path,
+    output: Path,
+    pieces: Sequence[Slice],
+    *,
+    window_start: float,
+    frame_rate: float = 0.0,
+    crf: int = 18,
+    preset: str = "medium",
+    threads: int = 0,
+) -> list[str]:
+    """Build the FFmpeg command that encodes one window of the finished picture.
+
+    `pieces` are what `clip_slices` returned for the window. The input is opened
+    at the earliest source position the window shows, so each worker decodes its
+    own stretch of the recording, and the picture is moved to its place in the
+    whole video while the overlays are drawn: one overlays.ass serves every
+    window. Every window starts on a keyframe of its own, which is what lets the
+    windows be joined without encoding them again.
+    """
+    if not pieces:
+        raise ValueError("a render window needs at least one piece")
+    seek = min(item.source_start for item in pieces)
+    until = max(item.source_end for item in pieces)
+    filters: list[str] = []
+    concat_inputs: list[str] = []
+    for index, item in enumerate(pieces):
+        filters.append(
+            f"[0:v]trim=start={item.source_start - seek:.6f}"
+            f":end={item.source_end - seek:.6f},setpts=PTS-STARTPTS[v{index}]"
+        )
+        concat_inputs.append(f"[v{index}]")
+    filters.append(
+        "".join(concat_inputs)
+        + f"concat=n={len(pieces)}:v=1:a=0,setpts=PTS+{window_start:.6f}/TB,"
+        f"ass={_escape_filter_filename(subtitle.name)},setpts=PTS-STARTPTS[outv]"
+    )
+    command = [
+        "ffmpeg",
+        "-y",
+        "-hide_banner",
+        "-loglevel",
+        "warning",
+        "-ss",
+        f"{seek:.6f}",
+        "-t",
+        f"{until - seek:.6f}",
+        "-i",
+        str(source),
+        "-filter_complex",
+        ";".join(filters),
+        "-map",
+        "[outv]",
+        "-an",
+    ]
+    if frame_rate > 0:
+        # Pinned so that every window keeps the recording's rate and the joined
+        # picture has exactly the frames the windows were cut on.
+        command.extend(["-r", str(Fraction(frame_rate).limit_denominator(1001))])
+    command.extend(["-c:v", "libx264", "-preset", preset, "-crf", str(crf)])
+    if threads > 0:
+        command.extend(["-threads", str(threads)])
+    command.append(str(output))
+    return command
+
+
+def build_soundtrack_command(
+    source: Path,
+    output: Path,
+    slices: Sequence[Slice],
+    *,
+    sfx: Path | None = None,
+) -> list[str]:
+    """Build the FFmpeg command that renders the finished sound on its own.
+
+    A segmented render encodes the picture in windows but the sound in one
+    piece: separately encoded AAC windows would each start with encoder delay
+    and click where they meet.
+    """
+    filters: list[str] = []
+    concat_inputs: list[str] = []
+    for index, item in enumerate(slices):
+        filters.append(
+            f"[0:a]atrim=start={item.source_start:.3f}:end={item.source_end:.3f},"
+            f"asetpts=PTS-STARTPTS[a{index}]"
+        )
+        concat_inputs.append(f"[a{index}]")
+    filters.append("".join(concat_inputs) + f"concat=n={len(slices)}:v=0:a=1[basea]")
+    command = ["ffmpeg", "-y", "-hide_banner", "-loglevel", "warning"]
+    command.extend(["-i", str(source)])
+    if sfx is not None:
+        command.extend(["-i", str(sfx)])
+        filters.append(f"[basea][1:a]{SFX_MIX}[outa]")
+    else:
+        filters.append("[basea]anull[outa]")
+    command.extend(
+        [
+            "-filter_complex",
+            ";".join(filters),
+            "-map",
+            "[outa]",
+            "-vn",
+            "-c:a",
+            "aac",
+            "-b:a",
+            "320k",
+            str(output),
+        ]
+    )
+    return command
+
+
+def build_join_command(playlist: Path, soundtrack: Path, output: Path) -> list[str]:
+    """Join the encoded windows and lay the finished sound under them, copying both."""
+    return [
+        "ffmpeg",
+        "-y",
+        "-hide_banner",
+        "-loglevel",
+        "warning",
+        "-stats",
+        "-f",
+        "concat",
+        "-safe",
+        "0",
+        "-i",
+        str(playlist),
+        "-i",
+        str(soundtrack),
+        "-map",
+        "0:v",
+        "-map",
+        "1:a",
+        "-c",
+        "copy",
+        "-movflags",
+        "+faststart",
+        str(output),
+    ]
+
+
 def _write_manifest(
     output_dir: Path,
     *,
     source: Path,
-    cut_master: Path,
+    cut_master: Path | None,
     transcript: Path | None,
     plan: EditPlan,
     cues: Sequence[SoundCue],
@@ -425,12 +594,14 @@ def _write_manifest(
     output: Path,
     status: str,
     fallback_reason: str = "",
+    cut_list: Path | None = None,
 ) -> Path:
     payload = {
         "schema_version": SCHEMA_VERSION,
         "status": status,
         "source": str(source),
-        "cut_master": str(cut_master),
+        "cut_master": str(cut_master) if cut_master else "",
+        "cut_list": str(cut_list) if cut_list else "",
         "transcript": str(transcript) if transcript else "",
         "takeaway": plan.title,
         "notes": list(plan.notes),
@@ -468,7 +639,160 @@ def _render_sfx(
     return target
 
 
-def _steps(advanced: AdvancedConfig) -> tuple[str, ...]:
+def _fallback_video(
+    source: Path,
+    output_dir: Path,
+    reporter: ProgressReporter,
+    cut_master: Path | None,
+    body_render: BackgroundRender | None = None,
+    *,
+    auto_editor: AutoEditorConfig = AutoEditorConfig(),
+) -> Path:
+    """Return the plain silence cut, rendering it now when only a cut list exists.
+
+    `auto_editor` must be the setting the cut list was exported with, or the
+    fallback would cut other silences than the transcript was mapped through.
+    """
+    if body_render is not None:
+        if cut_master is not None:
+            body_render.cancel()
+        else:
+            try:
+                return body_render.wait()
+            except (OSError, RuntimeError, subprocess.SubprocessError) as error:
+                reporter.warn(f"the body encode failed as well: {error}")
+    if cut_master is not None:
+        return cut_master
+    reporter.warn("rendering the plain silence cut instead")
+    return render_cut_master(source, output_dir, reporter, auto_editor)
+
+
+def _draws_over_body(advanced: AdvancedConfig) -> bool:
+    """Tell whether any overlay layer lands on the body, not only the reel."""
+    return advanced.captions or advanced.telops or advanced.chapters
+
+
+def _render_stitched(
+    media: Path,
+    subtitle: Path,
+    output: Path,
+    slices: Sequence[Slice],
+    cut: Sequence[Slice],
+    body_render: BackgroundRender,
+    *,
+    sfx: Path | None,
+    advanced: AdvancedConfig,
+    reporter: ProgressReporter,
+) -> None:
+    """Render the opening reel and join it to the body encoded meanwhile."""
+    output_dir = output.parent
+    reel_slices = [item for item in slices if item.kind == HIGHLIGHT]
+    parts: list[Path] = []
+    if reel_slices:
+        reel = output_dir / f"{output.stem}.reel.mp4"
+        if reel.exists():
+            reel.unlink()
+        command = build_render_command(
+            media,
+            subtitle,
+            reel,
+            resolve_slices(reel_slices, cut) if cut else reel_slices,
+            crf=advanced.video_crf,
+            preset=advanced.video_preset,
+            from_recording=bool(cut),
+        )
+        if cut:
+            command = use_filter_script(command, output_dir / "reel_graph.txt")
+        _run(command, cwd=output_dir, reporter=reporter)
+        if not reel.exists() or reel.stat().st_size == 0:
+            raise RuntimeError("ffmpeg did not create a usable highlight reel")
+        parts.append(reel)
+    parts.append(body_render.wait())
+    playlist = write_concat_list(parts, output_dir / f"{output.stem}.parts.txt")
+    _run(build_stitch_command(playlist, output, sfx=sfx), cwd=output_dir, reporter=reporter)
+
+
+def _render_segmented(
+    media: Path,
+    subtitle: Path,
+    output: Path,
+    slices: Sequence[Slice],
+    *,
+    sfx: Path | None,
+    advanced: AdvancedConfig,
+    frame_rate: float,
+    from_recording: bool,
+    reporter: ProgressReporter,
+) -> None:
+    """Encode the finished picture in parallel windows and join them unchanged."""
+    output_dir = output.parent
+    windows = segment_windows(
+        total_duration(slices), advanced.render_workers, frame_rate=frame_rate
+    )
+    # The encoders share the machine instead of each sizing itself to all of it.
+    threads = max(1, (os.cpu_count() or 1) // max(1, len(windows)))
+    soundtrack = output_dir / f"{output.stem}.soundtrack.m4a"
+    command = build_soundtrack_command(media, soundtrack, slices, sfx=sfx)
+    if from_recording:
+        command = use_filter_script(command, output_dir / "soundtrack_graph.txt")
+    commands = [(command, soundtrack)]
+    parts: list[Path] = []
+    for index, (start, end) in enumerate(windows):
+        part = output_dir / f"{output.stem}.part{index:03d}.mp4"
+        command = build_segment_command(
+            media,
+            subtitle,
+            part,
+            clip_slices(slices, start, end),
+            window_start=start,
+            frame_rate=frame_rate,
+            crf=advanced.video_crf,
+            preset=advanced.video_preset,
+            threads=threads,
+        )
+        if from_recording:
+            command = use_filter_script(
+                command, output_dir / f"segment{index:03d}_graph.txt"
+            )
+        commands.append((command, part))
+        parts.append(part)
+    renders: list[BackgroundRender] = []
+    try:
+        for command, target in commands:
+            renders.append(BackgroundRender(command, target, cwd=output_dir))
+        with ThreadPoolExecutor(max_workers=len(renders)) as pool:
+            jobs = [pool.submit(render.wait) for render in renders]
+            done, _ = wait(jobs, return_when=FIRST_EXCEPTION)
+            failed = next((job for job in done if job.exception() is not None), None)
+            if failed is not None:
+                # The video is lost with one window, so the others are stopped
+                # now instead of encoding on for minutes.
+                for job in jobs:
+                    job.cancel()
+                for render in renders:
+                    render.close()
+                failed.result()
+    finally:
+        for render in renders:
+            render.close()
+    playlist = write_concat_list(parts, output_dir / f"{output.stem}.parts.txt")
+    _run(
+        build_join_command(playlist, soundtrack, output),
+        cwd=output_dir,
+        reporter=reporter,
+    )
+
+
+def _steps(advanced: AdvancedConfig, cut_list_only: bool = False) -> tuple[str, ...]:
+    if cut_list_only:
+        return (
+            "Finding the silences (auto-editor)",
+            "Reading video properties (ffprobe)",
+            "Transcribing the recording (whisper)",
+            "Planning the edit (claude)",
+            "Building overlays and sound effects",
+            "Rendering the finished video (ffmpeg)",
+        )
     return (
         "Removing silence (auto-editor)",
         "Reading video properties (ffprobe)",
@@ -489,145 +813,281 @@ def run_pipeline(
     dry_run: bool = False,
     cut_master_override: Path | None = None,
 ) -> Path:
-    """Run cut -> transcribe -> plan -> overlay -> render, keeping every part."""
+    """Run cut -> transcribe -> plan -> overlay -> render, keeping every part.
+
+    With `config.cut_list_only` (and no cut master to reuse) the recording is
+    transcribed and rendered directly through auto-editor's cut list, as in
+    `highlight_video.run_pipeline`, and a cut master is only rendered when the
+    run falls back to it.
+
+    `config.pipelined` encodes the body alongside transcription and planning
+    and joins it to the rendered reel, but only when no caption, telop or
+    chapter card is drawn over the body; those need the transcript first.
+
+    Otherwise `advanced.render_workers` above one splits the final render into
+    that many windows encoded at the same time.
+    """
     reporter = reporter if reporter is not None else ProgressReporter(enabled=False)
-    steps = _steps(advanced)
+    cut_list_only = config.cut_list_only and cut_master_override is None
+    steps = _steps(advanced, cut_list_only)
     source = source.resolve()
     output_dir.mkdir(parents=True, exist_ok=True)
+    cut_master: Path | None = None
+    cut_list: Path | None = None
 
     reporter.start_stage(steps[0], step=1, steps=len(steps))
     if cut_master_override is not None:
         cut_master = cut_master_override.resolve()
+        media = cut_master
         reporter.finish_stage(f"reusing {cut_master.name}")
+    elif cut_list_only:
+        cut_list = export_cut_list(source, output_dir, reporter, config.auto_editor)
+        media = source
+        reporter.finish_stage(cut_list.name if cut_list else "nothing to cut")
     else:
-        cut_master = render_cut_master(source, output_dir, reporter)
+        cut_master = render_cut_master(
+            source, output_dir, reporter, config.auto_editor
+        )
+        media = cut_master
         reporter.finish_stage(cut_master.name)
 
+    # The soundtrack is decoded for Whisper while the video is still probed.
+    audio_job = (
+        start_audio_extraction(media, output_dir)
+        if wants_audio(config.transcript_command)
+        else None
+    )
+
     reporter.start_stage(steps[1], step=2, steps=len(steps))
-    video: VideoInfo = probe_video(cut_master)
+    video: VideoInfo = probe_video(media)
+    transcribed_seconds = video.duration
+    cut: tuple[Slice, ...] = ()
+    if cut_list_only:
+        cut = read_cut(cut_list, video.duration)
+        video = replace(video, duration=total_duration(cut))
     reporter.finish_stage(
         f"{video.width}x{video.height}, {format_clock(video.duration)} long"
     )
 
-    transcript: Path | None = None
-    segments: list[dict[str, Any]] = []
-    reporter.start_stage(steps[2], step=3, steps=len(steps), total_seconds=video.duration)
+    body_render: BackgroundRender | None = None
+    if config.pipelined and not dry_run:
+        if _draws_over_body(advanced):
+            reporter.warn(
+                "captions, telops and chapters draw over the body, "
+                "so it is rendered in one pass"
+            )
+        else:
+            try:
+                body_render = start_body_render(
+                    media,
+                    output_dir,
+                    source.stem,
+                    cut,
+                    crf=advanced.video_crf,
+                    preset=advanced.video_preset,
+                )
+            except OSError as error:
+                reporter.warn(
+                    f"could not encode the body alongside, rendering in one pass: {error}"
+                )
+
+    # Whatever ends the run from here - a fallback, an unexpected error or
+    # Ctrl+C - the body encode must not outlive it.
     try:
-        transcript = transcribe_cut_master(
-            cut_master, output_dir, config.transcript_command, reporter
-        )
-        segments = _read_segments(transcript)
-        reporter.finish_stage(f"{len(segments)} segments")
-    except (OSError, RuntimeError, subprocess.SubprocessError, json.JSONDecodeError) as error:
-        reporter.finish_stage("failed")
-        reporter.warn(f"transcription failed, keeping the cut master: {error}")
-        _write_manifest(
-            output_dir,
-            source=source,
-            cut_master=cut_master,
-            transcript=None,
-            plan=EditPlan(""),
-            cues=(),
-            slices=(),
-            output=cut_master,
-            status="fallback",
-            fallback_reason=f"transcription_failed: {error}",
+        transcript: Path | None = None
+        segments: list[dict[str, Any]] = []
+        reporter.start_stage(
+            steps[2], step=3, steps=len(steps), total_seconds=transcribed_seconds
         )
-        return cut_master
+        try:
+            transcript = transcribe_cut_master(
+                media,
+                output_dir,
+                config.transcript_command,
+                reporter,
+                _extracted_audio(audio_job, reporter),
+            )
+            segments = _read_segments(transcript)
+            if cut:
+                segments = map_segments_to_cut(segments, cut)
+                transcript = output_dir / f"{source.stem}.cut_transcript.json"
+                transcript.write_text(
+                    json.dumps({"segments": segments}, ensure_ascii=False, indent=2),
+                    encoding="utf-8",
+                )
+            reporter.finish_stage(f"{len(segments)} segments")
+        except (OSError, RuntimeError, subprocess.SubprocessError, json.JSONDecodeError) as error:
+            reporter.finish_stage("failed")
+            reporter.warn(f"transcription failed, keeping the cut master: {error}")
+            fallback = _fallback_video(
+                source,
+                output_dir,
+                reporter,
+                cut_master,
+                body_render,
+                auto_editor=config.auto_editor,
+            )
+            _write_manifest(
+                output_dir,
+                source=source,
+                cut_master=fallback,
+                transcript=None,
+                plan=EditPlan(""),
+                cues=(),
+                slices=(),
+                output=fallback,
+                status="fallback",
+                fallback_reason=f"transcription_failed: {error}",
+                cut_list=cut_list,
+            )
+            return fallback
 
-    reporter.start_stage(steps[3], step=4, steps=len(steps))
-    ai_data = request_editorial_plan(
-        segments,
-        video_duration=video.duration,
-        config=config,
-        advanced=advanced,
-        reporter=reporter,
-    )
-    plan = build_edit_plan(
-        segments,
-        video_duration=video.duration,
-        config=config,
-        advanced=advanced,
-        ai_data=ai_data,
-    )
-    reporter.finish_stage(
-        f"{len(plan.highlights)} highlights, {len(plan.chapters)} chapters, "
-        f"{len(plan.telops)} telops, {len(plan.captions)} captions"
-    )
+        reporter.start_stage(steps[3], step=4, steps=len(steps))
+        ai_data = request_editorial_plan(
+            segments,
+            video_duration=video.duration,
+            config=config,
+            advanced=advanced,
+            reporter=reporter,
+        )
+        plan = build_edit_plan(
+            segments,
+            video_duration=video.duration,
+            config=config,
+            advanced=advanced,
+            ai_data=ai_data,
+        )
+        reporter.finish_stage(
+            f"{len(plan.highlights)} highlights, {len(plan.chapters)} chapters, "
+            f"{len(plan.telops)} telops, {len(plan.captions)} captions"
+        )
 
-    reporter.start_stage(steps[4], step=5, steps=len(steps))
-    slices = build_timeline(plan.highlights, video.duration)
-    subtitle = output_dir / "overlays.ass"
-    subtitle.write_text(
-        build_ass(
-            plan,
-            slices,
-            resolution=(video.width, video.height),
-            font_name=config.font_name,
-            takeaway_font_size=config.font_size,
-            takeaway_seconds=min(
-                config.opening_title_seconds,
-                max(0.0, total_duration(slices)),
+        reporter.start_stage(steps[4], step=5, steps=len(steps))
+        slices = build_timeline(plan.highlights, video.duration)
+        subtitle = output_dir / "overlays.ass"
+        subtitle.write_text(
+            build_ass(
+                plan,
+                slices,
+                resolution=(video.width, video.height),
+                font_name=config.font_name,
+                takeaway_font_size=config.font_size,
+                takeaway_seconds=min(
+                    config.opening_title_seconds,
+                    max(0.0, total_duration(slices)),
+                ),
+                chapter_seconds=advanced.chapter_seconds,
+                body_duration=video.duration,
             ),
-            chapter_seconds=advanced.chapter_seconds,
-            body_duration=video.duration,
-        ),
-        encoding="utf-8-sig",
-    )
-    cues = (
-        build_sound_cues(slices, plan.chapters) if advanced.sound_effects else ()
-    )
-    sfx = _render_sfx(cues, output_dir, reporter) if cues else None
-    reporter.finish_stage(
-        f"{subtitle.name}, {len(cues)} sound cues, "
-        f"final length {format_clock(total_duration(slices))}"
-    )
-
-    output = output_dir / f"{source.stem}.edited.mp4"
-    if dry_run:
-        manifest = _write_manifest(
-            output_dir,
-            source=source,
-            cut_master=cut_master,
-            transcript=transcript,
-            plan=plan,
-            cues=cues,
-            slices=slices,
-            output=output,
-            status="dry_run",
+            encoding="utf-8-sig",
         )
-        reporter.warn(f"dry run: nothing was rendered, review {manifest.name}")
-        return manifest
-
-    reporter.start_stage(
-        steps[5],
-        step=len(steps),
-        steps=len(steps),
-        total_seconds=total_duration(slices),
-    )
-    if output.exists():
-        output.unlink()
-    try:
-        _run(
-            build_render_command(
-                cut_master,
-                subtitle,
-                output,
-                slices,
-                sfx=sfx,
-                crf=advanced.video_crf,
-                preset=advanced.video_preset,
+        cues = (
+            build_sound_cues(slices, plan.chapters) if advanced.sound_effects else ()
+        )
+        sfx = _render_sfx(cues, output_dir, reporter) if cues else None
+        reporter.finish_stage(
+            f"{subtitle.name}, {len(cues)} sound cues, "
+            f"final length {format_clock(total_duration(slices))}"
+        )
+
+        output = output_dir / f"{source.stem}.edited.mp4"
+        if dry_run:
+            manifest = _write_manifest(
+                output_dir,
+                source=source,
+                cut_master=cut_master,
+                transcript=transcript,
+                plan=plan,
+                cues=cues,
+                slices=slices,
+                output=output,
+                status="dry_run",
+                cut_list=cut_list,
+            )
+            reporter.warn(f"dry run: nothing was rendered, review {manifest.name}")
+            return manifest
+
+        reporter.start_stage(
+            steps[5],
+            step=len(steps),
+            steps=len(steps),
+            total_seconds=(
+                total_duration(slices) - video.duration
+                if body_render is not None
+                else total_duration(slices)
             ),
-            cwd=output_dir,
-            reporter=reporter,
         )
-        if not output.exists() or output.stat().st_size == 0:
-            raise RuntimeError("ffmpeg did not create a usable video")
-    except (OSError, RuntimeError, subprocess.SubprocessError) as error:
-        reporter.finish_stage("failed")
-        reporter.warn(f"rendering failed, keeping the cut master: {error}")
         if output.exists():
             output.unlink()
+        try:
+            if body_render is not None:
+                _render_stitched(
+                    media,
+                    subtitle,
+                    output,
+                    slices,
+                    cut,
+                    body_render,
+                    sfx=sfx,
+                    advanced=advanced,
+                    reporter=reporter,
+                )
+            elif advanced.render_workers > 1:
+                _render_segmented(
+                    media,
+                    subtitle,
+                    output,
+                    resolve_slices(slices, cut) if cut else slices,
+                    sfx=sfx,
+                    advanced=advanced,
+                    frame_rate=video.frame_rate,
+                    from_recording=bool(cut),
+                    reporter=reporter,
+                )
+            else:
+                command = build_render_command(
+                    media,
+                    subtitle,
+                    output,
+                    resolve_slices(slices, cut) if cut else slices,
+                    sfx=sfx,
+                    crf=advanced.video_crf,
+                    preset=advanced.video_preset,
+                    from_recording=bool(cut),
+                )
+                if cut:
+                    command = use_filter_script(command, output_dir / "render_graph.txt")
+                _run(command, cwd=output_dir, reporter=reporter)
+            if not output.exists() or output.stat().st_size == 0:
+                raise RuntimeError("ffmpeg did not create a usable video")
+        except (OSError, RuntimeError, subprocess.SubprocessError) as error:
+            reporter.finish_stage("failed")
+            reporter.warn(f"rendering failed, keeping the cut master: {error}")
+            if output.exists():
+                output.unlink()
+            fallback = _fallback_video(
+                source,
+                output_dir,
+                reporter,
+                cut_master,
+                body_render,
+                auto_editor=config.auto_editor,
+            )
+            _write_manifest(
+                output_dir,
+                source=source,
+                cut_master=fallback,
+                transcript=transcript,
+                plan=plan,
+                cues=cues,
+                slices=slices,
+                output=fallback,
+                status="fallback",
+                fallback_reason=f"render_failed: {error}",
+                cut_list=cut_list,
+            )
+            return fallback
+        reporter.finish_stage(output.name)
         _write_manifest(
             output_dir,
             source=source,
@@ -636,24 +1096,14 @@ def run_pipeline(
             plan=plan,
             cues=cues,
             slices=slices,
-            output=cut_master,
-            status="fallback",
-            fallback_reason=f"render_failed: {error}",
+            output=output,
+            status="success",
+            cut_list=cut_list,
         )
-        return cut_master
-    reporter.finish_stage(output.name)
-    _write_manifest(
-        output_dir,
-        source=source,
-        cut_master=cut_master,
-        transcript=transcript,
-        plan=plan,
-        cues=cues,
-        slices=slices,
-        output=output,
-        status="success",
-    )
-    return output
+        return output
+    finally:
+        if body_render is not None:
+            body_render.close()
 
 
 def main(argv: Sequence[str] | None = None) -> int:
@@ -666,6 +1116,22 @@ def main(argv: Sequence[str] | None = None) -> int:
         type=Path,
         help="reuse an existing cut master instead of running auto-editor again",
     )
+    parser.add_argument(
+        "--cut-list-only",
+        action="store_true",
+        help="render straight from the recording with auto-editor's cut list, "
+        "skipping the cut master encode",
+    )
+    parser.add_argument(
+        "--pipelined",
+        action="store_true",
+        help="encode the body while transcribing when no overlay covers it",
+    )
+    parser.add_argument(
+        "--render-workers",
+        type=int,
+        help="encode the finished video as this many windows in parallel",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -693,6 +1159,12 @@ def main(argv: Sequence[str] | None = None) -> int:
             None,
         )
     working_dirs, configured_output, config, advanced = load_advanced_config(config_path)
+    if args.cut_list_only:
+        config = replace(config, cut_list_only=True)
+    if args.pipelined:
+        config = replace(config, pipelined=True)
+    if args.render_workers is not None:
+        advanced = replace(advanced, render_workers=args.render_workers)
     source = args.input or latest_recording(working_dirs)
     output_dir = (
         args.output_dir
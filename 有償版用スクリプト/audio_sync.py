@@ -16,23 +16,84 @@ without launching the application.
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import math
+import os
 import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterator
 
 import numpy as np
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import dual_source  # noqa: E402
+
 # 8 kHz keeps speech energy while making a one hour recording cheap to load.
 DEFAULT_SAMPLE_RATE = 8000
 # 200 envelope points per second means a 5 ms resolution, well under one frame.
 DEFAULT_ENVELOPE_RATE = 200
-# Correlating the first 15 minutes is enough and bounds the memory use.
+# Correlating the first 15 minutes is enough for a lecture. Longer windows are
+# affordable through the coarse search below, but every extra minute still has
+# to be decoded once.
 DEFAULT_MAX_SECONDS = 900.0
 # Confidence is the correlation coefficient at the winning lag. Two recordings
 # of the same talk score above 0.89 even under heavy noise, while unrelated
 # recordings peak below 0.47, so 0.6 sits in the gap with room on both sides.
 DEFAULT_MINIMUM_CONFIDENCE = 0.6
+# ffmpeg's output is read this many seconds at a time, so memory is bounded by
+# one chunk instead of by the length of the recording.
+DEFAULT_CHUNK_SECONDS = 30.0
+# One hour of envelope is under 3 MB as float32, so this keeps the envelopes of
+# about a hundred lecture hours before the least recently used ones are dropped.
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+# Past half an hour of envelope, the lag is searched at 10 envelope points per
+# second first. That is a 20x smaller transform at the default envelope rate,
+# and speech rhythm at 100 ms steps still puts the true lag among the best few.
+DEFAULT_COARSE_RATE = 10
+PYRAMID_MINIMUM_SECONDS = 1800.0
+# How many coarse peaks are refined, and how many coarse steps either side of
+# each one are searched again at full resolution.
+_PYRAMID_CANDIDATES = 3
+_PYRAMID_CANDIDATE_RADIUS = 2
+# Drift is measured on windows spread along the whole recording, so it needs
+# the whole recording: four hours covers any lecture we record.
+DEFAULT_DRIFT_MAX_SECONDS = 4 * 3600.0
+DEFAULT_DRIFT_WINDOWS = 6
+DEFAULT_DRIFT_WINDOW_SECONDS = 120.0
+# Each window is searched this far either side of where the constant offset
+# puts it. A 0.1% clock difference is 3.6 seconds over an hour.
+DEFAULT_DRIFT_SEARCH_SECONDS = 10.0
+# Consumer clocks disagree by well under 0.5%; a fit beyond that is an outlier
+# window talking, not a clock.
+_MAXIMUM_DRIFT = 0.005
+# The sync is first tried on this much of both files, then on twice as much,
+# until it is decisive or `max_seconds` is reached. The camera often rolls for
+# minutes before the talk, so the first window is not the whole answer.
+DEFAULT_FIRST_WINDOW_SECONDS = 120.0
+# A partial decode is only trusted once both files hold this much talking,
+# measured as envelope steps this far above the quietest tenth of the file.
+_MINIMUM_SPEECH_SECONDS = 30.0
+_SPEECH_RISE = 1.0
+# and once the winning coefficient beats the runner-up peak by this much.
+# Matching recordings score above 0.89 with runners-up well below 0.5.
+_DECISIVE_MARGIN = 0.2
+# Peaks kept besides the winner, so a result can say how close the next
+# candidate came.
+DEFAULT_PEAK_COUNT = 3
+# A winner less than this many times stronger than the runner-up is reported
+# as ambiguous. The runner-up is floored so that a clean match with no real
+# second peak does not divide by almost nothing.
+DEFAULT_MINIMUM_PEAK_RATIO = 1.5
+_SIDELOBE_FLOOR = 0.05
+# Peaks closer than this are one peak, not a winner and its runner-up.
+_PEAK_EXCLUSION_SECONDS = 1.0
 # Lags with less overlap than this are ignored even for very short recordings.
 _MINIMUM_OVERLAP_STEPS = 200
 # A lag that compares less than half of the shorter recording is a coincidence
@@ -57,45 +118,208 @@ class SyncResult:
     confidence: float
     envelope_rate: int
     analyzed_seconds: float
+    # Every distinct peak found, best first, as (offset_seconds, coefficient).
+    peaks: tuple[tuple[float, float], ...] = ()
 
     def offset_frames(self, frame_rate: float) -> int:
         """Return the offset rounded to whole frames of the given timeline."""
         return int(round(self.offset_seconds * frame_rate))
 
+    @property
+    def sidelobe(self) -> float:
+        """Return the coefficient of the strongest peak that lost."""
+        return self.peaks[1][1] if len(self.peaks) > 1 else 0.0
 
-def read_mono_audio(
+    @property
+    def peak_to_sidelobe(self) -> float:
+        """Return how many times the winning peak outscores the runner-up."""
+        return self.confidence / max(self.sidelobe, _SIDELOBE_FLOOR)
+
+    def is_ambiguous(self, minimum_ratio: float = DEFAULT_MINIMUM_PEAK_RATIO) -> bool:
+        """Report whether another offset came too close to trust this one blindly."""
+        return self.peak_to_sidelobe < minimum_ratio
+
+    def to_document(self) -> dict:
+        """Return the result as plain JSON values, for a plan saved to disk."""
+        return {
+            "offset_seconds": self.offset_seconds,
+            "confidence": self.confidence,
+            "envelope_rate": self.envelope_rate,
+            "analyzed_seconds": self.analyzed_seconds,
+            "peaks": [list(peak) for peak in self.peaks],
+        }
+
+    @classmethod
+    def from_document(cls, document: dict) -> "SyncResult":
+        """Rebuild a result written by `to_document`."""
+        try:
+            return cls(
+                offset_seconds=float(document["offset_seconds"]),
+                confidence=float(document["confidence"]),
+                envelope_rate=int(document["envelope_rate"]),
+                analyzed_seconds=float(document["analyzed_seconds"]),
+                peaks=tuple(
+                    (float(lag), float(score)) for lag, score in document.get("peaks", ())
+                ),
+            )
+        except (KeyError, TypeError, ValueError) as error:
+            raise AudioSyncError(f"A saved sync result cannot be read: {error}") from error
+
+
+@dataclass(frozen=True)
+class WindowOffset:
+    """The offset measured on one window, placed at the window's middle."""
+
+    reference_seconds: float
+    offset_seconds: float
+    confidence: float
+
+
+@dataclass(frozen=True)
+class DriftResult:
+    """A constant offset plus the rate at which the two clocks drift apart.
+
+    The target moment that matches `t` seconds into the reference is
+    `offset_seconds + (1 + drift) * t`, so a drift of 0.001 means the target's
+    clock gains a millisecond every second. `windows` keeps every measurement
+    the line was fitted through, so a surprising fit can be checked.
+    """
+
+    offset_seconds: float
+    drift: float
+    confidence: float
+    windows: tuple[WindowOffset, ...]
+
+    def offset_at(self, reference_seconds: float) -> float:
+        """Return the offset that applies `reference_seconds` into the reference."""
+        return self.offset_seconds + self.drift * reference_seconds
+
+
+@dataclass(frozen=True)
+class RecordingAnalysis:
+    """What one decode of a recording yields: its loudness and its peaks.
+
+    Both arrays hold one value per envelope step. `envelope` is what the sync
+    correlates, and `peaks` is the largest amplitude in each step, which is
+    what a silence cut compares against its threshold. `analyze_recording`
+    returns them as the two halves of one float32 buffer, memory-mapped from
+    the cache when there is one, so neither consumer holds a copy.
+    """
+
+    envelope: np.ndarray
+    peaks: np.ndarray
+    envelope_rate: int
+
+    @classmethod
+    def from_buffer(cls, buffer: np.ndarray, envelope_rate: int) -> "RecordingAnalysis":
+        """Split a buffer holding the envelope followed by the peaks into views."""
+        half = buffer.size // 2
+        return cls(envelope=buffer[:half], peaks=buffer[half:], envelope_rate=envelope_rate)
+
+    @property
+    def seconds(self) -> float:
+        return self.envelope.size / self.envelope_rate
+
+
+def _decode_chunks(
     path: Path,
-    sample_rate: int = DEFAULT_SAMPLE_RATE,
-    max_seconds: float = DEFAULT_MAX_SECONDS,
-    ffmpeg: str = "ffmpeg",
-) -> np.ndarray:
-    """Decode the first audio stream of a media file as mono float samples."""
+    sample_rate: int,
+    max_seconds: float,
+    ffmpeg: str,
+    chunk_seconds: float = DEFAULT_CHUNK_SECONDS,
+) -> Iterator[np.ndarray]:
+    """Yield the first audio stream of a media file as mono float32 chunks.
+
+    Every chunk but the last holds exactly `chunk_seconds` of samples. ffmpeg's
+    error text goes to a temporary file rather than a pipe, so a noisy decoder
+    can never fill a pipe nobody is reading and stall the whole decode.
+    """
     if not Path(path).exists():
         raise AudioSyncError(f"Media file was not found: {path}")
 
+    # An infinite `max_seconds` decodes the file to its end.
+    limit = ["-t", f"{max_seconds:.3f}"] if math.isfinite(max_seconds) else []
     command = [
         ffmpeg,
         "-v", "error",
         "-i", str(path),
-        "-t", f"{max_seconds:.3f}",
+        *limit,
         "-vn",
         "-ac", "1",
         "-ar", str(sample_rate),
         "-f", "f32le",
         "-",
     ]
-    try:
-        completed = subprocess.run(command, capture_output=True, check=True)
-    except FileNotFoundError as error:
-        raise AudioSyncError(f"ffmpeg was not found: {ffmpeg}") from error
-    except subprocess.CalledProcessError as error:
-        detail = error.stderr.decode("utf-8", "replace").strip()
-        raise AudioSyncError(f"ffmpeg failed to decode {path}: {detail}") from error
-
-    samples = np.frombuffer(completed.stdout, dtype="<f4")
-    if samples.size == 0:
+    chunk_bytes = max(1, int(chunk_seconds * sample_rate)) * 4
+    with tempfile.TemporaryFile() as errors:
+        try:
+            process = subprocess.Popen(
+                command, stdout=subprocess.PIPE, stderr=errors
+            )
+        except FileNotFoundError as error:
+            raise AudioSyncError(f"ffmpeg was not found: {ffmpeg}") from error
+
+        try:
+            assert process.stdout is not None
+            while True:
+                raw = process.stdout.read(chunk_bytes)
+                if not raw:
+                    break
+                # A short read only happens at the end of the stream, where a
+                # torn sample cannot be completed anyway.
+                usable = len(raw) - len(raw) % 4
+                if usable:
+                    yield np.frombuffer(raw[:usable], dtype="<f4")
+        finally:
+            if process.poll() is None:
+                process.kill()
+            process.stdout.close()
+            returncode = process.wait()
+
+        if returncode != 0:
+            errors.seek(0)
+            detail = errors.read().decode("utf-8", "replace").strip()
+            raise AudioSyncError(f"ffmpeg failed to decode {path}: {detail}")
+
+
+def read_mono_audio(
+    path: Path,
+    sample_rate: int = DEFAULT_SAMPLE_RATE,
+    max_seconds: float = DEFAULT_MAX_SECONDS,
+    ffmpeg: str = "ffmpeg",
+) -> np.ndarray:
+    """Decode the first audio stream of a media file as mono float32 samples.
+
+    The samples stay in ffmpeg's own float32: widening them to float64 doubles
+    the memory of the longest array in the whole sync for no audible precision.
+    """
+    chunks = list(_decode_chunks(path, sample_rate, max_seconds, ffmpeg))
+    if not chunks:
         raise AudioSyncError(f"No audio was decoded from {path}")
-    return samples.astype(np.float64, copy=False)
+    return np.concatenate(chunks)
+
+
+def _check_rates(sample_rate: int, envelope_rate: int) -> int:
+    """Return how many samples make up one envelope step."""
+    if envelope_rate <= 0 or sample_rate <= 0:
+        raise AudioSyncError("Sample rate and envelope rate must be positive")
+    return max(1, sample_rate // envelope_rate)
+
+
+def _block_loudness(blocks: np.ndarray) -> np.ndarray:
+    """Reduce whole envelope steps, one per row, to their loudness.
+
+    The sum of squares is taken by `einsum`, which never builds the squared
+    copy of the samples, and every later step works in place on the one small
+    per-step array. The result keeps the dtype of the samples.
+    """
+    energy = np.einsum("ij,ij->i", blocks, blocks)
+    energy /= blocks.shape[1]
+    np.sqrt(energy, out=energy)
+    # A logarithm keeps quiet speech visible next to loud speech, so the match
+    # is driven by the rhythm of the talking rather than by the loudest moment.
+    energy *= 1000.0
+    return np.log1p(energy, out=energy)
 
 
 def loudness_envelope(
@@ -104,23 +328,146 @@ def loudness_envelope(
     envelope_rate: int = DEFAULT_ENVELOPE_RATE,
 ) -> np.ndarray:
     """Reduce raw samples to one root-mean-square value per envelope step."""
-    if envelope_rate <= 0 or sample_rate <= 0:
-        raise AudioSyncError("Sample rate and envelope rate must be positive")
-
-    block = max(1, sample_rate // envelope_rate)
+    block = _check_rates(sample_rate, envelope_rate)
     usable = (samples.size // block) * block
     if usable == 0:
         raise AudioSyncError("The recording is shorter than one envelope step")
 
-    blocks = samples[:usable].reshape(-1, block)
-    energy = np.sqrt(np.mean(np.square(blocks), axis=1))
-    # A logarithm keeps quiet speech visible next to loud speech, so the match
-    # is driven by the rhythm of the talking rather than by the loudest moment.
-    return np.log1p(energy * 1000.0)
+    return _block_loudness(samples[:usable].reshape(-1, block))
+
+
+def _block_peaks(blocks: np.ndarray) -> np.ndarray:
+    """Reduce whole envelope steps, one per row, to their largest amplitude."""
+    return np.maximum(blocks.max(axis=1), -blocks.min(axis=1))
+
+
+def _step_blocks(
+    path: Path,
+    sample_rate: int,
+    envelope_rate: int,
+    max_seconds: float,
+    ffmpeg: str,
+    chunk_seconds: float = DEFAULT_CHUNK_SECONDS,
+) -> Iterator[np.ndarray]:
+    """Yield a recording's samples as whole envelope steps, one per row.
+
+    The few samples of a chunk that do not fill a step are carried over to the
+    next chunk. Closing the generator early stops ffmpeg, so a caller that has
+    seen enough pays only for what it read.
+    """
+    block = _check_rates(sample_rate, envelope_rate)
+    carry = np.zeros(0, dtype=np.float32)
+    decoded = 0
+    produced = 0
+    for chunk in _decode_chunks(path, sample_rate, max_seconds, ffmpeg, chunk_seconds):
+        decoded += chunk.size
+        samples = np.concatenate((carry, chunk)) if carry.size else chunk
+        usable = (samples.size // block) * block
+        carry = samples[usable:].copy()
+        if usable:
+            produced += usable
+            yield samples[:usable].reshape(-1, block)
+
+    if decoded == 0:
+        raise AudioSyncError(f"No audio was decoded from {path}")
+    if produced == 0:
+        raise AudioSyncError("The recording is shorter than one envelope step")
+
+
+def _envelope_pieces(
+    path: Path,
+    sample_rate: int,
+    envelope_rate: int,
+    max_seconds: float,
+    ffmpeg: str,
+    chunk_seconds: float = DEFAULT_CHUNK_SECONDS,
+) -> Iterator[np.ndarray]:
+    """Yield a recording's loudness envelope one decoded chunk at a time."""
+    blocks = _step_blocks(path, sample_rate, envelope_rate, max_seconds, ffmpeg, chunk_seconds)
+    try:
+        for piece in blocks:
+            yield _block_loudness(piece)
+    finally:
+        blocks.close()
+
+
+def read_loudness_envelope(
+    path: Path,
+    sample_rate: int = DEFAULT_SAMPLE_RATE,
+    envelope_rate: int = DEFAULT_ENVELOPE_RATE,
+    max_seconds: float = DEFAULT_MAX_SECONDS,
+    ffmpeg: str = "ffmpeg",
+    chunk_seconds: float = DEFAULT_CHUNK_SECONDS,
+) -> np.ndarray:
+    """Decode a recording straight into its loudness envelope.
+
+    This is `loudness_envelope(read_mono_audio(...))` without ever holding the
+    whole recording. A multi-hour recording costs one chunk of memory plus the
+    envelope itself.
+    """
+    return np.concatenate(
+        list(
+            _envelope_pieces(
+                path, sample_rate, envelope_rate, max_seconds, ffmpeg, chunk_seconds
+            )
+        )
+    )
+
+
+def analyze_recording(
+    path: Path,
+    sample_rate: int = DEFAULT_SAMPLE_RATE,
+    envelope_rate: int = DEFAULT_ENVELOPE_RATE,
+    max_seconds: float = math.inf,
+    ffmpeg: str = "ffmpeg",
+    cache: EnvelopeCache | None = None,
+    chunk_seconds: float = DEFAULT_CHUNK_SECONDS,
+) -> RecordingAnalysis:
+    """Decode a whole recording once into everything the dual-source route needs.
+
+    The camera file is both synced against the slides and searched for silence.
+    Reading its envelope and its peaks from the same chunks replaces what used
+    to be a decode for the sync, another for the drift and a third inside
+    auto-editor. The whole file is read by default: the sync and the drift only
+    look at their own opening of the envelope, but the silence cut needs every
+    minute, and a cap would silently drop the end of a long recording.
+    """
+    if cache is not None:
+        buffer = cache.load(
+            path, sample_rate, envelope_rate, max_seconds, kind="analysis", mmap_mode="r"
+        )
+        if buffer is not None and buffer.size % 2 == 0:
+            return RecordingAnalysis.from_buffer(buffer, envelope_rate)
+
+    envelope_pieces: list[np.ndarray] = []
+    peak_pieces: list[np.ndarray] = []
+    for blocks in _step_blocks(
+        path, sample_rate, envelope_rate, max_seconds, ffmpeg, chunk_seconds
+    ):
+        peak_pieces.append(_block_peaks(blocks))
+        envelope_pieces.append(_block_loudness(blocks))
+    # The pieces are joined straight into their halves of the shared buffer.
+    steps = sum(piece.size for piece in envelope_pieces)
+    buffer = np.empty(2 * steps, dtype=np.float32)
+    np.concatenate(envelope_pieces, out=buffer[:steps])
+    np.concatenate(peak_pieces, out=buffer[steps:])
+    if cache is not None:
+        cache.store(path, sample_rate, envelope_rate, max_seconds, buffer, kind="analysis")
+        stored = cache.load(
+            path, sample_rate, envelope_rate, max_seconds, kind="analysis", mmap_mode="r"
+        )
+        if stored is not None and stored.size == buffer.size:
+            buffer = stored
+    return RecordingAnalysis.from_buffer(buffer, envelope_rate)
 
 
 def _standardize(envelope: np.ndarray) -> np.ndarray:
-    """Center and scale an envelope so gain differences stop mattering."""
+    """Center and scale an envelope so gain differences stop mattering.
+
+    The envelope is widened to float64 here, where it is already a fortieth of
+    the samples, so the correlation sums keep their full precision.
+    """
+    envelope = np.asarray(envelope, dtype=np.float64)
     centered = envelope - float(np.mean(envelope))
     deviation = float(np.std(centered))
     if deviation <= 0.0:
@@ -128,56 +475,593 @@ def _standardize(envelope: np.ndarray) -> np.ndarray:
     return centered / deviation
 
 
+def _minimum_overlap(first_size: int, second_size: int, minimum_steps: float) -> float:
+    """Return the fewest overlapping steps a lag needs before it may win."""
+    return max(minimum_steps, _MINIMUM_OVERLAP_FRACTION * min(first_size, second_size))
+
+
+def _padded_slice(values: np.ndarray, start: int, stop: int, pad: int) -> np.ndarray:
+    """Return `values[start:stop]` as if `values` had `pad` zeros on either side."""
+    piece = np.zeros(stop - start)
+    inner_start = max(start - pad, 0)
+    inner_stop = min(stop - pad, values.size)
+    if inner_stop > inner_start:
+        offset = inner_start + pad - start
+        piece[offset : offset + inner_stop - inner_start] = values[inner_start:inner_stop]
+    return piece
+
+
+def _top_peaks(scores: np.ndarray, count: int, exclusion: int) -> list[int]:
+    """Return the indexes of the highest distinct peaks, best first.
+
+    Everything within `exclusion` of a chosen peak is its own shoulder rather
+    than a second answer, so it is masked before the next peak is looked for.
+    Only local maxima are candidates at all: a broad peak on a smooth envelope
+    is still falling just outside the mask, and that slope is not a rival.
+    """
+    values = np.asarray(scores, dtype=np.float64)
+    local = np.ones(values.size, dtype=bool)
+    local[1:] &= values[1:] >= values[:-1]
+    local[:-1] &= values[:-1] >= values[1:]
+    remaining = np.where(local, values, -np.inf)
+    peaks: list[int] = []
+    while len(peaks) < count:
+        index = int(np.argmax(remaining))
+        if not np.isfinite(remaining[index]):
+            break
+        peaks.append(index)
+        remaining[max(0, index - exclusion) : index + exclusion + 1] = -np.inf
+    return peaks
+
+
+def _merge_peaks(
+    peaks: list[tuple[int, float]], count: int, exclusion: int
+) -> list[tuple[int, float]]:
+    """Keep the best `count` lags that are more than `exclusion` steps apart."""
+    kept: list[tuple[int, float]] = []
+    for lag, score in sorted(peaks, key=lambda peak: peak[1], reverse=True):
+        if all(abs(lag - other) > exclusion for other, _ in kept):
+            kept.append((lag, score))
+            if len(kept) == count:
+                break
+    return kept
+
+
+def _correlation_peaks(
+    first: np.ndarray,
+    second: np.ndarray,
+    count: int = 1,
+    exclusion: int = 0,
+    minimum_steps: float = _MINIMUM_OVERLAP_STEPS,
+) -> list[tuple[int, float]]:
+    """Return the best lags of two standardized envelopes and their coefficients.
+
+    A lag is the step of `second` that lines up with step zero of `first`. The
+    correlation is computed overlap-save: the shorter envelope is transformed
+    once, and the longer one streams past it in blocks about as long as the
+    shorter one, keeping only the running best peaks. Memory therefore follows
+    the shorter recording, never the sum of both.
+    """
+    # Correlation is symmetric under swapping the inputs and negating the lag,
+    # so the shorter envelope always plays the fixed filter.
+    if first.size > second.size:
+        swapped = _correlation_peaks(second, first, count, exclusion, minimum_steps)
+        return [(-lag, score) for lag, score in swapped]
+
+    minimum = _minimum_overlap(first.size, second.size, minimum_steps)
+    pad = first.size - 1
+    total = first.size + second.size - 1
+    transform_size = int(1 << (2 * first.size - 1).bit_length())
+    block = transform_size - pad
+    # The filter's spectrum is conjugated once, which turns every block's
+    # product into a correlation rather than a convolution.
+    filter_spectrum = np.conj(np.fft.rfft(first, transform_size))
+
+    peaks: list[tuple[int, float]] = []
+    for position in range(0, total, block):
+        length = min(block, total - position)
+        segment = _padded_slice(second, position, position + length + pad, pad)
+        correlation = np.fft.irfft(
+            np.fft.rfft(segment, transform_size) * filter_spectrum, transform_size
+        )[:length]
+
+        # Long overlaps accumulate larger sums than short ones, so every lag is
+        # divided by how many steps actually overlap there.
+        lags = np.arange(position, position + length) - pad
+        overlap = np.minimum(
+            first.size + np.minimum(lags, 0), second.size - np.maximum(lags, 0)
+        )
+        # Lags that barely overlap are noise, not evidence, so they never win.
+        scores = np.where(overlap >= minimum, correlation / overlap, -np.inf)
+        found = [
+            (int(lags[index]), float(scores[index]))
+            for index in _top_peaks(scores, count, exclusion)
+        ]
+        peaks = _merge_peaks(peaks + found, count, exclusion)
+
+    if not peaks:
+        raise AudioSyncError("The recordings are too short to be compared")
+    return peaks
+
+
+def _lag_score(first: np.ndarray, second: np.ndarray, lag: int) -> tuple[float, int]:
+    """Return the correlation coefficient at one lag and how many steps overlap."""
+    if lag >= 0:
+        overlap = min(first.size, second.size - lag)
+        if overlap <= 0:
+            return -np.inf, 0
+        total = np.dot(first[:overlap], second[lag : lag + overlap])
+    else:
+        overlap = min(first.size + lag, second.size)
+        if overlap <= 0:
+            return -np.inf, 0
+        total = np.dot(first[-lag : -lag + overlap], second[:overlap])
+    return float(total) / overlap, overlap
+
+
+def _parabolic_shift(before: float, peak: float, after: float) -> float:
+    """Return where a parabola through three neighbouring scores peaks.
+
+    The answer is relative to the middle score, in steps, and never more than
+    half a step away: anything further would mean the middle was not the peak.
+    """
+    if not (np.isfinite(before) and np.isfinite(after)):
+        return 0.0
+    curvature = before - 2.0 * peak + after
+    if curvature >= 0.0:
+        return 0.0
+    return float(np.clip(0.5 * (before - after) / curvature, -0.5, 0.5))
+
+
+def decimate_envelope(envelope: np.ndarray, factor: int) -> np.ndarray:
+    """Average every `factor` envelope steps into one, dropping a partial tail."""
+    if factor <= 1:
+        return envelope
+    usable = (envelope.size // factor) * factor
+    return envelope[:usable].reshape(-1, factor).mean(axis=1)
+
+
+def _refine_candidates(
+    first: np.ndarray,
+    second: np.ndarray,
+    centers: list[int],
+    radius: int,
+) -> list[tuple[int, float]]:
+    """Return the best full-resolution lag near each coarse candidate."""
+    minimum = _minimum_overlap(first.size, second.size, _MINIMUM_OVERLAP_STEPS)
+    refined: list[tuple[int, float]] = []
+    for center in centers:
+        best_lag, best_score = center, -np.inf
+        for lag in range(center - radius, center + radius + 1):
+            score, overlap = _lag_score(first, second, lag)
+            if overlap >= minimum and score > best_score:
+                best_lag, best_score = lag, score
+        if np.isfinite(best_score):
+            refined.append((best_lag, best_score))
+    if not refined:
+        raise AudioSyncError("The recordings are too short to be compared")
+    return refined
+
+
+def correlation_peaks(
+    reference: np.ndarray,
+    target: np.ndarray,
+    envelope_rate: int = DEFAULT_ENVELOPE_RATE,
+    coarse_rate: int | None = None,
+    count: int = DEFAULT_PEAK_COUNT,
+) -> list[tuple[float, float]]:
+    """Return up to `count` distinct lags in seconds with their coefficients.
+
+    The best lag comes first and is refined to a fraction of a step; the others
+    are the strongest peaks at least a second away from every better one, which
+    is what a wrong match on a repeated phrase would look like. All of them come
+    out of the same streamed transform as the winner.
+    """
+    first = _standardize(reference)
+    second = _standardize(target)
+    exclusion = int(round(_PEAK_EXCLUSION_SECONDS * envelope_rate))
+
+    factor = envelope_rate // coarse_rate if coarse_rate else 1
+    if factor > 1:
+        coarse = _correlation_peaks(
+            _standardize(decimate_envelope(first, factor)),
+            _standardize(decimate_envelope(second, factor)),
+            max(count, _PYRAMID_CANDIDATES),
+            _PYRAMID_CANDIDATE_RADIUS,
+            _MINIMUM_OVERLAP_STEPS / factor,
+        )
+        peaks = _merge_peaks(
+            _refine_candidates(
+                first,
+                second,
+                [lag * factor for lag, _ in coarse],
+                _PYRAMID_CANDIDATE_RADIUS * factor,
+            ),
+            count,
+            exclusion,
+        )
+    else:
+        # Both envelopes are already centered and scaled, so dividing by the
+        # overlap turns the winning sum into the correlation coefficient.
+        peaks = _correlation_peaks(first, second, count, exclusion)
+
+    # The true peak rarely falls exactly on an envelope step. Fitting a parabola
+    # through the peak and its neighbours recovers the fraction of a step.
+    lag_steps, confidence = peaks[0]
+    minimum = _minimum_overlap(first.size, second.size, _MINIMUM_OVERLAP_STEPS)
+    neighbours = []
+    for lag in (lag_steps - 1, lag_steps + 1):
+        score, overlap = _lag_score(first, second, lag)
+        neighbours.append(score if overlap >= minimum else -np.inf)
+    shift = _parabolic_shift(neighbours[0], confidence, neighbours[1])
+
+    ranked = [((lag_steps + shift) / envelope_rate, confidence)]
+    ranked.extend((lag / envelope_rate, score) for lag, score in peaks[1:])
+    return ranked
+
+
 def correlate_envelopes(
     reference: np.ndarray,
     target: np.ndarray,
     envelope_rate: int = DEFAULT_ENVELOPE_RATE,
+    coarse_rate: int | None = None,
 ) -> tuple[float, float]:
     """Return the target lag in seconds and how strongly the peak stands out.
 
     The lag is the point in the target that matches time zero of the reference,
     so a positive lag means the target already contains what the reference is
     still waiting for.
+
+    With a `coarse_rate`, the whole range of lags is searched on envelopes
+    averaged down to that rate, and only the few lags around the best coarse
+    candidates are scored at full resolution. The transform then shrinks by the
+    decimation factor, which is what lets hours of recording be compared.
     """
-    first = _standardize(reference)
-    second = _standardize(target)
+    return correlation_peaks(reference, target, envelope_rate, coarse_rate, 1)[0]
 
-    # Correlating is convolving with the reversed signal, which the FFT does in
-    # one pass instead of the quadratic loop a direct correlation would need.
-    size = first.size + second.size - 1
-    transform_size = int(1 << (size - 1).bit_length())
-    spectrum = np.fft.rfft(first, transform_size) * np.fft.rfft(
-        second[::-1], transform_size
-    )
-    correlation = np.fft.irfft(spectrum, transform_size)[:size]
 
-    # Long overlaps accumulate larger sums than short ones, so every lag is
-    # divided by how many steps actually overlap there.
-    positions = np.arange(size)
-    overlap = np.minimum(
-        np.minimum(positions + 1, size - positions),
-        min(first.size, second.size),
-    )
-    normalized = correlation / overlap
+def _checkpoints(max_seconds: float) -> list[float]:
+    """Return the growing decode lengths at which a sync is attempted."""
+    checkpoints: list[float] = []
+    window = DEFAULT_FIRST_WINDOW_SECONDS
+    while window < max_seconds:
+        checkpoints.append(window)
+        window *= 2
+    checkpoints.append(max_seconds)
+    return checkpoints
 
-    # Lags that barely overlap are noise, not evidence, so they never win.
-    usable = overlap >= max(
-        _MINIMUM_OVERLAP_STEPS, _MINIMUM_OVERLAP_FRACTION * min(first.size, second.size)
-    )
-    if not usable.any():
-        raise AudioSyncError("The recordings are too short to be compared")
 
-    candidates = np.where(usable, normalized, -np.inf)
-    peak_index = int(np.argmax(candidates))
+def _speech_seconds(envelope: np.ndarray, steps_per_second: float) -> float:
+    """Return how many seconds of an envelope stand clearly above its room tone."""
+    floor = float(np.percentile(envelope, 10))
+    return float(np.count_nonzero(envelope > floor + _SPEECH_RISE)) / steps_per_second
+
+
+def _settles(
+    reference: np.ndarray,
+    target: np.ndarray,
+    envelope_rate: int,
+    steps_per_second: float,
+    minimum_confidence: float,
+) -> bool:
+    """Report whether a partial decode already gives an answer that cannot change.
+
+    Both envelopes need enough talking to be evidence, and the best lag has to
+    beat both the confidence bar and the runner-up by a clear margin. Anything
+    less waits for more audio rather than risk stopping on a lucky peak.
+    """
+    if min(
+        _speech_seconds(reference, steps_per_second),
+        _speech_seconds(target, steps_per_second),
+    ) < _MINIMUM_SPEECH_SECONDS:
+        return False
+    try:
+        ranked = correlation_peaks(reference, target, envelope_rate, None, 2)
+    except AudioSyncError:
+        return False
+    best = ranked[0][1]
+    runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+    return best >= minimum_confidence and best - runner_up >= _DECISIVE_MARGIN
+
 
-    # Both envelopes are already centered and scaled, so dividing by the overlap
-    # turns the winning sum into the correlation coefficient at that lag.
-    confidence = float(normalized[peak_index])
+def default_cache_dir() -> Path:
+    """Return where envelopes are kept between runs.
 
-    # A correlation index counts how far the reference moved; the caller asks
-    # the opposite question, so the sign is flipped back here.
-    lag_steps = (second.size - 1) - peak_index
-    return lag_steps / envelope_rate, confidence
+    The recordings sit in a synced OneDrive folder, so the cache deliberately
+    lives in the local application data instead of next to them.
+    """
+    local = os.environ.get("LOCALAPPDATA")
+    base = Path(local) if local else Path.home() / ".cache"
+    return base / "DavinciResolveScripts" / "envelopes"
+
+
+class EnvelopeCache:
+    """Loudness envelopes kept on disk, keyed by the identity of their file.
+
+    A key covers the file's path, size and modification time plus every setting
+    that shapes the envelope, so a re-recorded or edited file and a changed
+    setting are both simply misses. Entries are compact float32 `.npy` files;
+    once they exceed `max_bytes` the least recently used are deleted. Every
+    failure to read or write the cache falls back to decoding, because a cache
+    must never be the reason a sync fails.
+    """
+
+    def __init__(
+        self, directory: Path | None = None, max_bytes: int = DEFAULT_CACHE_BYTES
+    ) -> None:
+        self.directory = Path(directory) if directory is not None else default_cache_dir()
+        self.max_bytes = max_bytes
+
+    def _entry(
+        self,
+        path: Path,
+        sample_rate: int,
+        envelope_rate: int,
+        max_seconds: float,
+        kind: str = "envelope",
+    ) -> Path | None:
+        try:
+            status = Path(path).stat()
+            resolved = str(Path(path).resolve())
+        except OSError:
+            return None
+        fields = [
+            resolved,
+            status.st_size,
+            status.st_mtime_ns,
+            sample_rate,
+            envelope_rate,
+            round(max_seconds, 3),
+        ]
+        # Envelopes were cached before anything else was, so their keys stay
+        # as they were and only other kinds of array add their name.
+        if kind != "envelope":
+            fields.append(kind)
+        identity = json.dumps(fields)
+        digest = hashlib.sha1(identity.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.npy"
+
+    def load(
+        self,
+        path: Path,
+        sample_rate: int,
+        envelope_rate: int,
+        max_seconds: float,
+        kind: str = "envelope",
+        mmap_mode: str | None = None,
+    ) -> np.ndarray | None:
+        """Return the stored envelope of a file, or None when it has to be decoded.
+
+        With a `mmap_mode` the entry is mapped instead of read, so a caller that
+        only slices it never copies it into memory.
+        """
+        entry = self._entry(path, sample_rate, envelope_rate, max_seconds, kind)
+        if entry is None or not entry.exists():
+            return None
+        try:
+            envelope = np.load(entry, allow_pickle=False, mmap_mode=mmap_mode)
+            # Touching the entry is what makes eviction least recently used
+            # rather than least recently written.
+            os.utime(entry)
+        except (OSError, ValueError):
+            entry.unlink(missing_ok=True)
+            return None
+        if envelope.ndim != 1 or envelope.size == 0:
+            # Windows refuses to delete a file that is still mapped.
+            del envelope
+            entry.unlink(missing_ok=True)
+            return None
+        return envelope.astype(np.float32, copy=False)
+
+    def store(
+        self,
+        path: Path,
+        sample_rate: int,
+        envelope_rate: int,
+        max_seconds: float,
+        envelope: np.ndarray,
+        kind: str = "envelope",
+    ) -> None:
+        """Keep an envelope for the next run and trim the cache to its budget."""
+        entry = self._entry(path, sample_rate, envelope_rate, max_seconds, kind)
+        if entry is None:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Written under a temporary name first, so a run that is killed
+            # halfway never leaves a truncated entry behind for the next one.
+            partial = entry.with_name(f"{entry.stem}.{os.getpid()}.partial.npy")
+            np.save(partial, envelope.astype(np.float32))
+            os.replace(partial, entry)
+            self._evict()
+        except OSError:
+            return
+
+    def _evict(self) -> None:
+        entries = []
+        for entry in self.directory.glob("*.npy"):
+            try:
+                status = entry.stat()
+            except OSError:
+                continue
+            entries.append((status.st_mtime, status.st_size, entry))
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+
+
+def read_cached_envelope(
+    path: Path,
+    sample_rate: int = DEFAULT_SAMPLE_RATE,
+    envelope_rate: int = DEFAULT_ENVELOPE_RATE,
+    max_seconds: float = DEFAULT_MAX_SECONDS,
+    ffmpeg: str = "ffmpeg",
+    cache: EnvelopeCache | None = None,
+) -> np.ndarray:
+    """Return a recording's envelope from the cache, decoding it only on a miss."""
+    if cache is None:
+        return read_loudness_envelope(path, sample_rate, envelope_rate, max_seconds, ffmpeg)
+    envelope = cache.load(path, sample_rate, envelope_rate, max_seconds)
+    if envelope is None:
+        envelope = read_loudness_envelope(
+            path, sample_rate, envelope_rate, max_seconds, ffmpeg
+        )
+        cache.store(path, sample_rate, envelope_rate, max_seconds, envelope)
+    return envelope
+
+
+def read_envelope_pair(
+    reference_path: Path,
+    target_path: Path,
+    sample_rate: int = DEFAULT_SAMPLE_RATE,
+    envelope_rate: int = DEFAULT_ENVELOPE_RATE,
+    max_seconds: float = DEFAULT_MAX_SECONDS,
+    ffmpeg: str = "ffmpeg",
+    cache: EnvelopeCache | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Decode both recordings at the same time and return their envelopes.
+
+    Each decode is its own ffmpeg process and spends its time waiting on the
+    disk and the codec, so two threads overlap them almost perfectly. The
+    results are collected reference first, which keeps the error a caller sees
+    the same as when the files were decoded one after the other.
+    """
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="audio-sync") as pool:
+        reference = pool.submit(
+            read_cached_envelope,
+            reference_path, sample_rate, envelope_rate, max_seconds, ffmpeg, cache,
+        )
+        target = pool.submit(
+            read_cached_envelope,
+            target_path, sample_rate, envelope_rate, max_seconds, ffmpeg, cache,
+        )
+        return reference.result(), target.result()
+
+
+def _cached_adaptive_pair(
+    reference_path: Path,
+    target_path: Path,
+    sample_rate: int,
+    envelope_rate: int,
+    minimum_confidence: float,
+    checkpoints: list[float],
+    cache: EnvelopeCache,
+) -> tuple[np.ndarray, np.ndarray] | None:
+    """Return a cached pair that an earlier adaptive run stopped on, if any."""
+    steps_per_second = sample_rate / _check_rates(sample_rate, envelope_rate)
+    for checkpoint in checkpoints:
+        reference = cache.load(reference_path, sample_rate, envelope_rate, checkpoint)
+        target = cache.load(target_path, sample_rate, envelope_rate, checkpoint)
+        if reference is None or target is None:
+            continue
+        if checkpoint == checkpoints[-1] or _settles(
+            reference, target, envelope_rate, steps_per_second, minimum_confidence
+        ):
+            return reference, target
+    return None
+
+
+def _joined(pieces: list[np.ndarray]) -> np.ndarray:
+    """Concatenate envelope pieces, handing a lone piece back without a copy."""
+    return pieces[0] if len(pieces) == 1 else np.concatenate(pieces)
+
+
+def read_envelope_pair_adaptively(
+    reference_path: Path,
+    target_path: Path,
+    sample_rate: int = DEFAULT_SAMPLE_RATE,
+    envelope_rate: int = DEFAULT_ENVELOPE_RATE,
+    max_seconds: float = DEFAULT_MAX_SECONDS,
+    minimum_confidence: float = DEFAULT_MINIMUM_CONFIDENCE,
+    ffmpeg: str = "ffmpeg",
+    cache: EnvelopeCache | None = None,
+    target_envelope: np.ndarray | None = None,
+    reference_envelope: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Decode both recordings only as far as the sync needs.
+
+    Both files are read side by side in growing windows, two minutes first and
+    then twice as much each time. After every window the envelopes so far are
+    correlated, and once the answer is decisive both ffmpeg processes are
+    stopped. A camera that rolled through a long silent setup simply keeps
+    reading until the talk starts; a pair that never settles is read up to
+    `max_seconds`, exactly as `read_envelope_pair` would.
+
+    A `target_envelope` that was already read, by `analyze_recording` for
+    instance, stands in for decoding the target at all, and a
+    `reference_envelope` does the same for the reference. With both in hand
+    nothing is left to decode, so there is nothing to stop early either.
+    """
+    block = _check_rates(sample_rate, envelope_rate)
+    steps_per_second = sample_rate / block
+    limit = int(round(max_seconds * steps_per_second))
+    if reference_envelope is not None and target_envelope is not None:
+        return reference_envelope[:limit], target_envelope[:limit]
+    checkpoints = _checkpoints(max_seconds)
+    if cache is not None:
+        cached = _cached_adaptive_pair(
+            reference_path, target_path, sample_rate, envelope_rate,
+            minimum_confidence, checkpoints, cache,
+        )
+        if cached is not None:
+            return cached
+
+    paths = (reference_path, target_path)
+    streams = [
+        _envelope_pieces(path, sample_rate, envelope_rate, max_seconds, ffmpeg)
+        if known is None
+        else (piece for piece in (known[:limit],))
+        for path, known in zip(paths, (reference_envelope, target_envelope))
+    ]
+    pieces: list[list[np.ndarray]] = [[], []]
+    steps = [0, 0]
+    finished = [False, False]
+    try:
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="audio-sync") as pool:
+            for checkpoint in checkpoints:
+                wanted = int(round(checkpoint * steps_per_second))
+                while True:
+                    pending = {
+                        index: pool.submit(next, streams[index], None)
+                        for index in (0, 1)
+                        if not finished[index] and steps[index] < wanted
+                    }
+                    if not pending:
+                        break
+                    # Reference first, so a caller sees the same error as
+                    # with files decoded one after the other.
+                    for index in sorted(pending):
+                        piece = pending[index].result()
+                        if piece is None:
+                            finished[index] = True
+                        else:
+                            pieces[index].append(piece)
+                            steps[index] += piece.size
+                if all(finished) or checkpoint == checkpoints[-1]:
+                    break
+                reference, target = (_joined(piece_list)[:wanted] for piece_list in pieces)
+                if _settles(
+                    reference, target, envelope_rate, steps_per_second,
+                    minimum_confidence,
+                ):
+                    if cache is not None:
+                        for path, envelope in zip(paths, (reference, target)):
+                            cache.store(
+                                path, sample_rate, envelope_rate, checkpoint, envelope
+                            )
+                    return reference, target
+    finally:
+        for stream in streams:
+            stream.close()
+
+    envelopes = (_joined(pieces[0]), _joined(pieces[1]))
+    if cache is not None:
+        for path, envelope in zip(paths, envelopes):
+            cache.store(path, sample_rate, envelope_rate, max_seconds, envelope)
+    return envelopes
 
 
 def estimate_offset(
@@ -188,17 +1072,35 @@ def estimate_offset(
     max_seconds: float = DEFAULT_MAX_SECONDS,
     minimum_confidence: float = DEFAULT_MINIMUM_CONFIDENCE,
     ffmpeg: str = "ffmpeg",
+    cache: EnvelopeCache | None = None,
+    target_envelope: np.ndarray | None = None,
+    reference_envelope: np.ndarray | None = None,
 ) -> SyncResult:
-    """Find where the reference recording's time zero sits inside the target file."""
-    reference_samples = read_mono_audio(reference_path, sample_rate, max_seconds, ffmpeg)
-    target_samples = read_mono_audio(target_path, sample_rate, max_seconds, ffmpeg)
+    """Find where the reference recording's time zero sits inside the target file.
 
-    reference_envelope = loudness_envelope(reference_samples, sample_rate, envelope_rate)
-    target_envelope = loudness_envelope(target_samples, sample_rate, envelope_rate)
+    Only as much of both files is decoded as it takes to get a decisive answer,
+    so `analyzed_seconds` is often well below `max_seconds`. With a `cache`, a
+    recording analyzed by an earlier run is not decoded again, and with a
+    `target_envelope` or a `reference_envelope` that file is not decoded at all.
+    """
+    reference_envelope, target_envelope = read_envelope_pair_adaptively(
+        reference_path, target_path, sample_rate, envelope_rate, max_seconds,
+        minimum_confidence, ffmpeg, cache, target_envelope, reference_envelope,
+    )
 
-    offset_seconds, confidence = correlate_envelopes(
-        reference_envelope, target_envelope, envelope_rate
+    # Short recordings are cheap to search exhaustively; long ones go through
+    # the coarse search first so the transform stays small.
+    long_recording = (
+        min(reference_envelope.size, target_envelope.size) / envelope_rate
+        >= PYRAMID_MINIMUM_SECONDS
     )
+    peaks = correlation_peaks(
+        reference_envelope,
+        target_envelope,
+        envelope_rate,
+        coarse_rate=DEFAULT_COARSE_RATE if long_recording else None,
+    )
+    offset_seconds, confidence = peaks[0]
     if confidence < minimum_confidence:
         raise AudioSyncError(
             "The two recordings did not correlate strongly enough "
@@ -206,48 +1108,325 @@ def estimate_offset(
             "Check that both files belong to the same session and carry audio."
         )
 
-    analyzed_seconds = min(reference_samples.size, target_samples.size) / sample_rate
+    block = _check_rates(sample_rate, envelope_rate)
+    analyzed_seconds = (
+        min(reference_envelope.size, target_envelope.size) * block / sample_rate
+    )
     return SyncResult(
         offset_seconds=offset_seconds,
         confidence=confidence,
         envelope_rate=envelope_rate,
         analyzed_seconds=analyzed_seconds,
+        peaks=tuple(peaks),
+    )
+
+
+def _window_offset(
+    reference: np.ndarray,
+    target: np.ndarray,
+    envelope_rate: int,
+    start: int,
+    length: int,
+    predicted_offset: float,
+    search: int,
+) -> WindowOffset | None:
+    """Measure the offset of one reference window inside the target around a guess."""
+    window = reference[start : start + length]
+    expected = start + int(round(predicted_offset * envelope_rate))
+    lower = max(0, expected - search)
+    upper = min(target.size, expected + length + search)
+    if upper - lower < length:
+        return None
+    try:
+        lag, confidence = correlate_envelopes(window, target[lower:upper], envelope_rate)
+    except AudioSyncError:
+        return None
+    # One lag fits the whole window best where the drift has moved it by its
+    # average, which is in the middle of the window rather than at its start.
+    return WindowOffset(
+        reference_seconds=(start + length / 2) / envelope_rate,
+        offset_seconds=(lower - start) / envelope_rate + lag,
+        confidence=confidence,
+    )
+
+
+def measure_drift(
+    reference: np.ndarray,
+    target: np.ndarray,
+    envelope_rate: int,
+    offset_seconds: float,
+    windows: int = DEFAULT_DRIFT_WINDOWS,
+    window_seconds: float = DEFAULT_DRIFT_WINDOW_SECONDS,
+    search_seconds: float = DEFAULT_DRIFT_SEARCH_SECONDS,
+    minimum_confidence: float = DEFAULT_MINIMUM_CONFIDENCE,
+) -> DriftResult:
+    """Fit a constant offset and a clock drift through windows along the recording.
+
+    `offset_seconds` is the constant offset already measured on the opening, so
+    each window only has to be searched a few seconds either side of it. The
+    windows are independent of each other and run on a thread pool; the dot
+    products and transforms they spend their time in work outside the GIL.
+    """
+    length = int(min(window_seconds * envelope_rate, reference.size // 2))
+    if windows < 2 or length < _MINIMUM_OVERLAP_STEPS:
+        raise AudioSyncError("The recording is too short to measure a drift")
+    search = int(round(search_seconds * envelope_rate))
+    starts = np.linspace(0, reference.size - length, windows).astype(int)
+
+    workers = min(windows, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="drift") as pool:
+        measured = list(
+            pool.map(
+                lambda start: _window_offset(
+                    reference, target, envelope_rate, int(start), length,
+                    offset_seconds, search,
+                ),
+                starts,
+            )
+        )
+
+    trusted = tuple(
+        window
+        for window in measured
+        if window is not None and window.confidence >= minimum_confidence
+    )
+    if len(trusted) < 2:
+        raise AudioSyncError(
+            "Too few windows along the recording correlated to measure a drift"
+        )
+
+    times = np.array([window.reference_seconds for window in trusted])
+    offsets = np.array([window.offset_seconds for window in trusted])
+    weights = np.array([window.confidence for window in trusted])
+    drift, intercept = np.polyfit(times, offsets, 1, w=weights)
+    if abs(drift) > _MAXIMUM_DRIFT:
+        raise AudioSyncError(
+            f"The measured drift of {drift * 1e6:.0f} ppm is not a clock difference"
+        )
+    return DriftResult(
+        offset_seconds=float(intercept),
+        drift=float(drift),
+        confidence=float(weights.min()),
+        windows=trusted,
+    )
+
+
+def estimate_drift(
+    reference_path: Path,
+    target_path: Path,
+    sync: SyncResult,
+    sample_rate: int = DEFAULT_SAMPLE_RATE,
+    max_seconds: float = DEFAULT_DRIFT_MAX_SECONDS,
+    minimum_confidence: float = DEFAULT_MINIMUM_CONFIDENCE,
+    ffmpeg: str = "ffmpeg",
+    cache: EnvelopeCache | None = None,
+    target_envelope: np.ndarray | None = None,
+    reference_envelope: np.ndarray | None = None,
+) -> DriftResult:
+    """Measure how far the two recordings' clocks drift apart over their length.
+
+    `sync` is the constant offset `estimate_offset` found on the opening; this
+    refines it into an offset plus a drift using the whole of both recordings.
+    A `target_envelope` or `reference_envelope` that was already read saves
+    decoding that file again.
+    """
+    limit = int(round(max_seconds * sync.envelope_rate))
+    if target_envelope is None and reference_envelope is None:
+        reference, target = read_envelope_pair(
+            reference_path, target_path, sample_rate, sync.envelope_rate, max_seconds,
+            ffmpeg, cache,
+        )
+    else:
+        reference, target = (
+            read_cached_envelope(
+                path, sample_rate, sync.envelope_rate, max_seconds, ffmpeg, cache
+            )
+            if known is None
+            else known[:limit]
+            for path, known in (
+                (reference_path, reference_envelope),
+                (target_path, target_envelope),
+            )
+        )
+    return measure_drift(
+        reference,
+        target,
+        sync.envelope_rate,
+        sync.offset_seconds,
+        minimum_confidence=minimum_confidence,
     )
 
 
+def _result_fields(result: SyncResult, frame_rate: float) -> dict:
+    """Return the JSON fields the command line reports for one result."""
+    return {
+        "offset_seconds": round(result.offset_seconds, 4),
+        "offset_frames": result.offset_frames(frame_rate),
+        "confidence": round(result.confidence, 2),
+        "analyzed_seconds": round(result.analyzed_seconds, 1),
+        "peak_to_sidelobe": round(result.peak_to_sidelobe, 2),
+        "ambiguous": result.is_ambiguous(),
+    }
+
+
+def _sync_report(
+    folder: Path,
+    slides: Path,
+    camera: Path,
+    frame_rate: float,
+    max_seconds: float,
+    minimum_confidence: float,
+    use_cache: bool,
+) -> dict:
+    """Sync one lecture folder and describe the outcome as one report line.
+
+    A failure is a line of the report rather than an exception, so one broken
+    folder never loses the results of the rest of the course. Only paths cross
+    into the worker process, never the pair itself.
+    """
+    started = time.perf_counter()
+    report = {"folder": str(folder), "slides": slides.name, "camera": camera.name}
+    try:
+        result = estimate_offset(
+            slides,
+            camera,
+            max_seconds=max_seconds,
+            minimum_confidence=minimum_confidence,
+            cache=EnvelopeCache() if use_cache else None,
+        )
+    except Exception as error:
+        # A vanished file or a worker out of memory is just as much one
+        # folder's problem as a recording that does not correlate.
+        report["error"] = str(error) or repr(error)
+    else:
+        report.update(_result_fields(result, frame_rate))
+    report["seconds"] = round(time.perf_counter() - started, 2)
+    return report
+
+
+def batch_sync(
+    working_dir: Path,
+    report_path: Path,
+    frame_rate: float = 30.0,
+    max_seconds: float = DEFAULT_MAX_SECONDS,
+    minimum_confidence: float = DEFAULT_MINIMUM_CONFIDENCE,
+    workers: int | None = None,
+    use_cache: bool = True,
+) -> tuple[dict, ...]:
+    """Sync every lecture folder of a working directory into one JSON lines report.
+
+    Each folder is a separate process, so a whole course pays the interpreter
+    and NumPy start-up once per worker instead of once per folder. Lines are
+    written in folder order as soon as they are known, so an interrupted run
+    still leaves every finished folder in the report.
+    """
+    pairs = dual_source.find_recording_pairs(working_dir)
+    if not pairs:
+        raise AudioSyncError(f"No folder with one .mkv and one .mp4 in {working_dir}")
+
+    workers = workers or max(1, min(len(pairs), (os.cpu_count() or 2) // 2))
+    reports: list[dict] = []
+    report_path = Path(report_path)
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    with report_path.open("w", encoding="utf-8") as output, ProcessPoolExecutor(
+        max_workers=workers
+    ) as pool:
+        for report in pool.map(
+            _sync_report,
+            [pair.folder for pair in pairs],
+            [pair.slides for pair in pairs],
+            [pair.camera for pair in pairs],
+            [frame_rate] * len(pairs),
+            [max_seconds] * len(pairs),
+            [minimum_confidence] * len(pairs),
+            [use_cache] * len(pairs),
+        ):
+            output.write(json.dumps(report, ensure_ascii=False) + "\n")
+            output.flush()
+            reports.append(report)
+    return tuple(reports)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description=__doc__)
-    parser.add_argument("reference", type=Path, help="Recording that defines time zero")
-    parser.add_argument("target", type=Path, help="Recording to align to the reference")
+    parser.add_argument(
+        "reference", type=Path, nargs="?", help="Recording that defines time zero"
+    )
+    parser.add_argument(
+        "target", type=Path, nargs="?", help="Recording to align to the reference"
+    )
+    parser.add_argument(
+        "--batch",
+        type=Path,
+        metavar="WORKING_DIR",
+        help="Sync every folder holding one .mkv and one .mp4 inside this directory",
+    )
+    parser.add_argument(
+        "--report",
+        type=Path,
+        help="Where the batch writes its JSON lines (default: WORKING_DIR/audio_sync.jsonl)",
+    )
+    parser.add_argument("--workers", type=int, help="Folders synced at the same time")
     parser.add_argument("--frame-rate", type=float, default=30.0)
     parser.add_argument("--max-seconds", type=float, default=DEFAULT_MAX_SECONDS)
     parser.add_argument(
         "--minimum-confidence", type=float, default=DEFAULT_MINIMUM_CONFIDENCE
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Decode both files even when their envelopes are already cached",
+    )
     arguments = parser.parse_args()
 
+    if arguments.batch is not None:
+        if arguments.reference is not None:
+            parser.error("--batch takes a working directory instead of two files")
+        report_path = arguments.report or arguments.batch / "audio_sync.jsonl"
+        try:
+            reports = batch_sync(
+                arguments.batch,
+                report_path,
+                frame_rate=arguments.frame_rate,
+                max_seconds=arguments.max_seconds,
+                minimum_confidence=arguments.minimum_confidence,
+                workers=arguments.workers,
+                use_cache=not arguments.no_cache,
+            )
+        except AudioSyncError as error:
+            print(json.dumps({"error": str(error)}, ensure_ascii=False))
+            return 1
+        failed = sum(1 for report in reports if "error" in report)
+        ambiguous = sum(1 for report in reports if report.get("ambiguous"))
+        print(
+            json.dumps(
+                {
+                    "report": str(report_path),
+                    "folders": len(reports),
+                    "failed": failed,
+                    "ambiguous": ambiguous,
+                },
+                ensure_ascii=False,
+            )
+        )
+        return 1 if failed else 0
+
+    if arguments.reference is None or arguments.target is None:
+        parser.error("give a reference and a target recording, or --batch")
+
     try:
         result = estimate_offset(
             arguments.reference,
             arguments.target,
             max_seconds=arguments.max_seconds,
             minimum_confidence=arguments.minimum_confidence,
+            cache=None if arguments.no_cache else EnvelopeCache(),
         )
     except AudioSyncError as error:
         print(json.dumps({"error": str(error)}, ensure_ascii=False))
         return 1
 
-    print(
-        json.dumps(
-            {
-                "offset_seconds": round(result.offset_seconds, 4),
-                "offset_frames": result.offset_frames(arguments.frame_rate),
-                "confidence": round(result.confidence, 2),
-                "analyzed_seconds": round(result.analyzed_seconds, 1),
-            },
-            ensure_ascii=False,
-        )
-    )
+    print(json.dumps(_result_fields(result, arguments.frame_rate), ensure_ascii=False))
     return 0
 
 
@@ -16,9 +16,13 @@ from __future__ import annotations
 
 import json
 import math
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, replace
 from fractions import Fraction
 from pathlib import Path
+from typing import BinaryIO, Iterator
+
+import numpy as np
 
 SLIDE_SUFFIX = ".mkv"
 CAMERA_SUFFIX = ".mp4"
@@ -30,6 +34,13 @@ CAMERA_AUDIO_TRACK = 1
 VIDEO_ONLY = 1
 AUDIO_ONLY = 2
 
+# Every segment is placed once per entry, in this order: (role, track, media).
+PLACEMENT_TRACKS = (
+    ("slides", SLIDES_TRACK, VIDEO_ONLY),
+    ("camera", CAMERA_TRACK, VIDEO_ONLY),
+    ("camera_audio", CAMERA_AUDIO_TRACK, AUDIO_ONLY),
+)
+
 # The camera is started by hand and the slide capture by OBS, so in practice the
 # camera rolls first by anything from a few seconds to a few minutes of setup.
 # That head is trimmed rather than refused. The real guard against two unrelated
@@ -37,6 +48,26 @@ AUDIO_ONLY = 2
 # minutes of unmatched head means the offset itself is not to be believed.
 MAXIMUM_HEAD_TRIM_SECONDS = 300.0
 
+# Cut lists are read this many bytes at a time, so a multi-hour talk never has
+# its whole JSON in memory.
+CUT_LIST_CHUNK_BYTES = 1 << 16
+# The only members of an auto-editor v3 timeline this tool needs.
+CUT_LIST_CLIP_FIELDS = ("start", "dur", "offset")
+
+# The built-in silence cut counts its frames at this rate. One frame is four of
+# audio_sync's envelope steps, 20 ms, close to the frame of the 59.94 fps camera
+# that auto-editor used to measure in.
+SILENCE_TIMEBASE = 50
+# Like auto-editor's `audio` method, loud stretches and silences shorter than
+# these are ignored before the margin is added, so a click does not become a
+# clip and a breath does not become a cut.
+MINIMUM_CLIP_SECONDS = 0.05
+MINIMUM_CUT_SECONDS = 0.1
+
+# Bumped whenever a saved plan stops meaning what an older reader thinks it does.
+PLAN_FORMAT_VERSION = 2
+_PLAN_COLUMNS = ("record_frames", "start_frames", "end_frames")
+
 # Measured from the manually edited AZ-900 project, where the timeline is
 # 1920x1080. The slide capture is shrunk and moved left, which frees the right
 # hand side of the frame for the presenter.
@@ -106,6 +137,18 @@ class ClipPlacement:
         }
 
 
+def segment_columns(segments: tuple[Segment, ...] | np.ndarray) -> np.ndarray:
+    """Return segments as an int64 array of (record_frame, duration, source_frame) rows."""
+    if isinstance(segments, np.ndarray):
+        columns = segments.astype(np.int64, copy=False)
+    else:
+        columns = np.array(
+            [(s.record_frame, s.duration, s.source_frame) for s in segments],
+            dtype=np.int64,
+        )
+    return columns.reshape(-1, 3)
+
+
 def find_recording_pair(folder: Path) -> RecordingPair | None:
     """Return the slide and camera file of a folder, or None if it is not a pair."""
     folder = Path(folder)
@@ -129,51 +172,416 @@ def recorded_at(pair: RecordingPair) -> float:
     return max(pair.slides.stat().st_mtime, pair.camera.stat().st_mtime)
 
 
-def find_latest_recording_pair(working_dir: Path) -> RecordingPair | None:
-    """Return the subfolder whose recordings are the most recent."""
+def find_recording_pairs(working_dir: Path) -> tuple[RecordingPair, ...]:
+    """Return every subfolder that is a pair, in folder name order."""
     working_dir = Path(working_dir)
     if not working_dir.is_dir():
-        return None
+        return ()
 
-    pairs = [
+    return tuple(
         pair
-        for pair in (find_recording_pair(p) for p in working_dir.iterdir() if p.is_dir())
+        for pair in (
+            find_recording_pair(p) for p in sorted(working_dir.iterdir()) if p.is_dir()
+        )
         if pair is not None
-    ]
+    )
+
+
+def find_latest_recording_pair(working_dir: Path) -> RecordingPair | None:
+    """Return the subfolder whose recordings are the most recent."""
+    pairs = find_recording_pairs(working_dir)
     if not pairs:
         return None
     return max(pairs, key=recorded_at)
 
 
-def parse_cut_list(document: dict | str | Path) -> tuple[Segment, ...]:
-    """Read the surviving segments out of an auto-editor v3 timeline."""
-    if isinstance(document, (str, Path)):
-        document = json.loads(Path(document).read_text(encoding="utf-8"))
+# The characters of a JSON string, as raw bytes. Non-ASCII is tried as UTF-8
+# first and as a CP932 lead and trail byte second, which is the order that
+# keeps a CP932 trail byte of 0x5C from being read as a backslash.
+_STRING_CHARACTERS = (
+    rb'(?:[^"\\\x80-\xff]+'
+    rb"|\\(?:u[0-9A-Fa-f]{4}|[^u])"
+    rb"|[\xc2-\xdf][\x80-\xbf]"
+    rb"|[\xe0-\xef][\x80-\xbf]{2}"
+    rb"|[\xf0-\xf4][\x80-\xbf]{3}"
+    rb"|[\x81-\x9f\xe0-\xfc][\x40-\x7e\x80-\xfc]"
+    rb"|[\x80-\xff])*"
+)
+
+
+def _string_pattern(name: str) -> bytes:
+    # The characters are captured in a lookahead and then matched by reference,
+    # which makes them atomic: a string cut off at a chunk boundary fails at
+    # once instead of retrying every other way to split its bytes.
+    group = name.encode()
+    return (
+        rb'"(?=(?P<' + group + rb">" + _STRING_CHARACTERS + rb"))(?P=" + group + rb')"'
+    )
 
-    version = str(document.get("version", ""))
+
+_NUMBER_PATTERN = rb"-?[0-9]+(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?"
+_MEMBER_PATTERN = (
+    _string_pattern("key")
+    + rb"[ \t\r\n]*:[ \t\r\n]*(?P<value>"
+    + _string_pattern("text")
+    + rb"|" + _NUMBER_PATTERN + rb"|true|false|null)"
+)
+
+_WHITESPACE = re.compile(rb"[ \t\r\n]*")
+_STRING = re.compile(_string_pattern("text"))
+_NUMBER = re.compile(_NUMBER_PATTERN)
+_LITERAL = re.compile(rb"true|false|null")
+# A clip is a flat object of scalars, which is matched whole and then searched
+# for the fields it is read for, without a Python step per token. A quote can
+# only open a key right before a colon, so a field name inside some other
+# string is never mistaken for one.
+_FLAT_OBJECT = re.compile(
+    rb"\{[ \t\r\n]*(?:" + _MEMBER_PATTERN + rb"[ \t\r\n]*,?[ \t\r\n]*)*\}"
+)
+_CLIP_FIELD = re.compile(
+    rb'"(' + "|".join(CUT_LIST_CLIP_FIELDS).encode() + rb')"[ \t\r\n]*:[ \t\r\n]*('
+    + _NUMBER_PATTERN + rb")"
+)
+# A token is only trusted once this many bytes follow it in the buffer, so that
+# none is cut short at a chunk boundary.
+_LOOKAHEAD = 8
+
+
+def _json_string(body: bytes) -> str:
+    """Decode the inside of a JSON string, keeping what cannot be decoded as is."""
+    if body.isascii() and b"\\" not in body:
+        return body.decode("ascii")
+    try:
+        return json.loads(b'"' + body + b'"')
+    except ValueError:
+        return body.decode("utf-8", "replace")
+
+
+def _json_scalar(token: bytes) -> object:
+    if token[:1] == b'"':
+        return _json_string(token[1:-1])
+    if token.isdigit():
+        return int(token)
+    return json.loads(token)
+
+
+class _CutListScanner:
+    """Pull the few values a cut list is read for out of its raw bytes.
+
+    Windows builds of auto-editor write the input path in the console code page
+    (CP932) rather than UTF-8. Only strings can hold such bytes, and they are
+    matched by bytes without being decoded, so a mangled path costs nothing and
+    the file is read once whichever encoding it is in.
+    """
+
+    def __init__(self, stream: BinaryIO, chunk_bytes: int = CUT_LIST_CHUNK_BYTES):
+        self._stream = stream
+        self._chunk_bytes = chunk_bytes
+        self._buffer = b""
+        self._position = 0
+        self._exhausted = False
+
+    def _fill(self) -> bool:
+        if self._exhausted:
+            return False
+        chunk = self._stream.read(self._chunk_bytes)
+        if not chunk:
+            self._exhausted = True
+            return False
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+        return True
+
+    def _take(self, pattern: re.Pattern) -> re.Match | None:
+        """Match a whole token at the current position and step past it."""
+        while True:
+            match = pattern.match(self._buffer, self._position)
+            if match is not None and match.end() + _LOOKAHEAD < len(self._buffer):
+                break
+            if not self._fill():
+                break
+        if match is not None:
+            self._position = match.end()
+        return match
+
+    def _read_past(self, symbol: bytes) -> None:
+        """Read until `symbol` and a few bytes after it are in the buffer."""
+        while True:
+            found = self._buffer.find(symbol, self._position)
+            if 0 <= found and found + _LOOKAHEAD < len(self._buffer):
+                return
+            if not self._fill():
+                return
+
+    def _peek(self) -> int | None:
+        self._take(_WHITESPACE)
+        if self._position >= len(self._buffer) and not self._fill():
+            return None
+        return self._buffer[self._position]
+
+    def _consume(self, symbol: int) -> bool:
+        if self._peek() != symbol:
+            return False
+        self._position += 1
+        return True
+
+    def _expect(self, symbol: int) -> None:
+        if not self._consume(symbol):
+            raise DualSourceError(
+                f"The auto-editor timeline is not valid JSON: expected {chr(symbol)}"
+            )
+
+    def _string(self) -> str:
+        self._peek()
+        match = self._take(_STRING)
+        if match is None:
+            raise DualSourceError("The auto-editor timeline is not valid JSON")
+        return _json_string(match.group("text"))
+
+    def _scalar(self) -> object:
+        byte = self._peek()
+        if byte == 0x22:
+            return self._string()
+        numeric = byte is not None and byte in b"-0123456789"
+        match = self._take(_NUMBER if numeric else _LITERAL)
+        if match is None:
+            raise DualSourceError("The auto-editor timeline is not valid JSON")
+        return json.loads(match.group())
+
+    def _members(self) -> Iterator[str]:
+        """Yield each key of an object; the caller reads or skips its value."""
+        self._expect(0x7B)
+        if self._consume(0x7D):
+            return
+        while True:
+            key = self._string()
+            self._expect(0x3A)
+            yield key
+            if not self._consume(0x2C):
+                self._expect(0x7D)
+                return
+
+    def _elements(self) -> Iterator[int]:
+        """Yield the index of each array element; the caller reads or skips it."""
+        self._expect(0x5B)
+        if self._consume(0x5D):
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            if not self._consume(0x2C):
+                self._expect(0x5D)
+                return
+
+    def _skip(self) -> None:
+        depth = 0
+        while True:
+            byte = self._peek()
+            if byte is None:
+                raise DualSourceError("The auto-editor timeline ends too early")
+            if byte in b"[{":
+                depth += 1
+                self._position += 1
+            elif byte in b"]}":
+                depth -= 1
+                self._position += 1
+            elif byte in b",:":
+                self._position += 1
+            else:
+                self._scalar()
+            if depth == 0:
+                return
+
+    def _clip(self) -> dict:
+        self._peek()
+        # Read up to the clip's closing brace before trying the whole clip at
+        # once. A clip the fast match does not fit is read member by member.
+        self._read_past(b"}")
+        flat = _FLAT_OBJECT.match(self._buffer, self._position)
+        if flat is not None:
+            self._position = flat.end()
+            return {
+                key.decode(): _json_scalar(value)
+                for key, value in _CLIP_FIELD.findall(flat.group())
+            }
+        clip = {}
+        for field in self._members():
+            if field in CUT_LIST_CLIP_FIELDS:
+                clip[field] = self._scalar()
+            else:
+                self._skip()
+        return clip
+
+    def events(self) -> Iterator[tuple[str, object]]:
+        """Yield ("version" | "timebase", value) and ("clip", {...}) in file order."""
+        for key in self._members():
+            if key in ("version", "timebase"):
+                yield key, self._scalar()
+            elif key == "v" and self._peek() == 0x5B:
+                for track in self._elements():
+                    if track == 0 and self._peek() == 0x5B:
+                        for _ in self._elements():
+                            yield "clip", self._clip()
+                    else:
+                        self._skip()
+            else:
+                self._skip()
+
+
+def _check_cut_list_version(version: object) -> None:
+    version = str(version if version is not None else "")
     if version != "3":
         raise DualSourceError(
             f"Unsupported auto-editor timeline version: {version or 'missing'}"
         )
 
-    tracks = document.get("v") or []
-    if not tracks or not tracks[0]:
-        raise DualSourceError("auto-editor returned no video segments to place")
 
-    segments = tuple(
-        Segment(
+def _clip_segment(clip: dict) -> Segment:
+    try:
+        return Segment(
             record_frame=int(clip["start"]),
             duration=int(clip["dur"]),
             source_frame=int(clip["offset"]),
         )
-        for clip in tracks[0]
-        if int(clip["dur"]) > 0
+    except KeyError as error:
+        raise DualSourceError(f"A cut list clip has no '{error.args[0]}'") from None
+
+
+def iter_cut_list(
+    path: Path, chunk_bytes: int = CUT_LIST_CHUNK_BYTES
+) -> Iterator[Segment]:
+    """Yield the surviving segments of an auto-editor v3 timeline file as it is read.
+
+    Only `version`, `timebase` and the start, length and offset of each clip on
+    the first video track are kept; everything else is skipped unparsed.
+    """
+    version: object = None
+    clips = 0
+    placed = 0
+    with Path(path).open("rb") as stream:
+        for name, value in _CutListScanner(stream, chunk_bytes).events():
+            if name == "version":
+                version = value
+                _check_cut_list_version(version)
+            elif name == "clip":
+                clips += 1
+                segment = _clip_segment(value)
+                if segment.duration > 0:
+                    placed += 1
+                    yield segment
+
+    _check_cut_list_version(version)
+    if not clips:
+        raise DualSourceError("auto-editor returned no video segments to place")
+    if not placed:
+        raise DualSourceError("Every segment in the auto-editor timeline was empty")
+
+
+def read_cut_list_document(
+    path: Path, chunk_bytes: int = CUT_LIST_CHUNK_BYTES
+) -> dict:
+    """Return the parts of a v3 timeline file this tool uses, as a small document.
+
+    The result has the shape `parse_cut_list` and `cut_list_frame_rate` expect,
+    holding only `version`, `timebase` and the clips of the first video track.
+    """
+    document: dict = {"v": [[]]}
+    with Path(path).open("rb") as stream:
+        for name, value in _CutListScanner(stream, chunk_bytes).events():
+            if name == "clip":
+                document["v"][0].append(value)
+            else:
+                document[name] = value
+    return document
+
+
+def parse_cut_list(document: dict | str | Path) -> tuple[Segment, ...]:
+    """Read the surviving segments out of an auto-editor v3 timeline."""
+    if isinstance(document, (str, Path)):
+        return tuple(iter_cut_list(Path(document)))
+
+    _check_cut_list_version(document.get("version"))
+
+    tracks = document.get("v") or []
+    if not tracks or not tracks[0]:
+        raise DualSourceError("auto-editor returned no video segments to place")
+
+    segments = tuple(
+        segment for segment in map(_clip_segment, tracks[0]) if segment.duration > 0
     )
     if not segments:
         raise DualSourceError("Every segment in the auto-editor timeline was empty")
     return segments
 
 
+def _runs(mask: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return where every run of True in a mask starts and ends (exclusive)."""
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+
+def _drop_short_runs(mask: np.ndarray, value: bool, length: int) -> np.ndarray:
+    """Flip every run of `value` shorter than `length` frames to the other value."""
+    starts, ends = _runs(mask if value else ~mask)
+    short = ends - starts < length
+    toggles = np.zeros(mask.size + 1, dtype=np.int8)
+    toggles[starts[short]] += 1
+    toggles[ends[short]] -= 1
+    return mask ^ (np.cumsum(toggles[:-1]) > 0)
+
+
+def find_talking_segments(
+    peaks: np.ndarray,
+    envelope_rate: int,
+    threshold_percent: float,
+    margin_seconds: float,
+    timebase: int = SILENCE_TIMEBASE,
+) -> tuple[Segment, ...]:
+    """Cut the silences out of a recording the way auto-editor's `audio` method does.
+
+    `peaks` holds the largest amplitude of each envelope step, as
+    `audio_sync.analyze_recording` returns it. A frame is loud when its peak
+    reaches `threshold_percent` of the loudest frame of the whole recording;
+    too short loud stretches and silences are evened out, and every loud
+    stretch is widened by `margin_seconds` on both sides. The result has the
+    shape `parse_cut_list` returns, counted in frames of `timebase`.
+    """
+    steps = envelope_rate // timebase
+    if steps < 1 or steps * timebase != envelope_rate:
+        raise DualSourceError(
+            f"A {timebase} fps cut list cannot be built from {envelope_rate} steps a second"
+        )
+    frames = peaks[: (peaks.size // steps) * steps].reshape(-1, steps).max(axis=1)
+    loudest = float(frames.max()) if frames.size else 0.0
+    if loudest <= 0:
+        raise DualSourceError("The camera recording holds no sound to cut")
+
+    loud = frames >= loudest * threshold_percent / 100.0
+    loud = _drop_short_runs(loud, True, round(MINIMUM_CLIP_SECONDS * timebase))
+    loud = _drop_short_runs(loud, False, round(MINIMUM_CUT_SECONDS * timebase))
+    starts, ends = _runs(loud)
+    if not starts.size:
+        raise DualSourceError("Nothing in the camera recording is loud enough to keep")
+
+    # Widening can make neighbouring stretches touch, and those become one.
+    margin = round(margin_seconds * timebase)
+    starts = np.maximum(starts - margin, 0)
+    ends = np.minimum(ends + margin, frames.size)
+    first = np.flatnonzero(np.concatenate(([True], starts[1:] > ends[:-1])))
+    starts = starts[first]
+    ends = ends[np.concatenate((first[1:] - 1, [ends.size - 1]))]
+
+    durations = ends - starts
+    records = np.concatenate(([0], np.cumsum(durations)[:-1]))
+    return tuple(
+        Segment(record_frame=record, duration=duration, source_frame=start)
+        for record, duration, start in zip(
+            records.tolist(), durations.tolist(), starts.tolist()
+        )
+    )
+
+
 def cut_list_frame_rate(document: dict) -> Fraction:
     """Return the frame rate the cut list frames are counted in."""
     timebase = document.get("timebase")
@@ -224,6 +632,9 @@ def placement_scale(source_frame_rate: float, timeline_frame_rate: float, factor
     return source_frame_rate * factor / timeline_frame_rate
 
 
+_FRAME_RATE_NAMES = ("timeline", "slides", "camera", "cut_list")
+
+
 @dataclass(frozen=True)
 class FrameRates:
     """Every frame rate involved, which are not required to agree.
@@ -240,20 +651,97 @@ class FrameRates:
     cut_list: float
 
     def __post_init__(self) -> None:
-        for name in ("timeline", "slides", "camera", "cut_list"):
+        for name in _FRAME_RATE_NAMES:
             if getattr(self, name) <= 0:
                 raise DualSourceError(f"Frame rate '{name}' must be positive")
 
+    def to_document(self) -> dict:
+        """Return the rates as plain JSON values, for a plan saved to disk."""
+        return {name: getattr(self, name) for name in _FRAME_RATE_NAMES}
+
+    @classmethod
+    def from_document(cls, document: dict) -> "FrameRates":
+        """Rebuild the rates written by `to_document`."""
+        try:
+            return cls(**{name: float(document[name]) for name in _FRAME_RATE_NAMES})
+        except (KeyError, TypeError, ValueError) as error:
+            raise DualSourceError(f"Saved frame rates cannot be read: {error}") from error
+
+
+@dataclass(frozen=True)
+class PlacementColumns:
+    """Every placement of a plan as int64 columns, one row per placed segment.
+
+    `start_frames` and `end_frames` hold one column per entry of
+    `PLACEMENT_TRACKS`. A talk cut at short margins places thousands of
+    segments, and keeping them as arrays lets the plan be built in one pass.
+    """
+
+    record_frames: np.ndarray
+    start_frames: np.ndarray
+    end_frames: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.record_frames.size)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PlacementColumns):
+            return NotImplemented
+        return all(
+            np.array_equal(getattr(self, name), getattr(other, name))
+            for name in ("record_frames", "start_frames", "end_frames")
+        )
+
+    def placements(self) -> tuple[ClipPlacement, ...]:
+        """Return the same plan as one `ClipPlacement` per track and segment."""
+        placements = []
+        for record_frame, starts, ends in zip(
+            self.record_frames.tolist(),
+            self.start_frames.tolist(),
+            self.end_frames.tolist(),
+        ):
+            for (role, track, media_type), start, end in zip(
+                PLACEMENT_TRACKS, starts, ends
+            ):
+                placements.append(
+                    ClipPlacement(
+                        role=role,
+                        start_frame=start,
+                        end_frame=end,
+                        record_frame=record_frame,
+                        media_type=media_type,
+                        track_index=track,
+                    )
+                )
+        return tuple(placements)
+
 
 @dataclass(frozen=True)
 class TimelinePlan:
     """Everything the Resolve side needs to place and to report."""
 
-    placements: tuple[ClipPlacement, ...]
+    columns: PlacementColumns
     end_frame: int
     segments_placed: int
     segments_total: int
     head_trim_seconds: float
+    # Segments folded into the one before them because the silence between
+    # them was shorter than the merge gap. Each saves one clip per track.
+    segments_merged: int = 0
+
+    @property
+    def placements(self) -> tuple[ClipPlacement, ...]:
+        return self.columns.placements()
+
+    def shifted(self, frames: int) -> "TimelinePlan":
+        """Return the same plan entered `frames` later on the timeline."""
+        if not frames:
+            return self
+        return replace(
+            self,
+            columns=replace(self.columns, record_frames=self.columns.record_frames + frames),
+            end_frame=self.end_frame + frames,
+        )
 
     def describe(self) -> str:
         """Summarize the plan in one line, so a run can be checked at a glance."""
@@ -263,16 +751,28 @@ class TimelinePlan:
             parts.append(f"{dropped} outside the slide capture and not placed")
         if self.head_trim_seconds > 0:
             parts.append(f"{self.head_trim_seconds:.2f}s trimmed off the head")
+        if self.segments_merged:
+            parts.append(
+                f"{self.segments_merged} merged across short gaps, "
+                f"{self.clips_saved} clips saved"
+            )
         return ", ".join(parts)
 
+    @property
+    def clips_saved(self) -> int:
+        """Return how many clips merging short gaps kept off the timeline."""
+        return self.segments_merged * len(PLACEMENT_TRACKS)
+
 
 def build_placements(
-    segments: tuple[Segment, ...],
+    segments: tuple[Segment, ...] | np.ndarray,
     rates: FrameRates,
     slides_offset_seconds: float,
     timeline_start_frame: int = 0,
     slides_frame_count: int | None = None,
     maximum_head_trim: float = MAXIMUM_HEAD_TRIM_SECONDS,
+    slides_drift: float = 0.0,
+    merge_gap_frames: int = 0,
 ) -> TimelinePlan:
     """Lay every segment onto the slide track, the camera track and the audio track.
 
@@ -284,12 +784,30 @@ def build_placements(
     on the camera and not on the slides. That head is trimmed off both tracks by
     the same amount rather than placed. Record frames are accumulated from the
     surviving durations, so a trim shifts what follows instead of leaving a hole.
+
+    `slides_drift` is how much faster the camera's clock runs than the slide
+    capture's, as measured by `audio_sync.estimate_drift`. A moment `t` seconds
+    into the slides is then `offset + (1 + drift) * t` into the camera, so late
+    segments are entered where they really are instead of a few frames off.
+
+    `segments` may be `Segment`s or the int64 rows of `segment_columns`; every
+    step below works on whole columns at once.
+
+    With a `merge_gap_frames`, a segment that follows the previous one after
+    less than that many timeline frames of cut silence is merged into it, and
+    the short silence is kept. Every merge saves one clip on each track. It
+    runs after the slide capture's end has been applied, so a merge can never
+    push a segment that fitted past that end, and the merged length is rounded
+    to the common step like any other segment.
     """
-    if not segments:
+    columns = segment_columns(segments)
+    if not len(columns):
         raise DualSourceError("There is nothing to place on the timeline")
 
-    first_camera_second = segments[0].source_frame / rates.cut_list
-    head_shortfall = slides_offset_seconds - first_camera_second
+    camera_seconds = columns[:, 2] / rates.cut_list
+    duration_seconds = columns[:, 1] / rates.cut_list
+
+    head_shortfall = slides_offset_seconds - float(camera_seconds[0])
     if head_shortfall > maximum_head_trim:
         raise DualSourceError(
             "The slide recording starts too late: it is missing the first "
@@ -298,10 +816,6 @@ def build_placements(
             "that both files belong to the same session."
         )
 
-    slides_limit = (
-        slides_frame_count / rates.slides if slides_frame_count is not None else None
-    )
-
     slides_factor = conform_factor(rates.slides, rates.timeline)
     camera_factor = conform_factor(rates.camera, rates.timeline)
     # Each track has to cover exactly the same span, so a segment lasts a whole
@@ -309,72 +823,190 @@ def build_placements(
     # least common multiple, which every segment is rounded to.
     step = math.lcm(slides_factor, camera_factor)
 
-    placements: list[ClipPlacement] = []
-    record_frame = timeline_start_frame
-    placed = 0
-    trimmed = 0.0
-    for segment in segments:
-        camera_second = segment.source_frame / rates.cut_list
-        duration_seconds = segment.duration / rates.cut_list
-        slide_second = camera_second - slides_offset_seconds
-        if slide_second < 0:
-            # Skip the part of the talk the slide capture never saw, on both
-            # tracks, so the two views stay aligned.
-            trimmed += min(-slide_second, duration_seconds)
-            duration_seconds += slide_second
-            camera_second -= slide_second
-            slide_second = 0.0
-            if duration_seconds <= 0:
-                continue
-
-        if slides_limit is not None and slide_second + duration_seconds > slides_limit:
-            # The slide capture was stopped first. Placing a clip past its end
-            # makes Resolve reject the whole batch, so the tail is dropped here
-            # and reported instead.
-            break
-
-        # One length in timeline frames drives every track. Deriving each track's
-        # length from seconds instead lets the two roundings disagree, which
-        # leaves a one frame hole between clips and shifts V1 against V2.
-        timeline_frames = seconds_to_frames(duration_seconds, rates.timeline)
-        timeline_frames = max(step, timeline_frames - timeline_frames % step)
-
-        for role, source_second, rate, factor, track, media_type in (
-            ("slides", slide_second, rates.slides, slides_factor, SLIDES_TRACK, VIDEO_ONLY),
-            ("camera", camera_second, rates.camera, camera_factor, CAMERA_TRACK, VIDEO_ONLY),
-            (
-                "camera_audio", camera_second, rates.camera, camera_factor,
-                CAMERA_AUDIO_TRACK, AUDIO_ONLY,
-            ),
-        ):
-            # Only the entry point is scaled. Resolve lays the requested number of
-            # frames onto the timeline one for one, so scaling the length as well
-            # loses a frame on every clip past about eight seconds and opens a
-            # hole the next clip cannot close.
-            scale = placement_scale(rate, rates.timeline, factor)
-            start_frame = int(round(seconds_to_frames(source_second, rate) * scale))
-            length = timeline_frames // factor
-            placements.append(
-                ClipPlacement(
-                    role=role,
-                    start_frame=start_frame,
-                    end_frame=start_frame + length,
-                    record_frame=record_frame,
-                    media_type=media_type,
-                    track_index=track,
-                )
-            )
-        record_frame += timeline_frames
-        placed += 1
-
-    if not placements:
+    # Skip the part of the talk the slide capture never saw, on both tracks, so
+    # the two views stay aligned.
+    slide_seconds = (camera_seconds - slides_offset_seconds) / (1.0 + slides_drift)
+    unseen = np.maximum(-slide_seconds, 0.0)
+    trims = np.minimum(unseen, duration_seconds)
+    duration_seconds = duration_seconds - unseen
+    camera_seconds = camera_seconds + unseen
+    slide_seconds = np.maximum(slide_seconds, 0.0)
+    kept = duration_seconds > 0
+
+    # The slide capture was stopped first. Placing a clip past its end makes
+    # Resolve reject the whole batch, so the first segment that runs past it and
+    # everything after are dropped here and reported instead.
+    stop = len(columns)
+    if slides_frame_count is not None:
+        slides_limit = slides_frame_count / rates.slides
+        overrun = np.flatnonzero(kept & (slide_seconds + duration_seconds > slides_limit))
+        if overrun.size:
+            stop = int(overrun[0])
+    trimmed = float(trims[:stop].sum())
+    placed = np.flatnonzero(kept[:stop])
+    if not placed.size:
         raise DualSourceError(
             "The slide recording is shorter than the first segment of the talk"
         )
+    slide_seconds = slide_seconds[placed]
+    camera_seconds = camera_seconds[placed]
+    duration_seconds = duration_seconds[placed]
+
+    merged = 0
+    if merge_gap_frames > 0 and placed.size > 1:
+        ends = camera_seconds + duration_seconds
+        gaps = camera_seconds[1:] - ends[:-1]
+        first = np.flatnonzero(
+            np.concatenate(([True], gaps >= merge_gap_frames / rates.timeline))
+        )
+        last = np.concatenate((first[1:] - 1, [placed.size - 1]))
+        merged = placed.size - first.size
+        duration_seconds = ends[last] - camera_seconds[first]
+        slide_seconds = slide_seconds[first]
+        camera_seconds = camera_seconds[first]
+
+    # One length in timeline frames drives every track. Deriving each track's
+    # length from seconds instead lets the two roundings disagree, which leaves a
+    # one frame hole between clips and shifts V1 against V2.
+    timeline_frames = np.rint(duration_seconds * rates.timeline).astype(np.int64)
+    timeline_frames = np.maximum(step, timeline_frames - timeline_frames % step)
+    record_frames = timeline_start_frame + np.concatenate(
+        ([0], np.cumsum(timeline_frames))
+    )
+
+    # Only the entry point is scaled. Resolve lays the requested number of frames
+    # onto the timeline one for one, so scaling the length as well loses a frame
+    # on every clip past about eight seconds and opens a hole the next clip
+    # cannot close.
+    start_frames = np.empty((camera_seconds.size, len(PLACEMENT_TRACKS)), dtype=np.int64)
+    end_frames = np.empty_like(start_frames)
+    for index, (source_seconds, rate, factor) in enumerate(
+        (
+            (slide_seconds, rates.slides, slides_factor),
+            (camera_seconds, rates.camera, camera_factor),
+            (camera_seconds, rates.camera, camera_factor),
+        )
+    ):
+        scale = placement_scale(rate, rates.timeline, factor)
+        start_frames[:, index] = np.rint(np.rint(source_seconds * rate) * scale)
+        end_frames[:, index] = start_frames[:, index] + timeline_frames // factor
+
     return TimelinePlan(
-        placements=tuple(placements),
-        end_frame=record_frame,
-        segments_placed=placed,
-        segments_total=len(segments),
+        columns=PlacementColumns(
+            record_frames=record_frames[:-1],
+            start_frames=start_frames,
+            end_frames=end_frames,
+        ),
+        end_frame=int(record_frames[-1]),
+        segments_placed=int(placed.size),
+        segments_total=len(columns),
         head_trim_seconds=trimmed,
+        segments_merged=merged,
     )
+
+
+def recording_identity(pair: RecordingPair) -> dict:
+    """Return what tells a pair's recordings apart from a re-recording of them."""
+    identity = {}
+    for role, path in (("slides", pair.slides), ("camera", pair.camera)):
+        status = path.stat()
+        identity[role] = [path.name, status.st_size, status.st_mtime_ns]
+    return identity
+
+
+@dataclass(frozen=True)
+class SavedPlan:
+    """A plan as it is kept on disk, with everything it was computed from.
+
+    Placing a saved plan only needs the recordings imported again, so a Resolve
+    failure late in a run costs seconds to retry instead of a whole analysis.
+    `recordings` is `recording_identity` of the pair at planning time, which is
+    how a plan for files that were since replaced is caught.
+    """
+
+    plan: TimelinePlan
+    rates: FrameRates
+    timeline_start_frame: int
+    slides_offset_seconds: float
+    slides_drift: float
+    recordings: dict
+    sync: dict | None = None
+
+    def placed_at(self, start_frame: int) -> TimelinePlan:
+        """Return the plan moved to begin at another timeline frame."""
+        return self.plan.shifted(start_frame - self.timeline_start_frame)
+
+
+def save_plan(saved: SavedPlan, path: Path) -> None:
+    """Write a plan as one compressed `.npz`, so it can be placed without replanning.
+
+    The columns are stored as they are and everything else as a small JSON
+    document beside them. The file is written under a temporary name first, so
+    a planner that is stopped halfway never leaves half a plan to be placed.
+    """
+    path = Path(path)
+    plan = saved.plan
+    document = {
+        "version": PLAN_FORMAT_VERSION,
+        "end_frame": plan.end_frame,
+        "segments_placed": plan.segments_placed,
+        "segments_total": plan.segments_total,
+        "head_trim_seconds": plan.head_trim_seconds,
+        "segments_merged": plan.segments_merged,
+        "rates": saved.rates.to_document(),
+        "timeline_start_frame": saved.timeline_start_frame,
+        "slides_offset_seconds": saved.slides_offset_seconds,
+        "slides_drift": saved.slides_drift,
+        "recordings": saved.recordings,
+        "sync": saved.sync,
+    }
+    partial = path.with_name(f"{path.name}.partial")
+    with partial.open("wb") as output:
+        np.savez_compressed(
+            output,
+            document=np.array(json.dumps(document, ensure_ascii=False)),
+            **{name: getattr(plan.columns, name) for name in _PLAN_COLUMNS},
+        )
+    partial.replace(path)
+
+
+def load_plan(path: Path) -> SavedPlan:
+    """Read a plan written by `save_plan`, refusing anything it cannot trust."""
+    try:
+        with np.load(Path(path), allow_pickle=False) as stored:
+            document = json.loads(str(stored["document"]))
+            columns = {name: stored[name].astype(np.int64) for name in _PLAN_COLUMNS}
+    except FileNotFoundError as error:
+        raise DualSourceError(f"No saved plan at {path}") from error
+    except (OSError, ValueError, KeyError) as error:
+        raise DualSourceError(f"The saved plan {path} cannot be read: {error}") from error
+
+    if document.get("version") != PLAN_FORMAT_VERSION:
+        raise DualSourceError(
+            f"The saved plan {path} has format version {document.get('version')}, "
+            f"this tool reads version {PLAN_FORMAT_VERSION}. Plan the folder again."
+        )
+    rows = columns["record_frames"].shape[0]
+    if columns["start_frames"].shape != (rows, len(PLACEMENT_TRACKS)) or (
+        columns["end_frames"].shape != columns["start_frames"].shape
+    ):
+        raise DualSourceError(f"The saved plan {path} has columns of different lengths")
+    try:
+        return SavedPlan(
+            plan=TimelinePlan(
+                columns=PlacementColumns(**columns),
+                end_frame=int(document["end_frame"]),
+                segments_placed=int(document["segments_placed"]),
+                segments_total=int(document["segments_total"]),
+                head_trim_seconds=float(document["head_trim_seconds"]),
+                segments_merged=int(document.get("segments_merged", 0)),
+            ),
+            rates=FrameRates.from_document(document["rates"]),
+            timeline_start_frame=int(document["timeline_start_frame"]),
+            slides_offset_seconds=float(document["slides_offset_seconds"]),
+            slides_drift=float(document["slides_drift"]),
+            recordings=document["recordings"],
+            sync=document.get("sync"),
+        )
+    except (KeyError, TypeError, ValueError) as error:
+        raise DualSourceError(f"The saved plan {path} is incomplete: {error}") from error
@@ -15,12 +15,18 @@ scripting API can add neither transitions nor Edit page effects.
 from __future__ import annotations
 
 import argparse
+import contextlib
+import hashlib
+import io
 import json
 import os
 import subprocess
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from fractions import Fraction
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
@@ -30,6 +36,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parent))
 import audio_sync  # noqa: E402
 import dual_source  # noqa: E402
 import resolve_session  # noqa: E402
+from progress import ProgressReporter  # noqa: E402
 from auto_editor_config import (  # noqa: E402
     DEFAULT_THRESHOLD_PERCENT,
     load_auto_editor_config,
@@ -37,6 +44,15 @@ from auto_editor_config import (  # noqa: E402
 
 TEMPLATE_NAME = "テンプレート.drp"
 CUT_LIST_NAME = "_auto_editor_cuts.json"
+PLAN_NAME = "_dual_source_plan.npz"
+
+# 1回のAppendToTimelineに渡すクリップ数。1つでも置けないクリップがあると
+# Resolveはその呼び出し全体を拒むので、やり直す範囲をこの大きさに抑える。
+# 1セグメントの3トラック分が分かれないよう、その倍数にしている。
+APPEND_CHUNK_SIZE = 100 * len(dual_source.PLACEMENT_TRACKS)
+
+# テンプレートのタイムラインは60fps。Resolveを開かずに計画するときはこれを使う。
+PLANNED_TIMELINE_FRAME_RATE = 60.0
 
 # OneDriveのフォルダ名は過去に変わっているため、実在する方を使う
 RECORDING_DIR_CANDIDATES = [
@@ -95,14 +111,10 @@ def read_cut_list(path):
 
     Windowsのauto-editorはJSONの中の入力パスをコードページ(CP932)で書き出すため、
     UTF-8として読めないことがある。必要なのは数値だけなので、パスが化けても構わない。
+    数時間の収録ではカットリストが数MBになるので、全体を2回デコードし直すのではなく、
+    少しずつ読みながら version・timebase と各クリップの位置だけを拾う。
     """
-    raw = Path(path).read_bytes()
-    for encoding in ("utf-8", "cp932"):
-        try:
-            return json.loads(raw.decode(encoding))
-        except (UnicodeDecodeError, json.JSONDecodeError):
-            continue
-    return json.loads(raw.decode("utf-8", "replace"))
+    return dual_source.read_cut_list_document(path)
 
 
 def decode_output(raw):
@@ -153,16 +165,90 @@ def warn_if_threshold_cannot_cut(auto_editor):
     return True
 
 
-def run_auto_editor_cut_list(camera_path, output_path):
+def default_cut_list_cache_dir():
+    """カットリストを取っておく場所。音声の解析結果と同じくローカルに置く。"""
+    return audio_sync.default_cache_dir().parent / "cut_lists"
+
+
+class CutListCache:
+    """auto-editorのカットリストを、カメラの録画と無音カットの設定ごとに取っておく。
+
+    鍵はカメラのファイル（パス・サイズ・更新時刻）と、auto-editorに渡す --edit と
+    --margin の文字列。録り直しや閾値の変更はどちらも別の鍵になるので、古い
+    カットリストを読むことはない。読み書きに失敗したら単に実行し直す。
+    """
+
+    def __init__(self, directory=None):
+        if directory is None:
+            directory = default_cut_list_cache_dir()
+        self.directory = Path(directory)
+
+    def _entry(self, camera_path, auto_editor):
+        try:
+            status = Path(camera_path).stat()
+            resolved = str(Path(camera_path).resolve())
+        except OSError:
+            return None
+        identity = json.dumps(
+            [
+                resolved,
+                status.st_size,
+                status.st_mtime_ns,
+                auto_editor.edit_expression,
+                auto_editor.margin,
+            ]
+        )
+        digest = hashlib.sha1(identity.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def load(self, camera_path, auto_editor):
+        """前回と同じ条件のカットリストを返す。無ければNone。"""
+        entry = self._entry(camera_path, auto_editor)
+        if entry is None or not entry.exists():
+            return None
+        try:
+            document = json.loads(entry.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            entry.unlink(missing_ok=True)
+            return None
+        if not isinstance(document, dict) or "v" not in document:
+            entry.unlink(missing_ok=True)
+            return None
+        return document
+
+    def store(self, camera_path, auto_editor, document):
+        entry = self._entry(camera_path, auto_editor)
+        if entry is None:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # 途中で止まっても壊れたカットリストが残らないよう、別名で書いてから置き換える
+            partial = entry.with_name(f"{entry.stem}.{os.getpid()}.partial")
+            partial.write_text(json.dumps(document), encoding="utf-8")
+            os.replace(partial, entry)
+        except OSError:
+            return
+
+
+def run_auto_editor_cut_list(camera_path, output_path, cache=None):
     """auto-editorを実行し、カットリスト（v3 JSON）を得る
 
     同じv3 JSONを出す指定の名前がバージョンで変わっている。新しい版は "v3"、
     古い版は "json" しか受け付けないので、順に試す。
+
+    cache を渡すと、同じ録画を同じ閾値とマージンで解析済みならauto-editorを
+    走らせずにそれを返す。Resolve側の問題でやり直すたびに1時間分の音声を
+    解析し直さずに済む。
     """
     output_path = Path(output_path)
-    clear_previous_cut_lists(output_path)
     auto_editor = load_auto_editor_config()
     warn_if_threshold_cannot_cut(auto_editor)
+    if cache is not None:
+        document = cache.load(camera_path, auto_editor)
+        if document is not None:
+            print("✓ 前回と同じ録画と設定のカットリストを使います（auto-editorは実行しません）")
+            return document
+    clear_previous_cut_lists(output_path)
 
     for export_format, suffix in EXPORT_FORMATS:
         requested = output_path.with_suffix(suffix)
@@ -199,7 +285,10 @@ def run_auto_editor_cut_list(camera_path, output_path):
             return None
         if written != requested:
             print(f"  auto-editorは {written.name} に書き出しました")
-        return read_cut_list(written)
+        document = read_cut_list(written)
+        if cache is not None:
+            cache.store(camera_path, auto_editor, document)
+        return document
 
     names = " / ".join(name for name, _ in EXPORT_FORMATS)
     print(f"✗ auto-editorが {names} のどれも受け付けませんでした")
@@ -247,26 +336,92 @@ def clip_frame_rate(media_pool_item, fallback):
     return frame_rate if frame_rate > 0 else fallback
 
 
-def append_clips_with_retry(media_pool, clip_infos, max_retries=3, delay=2):
-    """クリップをタイムラインに追加（リトライ機能付き）"""
-    for attempt in range(max_retries):
-        print(f"クリップ追加試行 {attempt + 1}/{max_retries}...")
+def _append_chunk(media_pool, clip_infos, attempts, delay):
+    """1チャンクを追加する。失敗したら指定回数までやり直し、だめならNone"""
+    for attempt in range(attempts):
         try:
             appended = media_pool.AppendToTimeline(clip_infos)
             if appended:
-                print(f"  ✓ クリップ追加成功（{len(appended)}クリップ）")
-                return appended
-            print(f"  AppendToTimelineが空を返しました（試行 {attempt + 1}）")
-        except Exception as error:
-            print(f"  クリップ追加エラー（試行 {attempt + 1}）: {error}")
-
-        if attempt < max_retries - 1:
+                appended = list(appended)
+                if len(appended) != len(clip_infos):
+                    print(
+                        f"  ! {len(clip_infos)}クリップ中 {len(appended)}クリップだけが"
+                        "返されました"
+                    )
+                return (appended + [None] * len(clip_infos))[: len(clip_infos)]
+            error = "AppendToTimelineが空を返しました"
+        except Exception as exception:
+            error = f"クリップ追加エラー: {exception}"
+        if attempts > 1:
+            print(f"  {error}（試行 {attempt + 1}/{attempts}）")
+        if attempt < attempts - 1:
             time.sleep(delay)
-
-    print(f"✗ {max_retries}回の試行すべてが失敗しました")
     return None
 
 
+def _append_bisecting(media_pool, clip_infos, max_retries, delay, failed):
+    """追加できないチャンクを半分に分けて、置けないクリップだけを外す
+
+    一時的な失敗はチャンク全体のやり直しで吸収する。分けた後は結果が変わらない
+    ので1回ずつしか試さない。置けなかったクリップの位置をfailedに集める。
+    """
+    appended = _append_chunk(media_pool, clip_infos, max_retries, delay)
+    if appended is not None:
+        return appended
+    if len(clip_infos) == 1:
+        failed.append(clip_infos[0])
+        return [None]
+    middle = len(clip_infos) // 2
+    return _append_bisecting(
+        media_pool, clip_infos[:middle], 1, delay, failed
+    ) + _append_bisecting(media_pool, clip_infos[middle:], 1, delay, failed)
+
+
+def append_clips_with_retry(
+    media_pool, clip_infos, max_retries=3, delay=2, chunk_size=APPEND_CHUNK_SIZE,
+    reporter=None,
+):
+    """クリップを記録フレーム順にチャンクに分けてタイムラインに追加する
+
+    1チャンクが失敗しても、やり直すのはそのチャンクだけで、それでも失敗すれば
+    半分に分けて置けないクリップだけを外す。戻り値は渡した順に並んだアイテムの
+    リストで、置けなかった位置はNone。1つも置けなければNoneを返す。
+    """
+    reporter = reporter if reporter is not None else ProgressReporter()
+    # 先頭から順に並べると、途中で止まってもタイムラインの前半は完成している。
+    order = sorted(range(len(clip_infos)), key=lambda i: clip_infos[i]["recordFrame"])
+    results = [None] * len(clip_infos)
+    failed = []
+    done = 0
+    reporter.start_stage(f"Appending {len(clip_infos)} clips to the timeline")
+    try:
+        for first in range(0, len(order), chunk_size):
+            indices = order[first : first + chunk_size]
+            chunk = [clip_infos[i] for i in indices]
+            appended = _append_bisecting(media_pool, chunk, max_retries, delay, failed)
+            for index, item in zip(indices, appended):
+                results[index] = item
+            done += len(indices)
+            reporter.child_output(
+                f"{done}/{len(clip_infos)} clips ({done * 100 / len(clip_infos):.0f}%)"
+            )
+    finally:
+        placed = sum(1 for item in results if item)
+        reporter.finish_stage(f"{placed}/{len(clip_infos)} clips")
+
+    for clip_info in failed:
+        print(
+            f"  ✗ 配置できないクリップ: トラック{clip_info['trackIndex']} "
+            f"記録フレーム {clip_info['recordFrame']}"
+            f"（素材 {clip_info['startFrame']}-{clip_info['endFrame']}）"
+        )
+    if not placed:
+        print("✗ クリップを1つも追加できませんでした")
+        return None
+    print(f"  ✓ クリップ追加成功（{placed}/{len(clip_infos)}クリップ）")
+    return results
+
+
 def ensure_video_tracks(timeline, required) -> bool:
     """必要な本数のビデオトラックを確保する"""
     while timeline.GetTrackCount("video") < required:
@@ -276,17 +431,46 @@ def ensure_video_tracks(timeline, required) -> bool:
     return True
 
 
-def apply_clip_properties(items, properties, label) -> int:
-    """タイムラインアイテム群に同じ変形設定を適用する"""
+def apply_clip_properties(items, properties, label, reporter=None) -> int:
+    """タイムラインアイテム群に同じ変形設定を適用する
+
+    ScriptingAPIにはトラック単位の変形がなく、複合クリップにまとめるとSmooth Cut
+    を手で入れられなくなるため、1アイテムずつ設定する。1つ失敗しても止めずに
+    残りを続け、失敗はまとめて報告する。1回あたりの時間も測って表示する。
+    """
+    reporter = reporter if reporter is not None else ProgressReporter()
+    # 変形設定は全アイテムで同じなので、辞書は1回だけ作る。
+    settings = dict(properties)
     applied = 0
-    for item in items:
-        try:
-            if item.SetProperty(dict(properties)):
-                applied += 1
-        except Exception as error:
-            print(f"  {label}の変形設定でエラー: {error}")
-            break
-    print(f"✓ {label}の配置を{applied}/{len(items)}クリップに適用しました")
+    errors = []
+    slowest = 0.0
+    reporter.start_stage(f"Applying the {len(items)} clip transforms")
+    started = time.perf_counter()
+    try:
+        for index, item in enumerate(items, start=1):
+            call_started = time.perf_counter()
+            try:
+                if item.SetProperty(settings):
+                    applied += 1
+                else:
+                    errors.append("SetPropertyがFalseを返しました")
+            except Exception as error:
+                errors.append(str(error))
+            slowest = max(slowest, time.perf_counter() - call_started)
+            reporter.child_output(
+                f"{index}/{len(items)} clips ({index * 100 / len(items):.0f}%)"
+            )
+    finally:
+        reporter.finish_stage(f"{applied}/{len(items)} clips")
+    elapsed = time.perf_counter() - started
+
+    for message in sorted(set(errors)):
+        print(f"  {label}の変形設定でエラー（{errors.count(message)}件）: {message}")
+    average = elapsed / len(items) * 1000 if items else 0.0
+    print(
+        f"✓ {label}の配置を{applied}/{len(items)}クリップに適用しました"
+        f"（{elapsed:.1f} 秒、平均 {average:.0f} ms、最長 {slowest * 1000:.0f} ms）"
+    )
     return applied
 
 
@@ -325,65 +509,269 @@ def append_ending_video(media_pool, record_frame) -> bool:
     return True
 
 
-def build_dual_source_timeline(project, media_pool, timeline, pair, start_frame) -> bool:
-    """mkv=V1 / mp4=V2 の2ソースタイムラインを組み立てる"""
-    print(f"✓ 画面録画: {pair.slides.name}")
-    print(f"✓ カメラ録画: {pair.camera.name}")
+def analyze_camera_audio(pair, cache=None):
+    """カメラの音声を1回だけデコードし、同期・時計のずれ・無音カットのすべてに使う"""
+    try:
+        camera = audio_sync.analyze_recording(pair.camera, cache=cache)
+    except audio_sync.AudioSyncError as error:
+        print(f"✗ カメラ音声を解析できません: {error}")
+        return None
+    print(f"✓ カメラ音声を解析: {camera.seconds / 60:.1f} 分")
+    return camera
+
+
+def cut_silence(camera, auto_editor):
+    """カメラ音声の無音を切り、(セグメント, カットリストのfps)を返す
+
+    auto-editorの audio と同じく、録画全体で一番大きい音に対する割合で閾値を
+    判定し、残す区間の前後にマージンを付ける。同期のために読んだ音声をそのまま
+    使うので、カメラのファイルをもう一度読むことはない。
+    """
+    try:
+        segments = dual_source.find_talking_segments(
+            camera.peaks,
+            camera.envelope_rate,
+            auto_editor.threshold_percent,
+            auto_editor.margin_seconds,
+        )
+    except dual_source.DualSourceError as error:
+        print(f"✗ 無音カットに失敗: {error}")
+        return None
+    return segments, float(dual_source.SILENCE_TIMEBASE)
+
+
+def cut_silence_with_auto_editor(pair):
+    """auto-editorで無音を切り、(セグメント, カットリストのfps)を返す"""
+    document = run_auto_editor_cut_list(
+        pair.camera, pair.folder / CUT_LIST_NAME, cache=CutListCache()
+    )
+    if document is None:
+        return None
+    try:
+        segments = dual_source.parse_cut_list(document)
+        cut_frame_rate = float(dual_source.cut_list_frame_rate(document))
+    except dual_source.DualSourceError as error:
+        print(f"✗ カットリストを読めません: {error}")
+        return None
+    return segments, cut_frame_rate
+
+
+def measure_clock_drift(pair, sync, cache=None, camera_envelope=None, slides_envelope=None):
+    """録画全体で2台の時計のずれを測り、(オフセット, ドリフト)を返す
+
+    カメラとPCの時計はわずかに速さが違い、冒頭で合わせても1時間で数フレーム
+    ずれていく。測れなければ冒頭で測った一定のオフセットをそのまま使う。
+    """
+    try:
+        drift = audio_sync.estimate_drift(
+            pair.slides,
+            pair.camera,
+            sync,
+            cache=cache,
+            target_envelope=camera_envelope,
+            reference_envelope=slides_envelope,
+        )
+    except audio_sync.AudioSyncError as error:
+        print(f"! 時計のずれは測れませんでした（一定のオフセットで配置します）: {error}")
+        return sync.offset_seconds, 0.0
+    print(
+        f"✓ 時計のずれ: {drift.drift * 1e6:+.0f} ppm"
+        f"（{len(drift.windows)}区間で測定、1時間あたり {drift.drift * 3600:+.3f} 秒）"
+    )
+    return drift.offset_seconds, drift.drift
 
-    frame_rate = resolve_session.timeline_frame_rate(timeline)
-    print(f"✓ タイムラインのフレームレート: {frame_rate}")
+
+@dataclass(frozen=True)
+class PairAnalysis:
+    """1組の録画から求めた、Resolveに依存しない解析結果"""
+
+    sync: audio_sync.SyncResult
+    offset_seconds: float
+    drift: float
+    segments: tuple
+    cut_frame_rate: float
+
+
+def analyze_pair(pair, use_auto_editor=False):
+    """同期・時計のずれ・無音カットを求める（失敗したらNone）
+
+    Resolveには触れないので、別プロセスでフォルダごとに並べて実行できる。
+    """
+    auto_editor = load_auto_editor_config()
+    warn_if_threshold_cannot_cut(auto_editor)
+
+    # 同じフォルダをやり直すときは、前回の解析結果を使いffmpegを走らせない。
+    cache = audio_sync.EnvelopeCache()
+    camera = analyze_camera_audio(pair, cache)
+    if camera is None:
+        return None
 
     # 音声で2本の録画を合わせる。一致しなければここで止める。
+    # 画面録画は時計のずれを測る長さで1回だけ読み、同期にもそのまま使う。
     try:
-        sync = audio_sync.estimate_offset(pair.slides, pair.camera)
+        slides_envelope = audio_sync.read_cached_envelope(
+            pair.slides, max_seconds=audio_sync.DEFAULT_DRIFT_MAX_SECONDS, cache=cache
+        )
+        sync = audio_sync.estimate_offset(
+            pair.slides,
+            pair.camera,
+            cache=cache,
+            target_envelope=camera.envelope,
+            reference_envelope=slides_envelope,
+        )
     except audio_sync.AudioSyncError as error:
         print(f"✗ 音声同期に失敗: {error}")
-        return False
+        return None
     print(
         f"✓ 音声同期: 画面録画の先頭はカメラの {sync.offset_seconds:.3f} 秒地点"
         f"（確度 {sync.confidence:.2f}）"
     )
+    if sync.is_ambiguous():
+        runner_up = sync.peaks[1][0]
+        print(
+            f"! 次点の候補 {runner_up:.3f} 秒も近い強さでした"
+            f"（ピーク比 {sync.peak_to_sidelobe:.2f}）。配置を目で確認してください"
+        )
+    offset_seconds, drift = measure_clock_drift(
+        pair, sync, cache, camera.envelope, slides_envelope
+    )
 
-    document = run_auto_editor_cut_list(pair.camera, pair.folder / CUT_LIST_NAME)
-    if document is None:
-        return False
-
-    try:
-        segments = dual_source.parse_cut_list(document)
-        cut_frame_rate = float(dual_source.cut_list_frame_rate(document))
-    except dual_source.DualSourceError as error:
-        print(f"✗ カットリストを読めません: {error}")
-        return False
+    if use_auto_editor:
+        cut = cut_silence_with_auto_editor(pair)
+    else:
+        cut = cut_silence(camera, auto_editor)
+    if cut is None:
+        return None
+    segments, cut_frame_rate = cut
 
     print(f"✓ 無音カット後のセグメント数: {len(segments)}")
+    return PairAnalysis(
+        sync=sync,
+        offset_seconds=offset_seconds,
+        drift=drift,
+        segments=segments,
+        cut_frame_rate=cut_frame_rate,
+    )
 
+
+def import_recordings(media_pool, pair):
+    """2本の録画を取り込み、タイムコードを揃えて (画面録画, カメラ) を返す"""
     imported = media_pool.ImportMedia([str(pair.slides), str(pair.camera)])
     if not imported or len(imported) < 2:
         print("✗ 素材のインポートに失敗しました")
-        return False
+        return None
     items_by_name = {item.GetName(): item for item in imported}
     slides_item = items_by_name.get(pair.slides.name)
     camera_item = items_by_name.get(pair.camera.name)
     if slides_item is None or camera_item is None:
         print("✗ インポートした素材を特定できませんでした")
-        return False
+        return None
 
     # 位置の計算はすべて素材の先頭からのフレーム数で行うので、先にタイムコードを
     # 揃える。ここを飛ばすとカメラだけ別の場面が並ぶ。
     if not all(normalize_start_timecode(item) for item in (slides_item, camera_item)):
         print("✗ 素材のタイムコードを揃えられないため中止します")
+        return None
+    return slides_item, camera_item
+
+
+def place_plan(project, media_pool, timeline, plan, slides_item, camera_item) -> bool:
+    """計画どおりにクリップを並べ、配置の設定とエンディングを加える"""
+    placements = plan.placements
+
+    if not ensure_video_tracks(timeline, dual_source.CAMERA_TRACK):
+        return False
+
+    project.SetCurrentTimeline(timeline)
+    media_by_role = {
+        "slides": slides_item,
+        "camera": camera_item,
+        "camera_audio": camera_item,
+    }
+    clip_infos = [p.to_clip_info(media_by_role[p.role]) for p in placements]
+    appended = append_clips_with_retry(media_pool, clip_infos)
+    if not appended:
+        print("✗ クリップの配置に失敗しました")
         return False
 
+    # 戻り値の並びは渡した順と同じなので、役割ごとに変形設定を分けられる
+    slide_items = [
+        item for placement, item in zip(placements, appended)
+        if placement.role == "slides" and item
+    ]
+    camera_items = [
+        item for placement, item in zip(placements, appended)
+        if placement.role == "camera" and item
+    ]
+    apply_clip_properties(slide_items, dual_source.SLIDES_PROPERTIES, "画面録画")
+    apply_clip_properties(camera_items, dual_source.CAMERA_PROPERTIES, "カメラ")
+
+    append_ending_video(media_pool, plan.end_frame)
+    return True
+
+
+def save_pair_plan(pair, plan, rates, start_frame, analysis) -> bool:
+    """計画をフォルダに保存する。Resolve側でやり直すときは解析を飛ばせる"""
+    plan_path = pair.folder / PLAN_NAME
+    try:
+        dual_source.save_plan(
+            dual_source.SavedPlan(
+                plan=plan,
+                rates=rates,
+                timeline_start_frame=start_frame,
+                slides_offset_seconds=analysis.offset_seconds,
+                slides_drift=analysis.drift,
+                recordings=dual_source.recording_identity(pair),
+                sync=analysis.sync.to_document(),
+            ),
+            plan_path,
+        )
+    except OSError as error:
+        print(f"! 配置計画を保存できません: {error}")
+        return False
+    print(f"✓ 配置計画を保存: {plan_path}")
+    return True
+
+
+def build_dual_source_timeline(
+    project, media_pool, timeline, pair, start_frame, use_auto_editor=False,
+    merge_gap_frames=0,
+) -> bool:
+    """mkv=V1 / mp4=V2 の2ソースタイムラインを組み立てる
+
+    無音カットは既定では同期で読んだカメラ音声から直接求める。use_auto_editor
+    を指定したときだけ、従来どおりauto-editorを実行する。merge_gap_frames
+    を指定すると、それより短い無音を挟むセグメントを1クリップにまとめる。
+    """
+    print(f"✓ 画面録画: {pair.slides.name}")
+    print(f"✓ カメラ録画: {pair.camera.name}")
+
+    frame_rate = resolve_session.timeline_frame_rate(timeline)
+    print(f"✓ タイムラインのフレームレート: {frame_rate}")
+
+    analysis = analyze_pair(pair, use_auto_editor)
+    if analysis is None:
+        return False
+    cut_frame_rate = analysis.cut_frame_rate
+
+    items = import_recordings(media_pool, pair)
+    if items is None:
+        return False
+    slides_item, camera_item = items
+
     try:
         slides_frame_count = int(slides_item.GetClipProperty("Frames"))
     except (TypeError, ValueError):
         slides_frame_count = None
 
-    # タイムラインと素材のfpsは一致しない前提で、秒に直してから配置する
+    # タイムラインと素材のfpsは一致しない前提で、秒に直してから配置する。
+    # auto-editorのカットリストはカメラのfpsで数えるが、内蔵の検出は違うので
+    # カメラのfpsが読めないときの代わりにはしない。
+    camera_fallback = cut_frame_rate if use_auto_editor else frame_rate
     rates = dual_source.FrameRates(
         timeline=frame_rate,
         slides=clip_frame_rate(slides_item, frame_rate),
-        camera=clip_frame_rate(camera_item, cut_frame_rate),
+        camera=clip_frame_rate(camera_item, camera_fallback),
         cut_list=cut_frame_rate,
     )
     print(
@@ -393,47 +781,208 @@ def build_dual_source_timeline(project, media_pool, timeline, pair, start_frame)
 
     try:
         plan = dual_source.build_placements(
-            segments,
+            analysis.segments,
             rates=rates,
-            slides_offset_seconds=sync.offset_seconds,
+            slides_offset_seconds=analysis.offset_seconds,
             timeline_start_frame=start_frame,
             slides_frame_count=slides_frame_count,
+            slides_drift=analysis.drift,
+            merge_gap_frames=merge_gap_frames,
         )
     except dual_source.DualSourceError as error:
         print(f"✗ タイムラインを組み立てられません: {error}")
         return False
     print(f"✓ 配置計画: {plan.describe()}")
-    placements = plan.placements
+    # 配置が途中で失敗しても、--from-plan で解析をやり直さずに再開できる。
+    save_pair_plan(pair, plan, rates, start_frame, analysis)
 
-    if not ensure_video_tracks(timeline, dual_source.CAMERA_TRACK):
+    return place_plan(project, media_pool, timeline, plan, slides_item, camera_item)
+
+
+def replay_dual_source_plan(project, media_pool, timeline, pair, start_frame) -> bool:
+    """保存した配置計画から、解析をせずに取り込みと配置だけを行う"""
+    plan_path = pair.folder / PLAN_NAME
+    try:
+        saved = dual_source.load_plan(plan_path)
+    except dual_source.DualSourceError as error:
+        print(f"✗ 配置計画を読めません: {error}")
+        return False
+    try:
+        unchanged = dual_source.recording_identity(pair) == saved.recordings
+    except OSError:
+        unchanged = False
+    if not unchanged:
+        print("✗ 計画した後に録画が変わっています。--from-plan なしでやり直してください")
         return False
 
-    project.SetCurrentTimeline(timeline)
-    media_by_role = {
-        "slides": slides_item,
-        "camera": camera_item,
-        "camera_audio": camera_item,
-    }
-    clip_infos = [p.to_clip_info(media_by_role[p.role]) for p in placements]
-    appended = append_clips_with_retry(media_pool, clip_infos)
-    if not appended:
-        print("✗ クリップの配置に失敗しました")
+    frame_rate = resolve_session.timeline_frame_rate(timeline)
+    if abs(frame_rate - saved.rates.timeline) > 1e-6:
+        print(
+            f"✗ タイムラインのfps {frame_rate} が計画時の {saved.rates.timeline} と"
+            "違います。--timeline-frame-rate を合わせて計画し直してください"
+        )
         return False
+    if saved.sync is not None:
+        try:
+            sync = audio_sync.SyncResult.from_document(saved.sync)
+        except audio_sync.AudioSyncError as error:
+            print(f"! 保存した同期結果を読めません: {error}")
+        else:
+            print(
+                f"✓ 音声同期（計画時）: 画面録画の先頭はカメラの {sync.offset_seconds:.3f} 秒地点"
+                f"（確度 {sync.confidence:.2f}）"
+            )
+    plan = saved.placed_at(start_frame)
+    print(f"✓ 配置計画を読み込み: {plan.describe()}")
+
+    items = import_recordings(media_pool, pair)
+    if items is None:
+        return False
+    return place_plan(project, media_pool, timeline, plan, *items)
 
-    # 戻り値の並びは渡した順と同じなので、役割ごとに変形設定を分けられる
-    slide_items = [
-        item for placement, item in zip(placements, appended)
-        if placement.role == "slides" and item
-    ]
-    camera_items = [
-        item for placement, item in zip(placements, appended)
-        if placement.role == "camera" and item
+
+def probe_recording(path):
+    """録画の映像のfpsとフレーム数をffprobeで読む（読めなければNone）
+
+    Resolveを開かずに計画するときに、素材のプロパティの代わりに使う。
+    フレーム数が書かれていないmkvは、長さとfpsから求める。
+    """
+    command = [
+        "ffprobe", "-v", "error", "-select_streams", "v:0",
+        "-show_entries", "stream=avg_frame_rate,nb_frames,duration:format=duration",
+        "-of", "json", str(path),
     ]
-    apply_clip_properties(slide_items, dual_source.SLIDES_PROPERTIES, "画面録画")
-    apply_clip_properties(camera_items, dual_source.CAMERA_PROPERTIES, "カメラ")
+    try:
+        result = subprocess.run(command, capture_output=True, check=True)
+        data = json.loads(result.stdout)
+        stream = data["streams"][0]
+        frame_rate = float(Fraction(stream["avg_frame_rate"]))
+    except (
+        OSError, subprocess.CalledProcessError, ValueError, KeyError, IndexError,
+        ZeroDivisionError,
+    ) as error:
+        print(f"✗ 録画の情報を読めません: {Path(path).name}: {error}")
+        return None
+    if frame_rate <= 0:
+        print(f"✗ 録画のfpsを読めません: {Path(path).name}")
+        return None
+
+    frames = stream.get("nb_frames")
+    if not str(frames).isdigit():
+        duration = stream.get("duration") or data.get("format", {}).get("duration")
+        try:
+            frames = round(float(duration) * frame_rate)
+        except (TypeError, ValueError):
+            frames = None
+    return frame_rate, None if frames is None else int(frames)
+
+
+def plan_recording_pair(
+    pair, timeline_frame_rate, use_auto_editor=False, merge_gap_frames=0
+):
+    """Resolveを開かずに1組を解析し、配置計画をフォルダに保存する
+
+    計画はタイムラインの先頭から数える。オープニングの長さは取り込むときに分かる。
+    """
+    print(f"✓ 対象フォルダ: {pair.folder}")
+    analysis = analyze_pair(pair, use_auto_editor)
+    if analysis is None:
+        return None
+    slides = probe_recording(pair.slides)
+    camera = probe_recording(pair.camera)
+    if slides is None or camera is None:
+        return None
+
+    try:
+        rates = dual_source.FrameRates(
+            timeline=timeline_frame_rate,
+            slides=slides[0],
+            camera=camera[0],
+            cut_list=analysis.cut_frame_rate,
+        )
+        plan = dual_source.build_placements(
+            analysis.segments,
+            rates=rates,
+            slides_offset_seconds=analysis.offset_seconds,
+            slides_frame_count=slides[1],
+            slides_drift=analysis.drift,
+            merge_gap_frames=merge_gap_frames,
+        )
+    except dual_source.DualSourceError as error:
+        print(f"✗ タイムラインを組み立てられません: {error}")
+        return None
+    print(f"✓ 配置計画: {plan.describe()}")
+
+    if not save_pair_plan(pair, plan, rates, 0, analysis):
+        return None
+    return plan
 
-    append_ending_video(media_pool, plan.end_frame)
-    return True
+
+def _plan_folder(
+    folder, slides, camera, timeline_frame_rate, use_auto_editor, merge_gap_frames
+):
+    """ワーカープロセスで1フォルダを計画し、その出力をまとめて返す
+
+    並列に走るフォルダの表示が混ざらないよう、出力は親がフォルダ順に表示する。
+    プロセス間を渡るのはパスだけにする。
+    """
+    started = time.perf_counter()
+    pair = dual_source.RecordingPair(folder=folder, slides=slides, camera=camera)
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        try:
+            planned = (
+                plan_recording_pair(
+                    pair, timeline_frame_rate, use_auto_editor, merge_gap_frames
+                )
+                is not None
+            )
+        except Exception as error:
+            # 1フォルダの想定外の失敗で、ほかのフォルダの結果まで失わない。
+            print(f"✗ 想定外のエラー: {error!r}")
+            planned = False
+    return {
+        "folder": str(folder),
+        "planned": planned,
+        "log": log.getvalue(),
+        "seconds": round(time.perf_counter() - started, 2),
+    }
+
+
+def plan_course(
+    working_dir, timeline_frame_rate=PLANNED_TIMELINE_FRAME_RATE, workers=None,
+    use_auto_editor=False, merge_gap_frames=0,
+):
+    """作業フォルダ内のすべてのペアを別プロセスで並べて計画する
+
+    解析はフォルダごとに独立しているので並列に進める。Resolveへの取り込みだけは
+    1つずつしかできないので、ここではしない。
+    """
+    pairs = dual_source.find_recording_pairs(Path(working_dir))
+    if not pairs:
+        print("✗ mkv 1本 + mp4 1本のサブフォルダが見つかりません")
+        return ()
+
+    workers = workers or max(1, min(len(pairs), (os.cpu_count() or 2) // 2))
+    print(f"✓ {len(pairs)} フォルダを {workers} プロセスで計画します")
+    reports = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for report in pool.map(
+            _plan_folder,
+            [pair.folder for pair in pairs],
+            [pair.slides for pair in pairs],
+            [pair.camera for pair in pairs],
+            [timeline_frame_rate] * len(pairs),
+            [use_auto_editor] * len(pairs),
+            [merge_gap_frames] * len(pairs),
+        ):
+            print(report["log"], end="")
+            mark = "✓" if report["planned"] else "✗"
+            print(f"{mark} {Path(report['folder']).name}（{report['seconds']:.1f} 秒）")
+            reports.append(report)
+    planned = sum(1 for report in reports if report["planned"])
+    print(f"✓ 計画済み {planned} / {len(reports)} フォルダ")
+    return tuple(reports)
 
 
 def resolve_recording_dir(explicit):
@@ -453,8 +1002,53 @@ def main(argv=None) -> int:
         "--folder",
         help="処理するサブフォルダを直接指定する（省略時は最新のペアを使う）",
     )
+    parser.add_argument(
+        "--auto-editor",
+        action="store_true",
+        help="無音カットを内蔵の検出ではなくauto-editorで行う",
+    )
+    parser.add_argument(
+        "--plan-all",
+        action="store_true",
+        help="録画フォルダ内のすべてのペアを並列で解析し、配置計画だけを保存する"
+        "（Resolveは開かない）",
+    )
+    parser.add_argument(
+        "--timeline-frame-rate",
+        type=float,
+        default=PLANNED_TIMELINE_FRAME_RATE,
+        help="--plan-all で計画するタイムラインのfps",
+    )
+    parser.add_argument("--workers", type=int, help="--plan-all で同時に解析するフォルダ数")
+    parser.add_argument(
+        "--merge-gap-frames",
+        type=int,
+        default=0,
+        help="この長さ（タイムラインのフレーム数）より短い無音はカットせず、"
+        "前後のセグメントを1クリップにまとめる（既定は0でまとめない）",
+    )
+    parser.add_argument(
+        "--from-plan",
+        action="store_true",
+        help="保存した配置計画を使い、解析をせずに取り込みと配置だけを行う",
+    )
     arguments = parser.parse_args(argv)
 
+    if arguments.plan_all:
+        recording_dir = resolve_recording_dir(arguments.recording_dir)
+        if not recording_dir:
+            print("✗ OBS録画フォルダが見つかりません")
+            return 1
+        print(f"✓ 録画フォルダ: {recording_dir}")
+        reports = plan_course(
+            recording_dir,
+            timeline_frame_rate=arguments.timeline_frame_rate,
+            workers=arguments.workers,
+            use_auto_editor=arguments.auto_editor,
+            merge_gap_frames=arguments.merge_gap_frames,
+        )
+        return 0 if reports and all(report["planned"] for report in reports) else 1
+
     print("DaVinci Resolve 2ソース自動編集（画面録画 + カメラ）開始")
 
     if arguments.folder:
@@ -498,7 +1092,15 @@ def main(argv=None) -> int:
         return 1
 
     start_frame = find_opening_end_frame(timeline)
-    if not build_dual_source_timeline(project, media_pool, timeline, pair, start_frame):
+    if arguments.from_plan:
+        built = replay_dual_source_plan(project, media_pool, timeline, pair, start_frame)
+    else:
+        built = build_dual_source_timeline(
+            project, media_pool, timeline, pair, start_frame,
+            use_auto_editor=arguments.auto_editor,
+            merge_gap_frames=arguments.merge_gap_frames,
+        )
+    if not built:
         print("✗ 2ソース編集に失敗しました")
         return 1
 
@@ -2,6 +2,7 @@
 """Create a highlight-first long-form video without the Resolve API."""
 
 import argparse
+import hashlib
 import json
 import os
 import shlex
@@ -9,7 +10,8 @@ import shutil
 import subprocess
 import sys
 from collections import deque
-from dataclasses import asdict, dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
 from pathlib import Path
 from typing import Any, Sequence
 
@@ -21,6 +23,11 @@ if str(_REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(_REPO_ROOT))
 
 from auto_editor_config import AutoEditorConfig, parse_auto_editor_config  # noqa: E402
+from dual_source import (  # noqa: E402
+    cut_list_frame_rate,
+    parse_cut_list,
+    read_cut_list_document,
+)
 from highlight_plan import (  # noqa: E402
     Highlight,
     HighlightPlan,
@@ -34,14 +41,30 @@ from highlight_plan import (  # noqa: E402
     shorten_text,
 )
 from progress import ProgressReporter, format_clock  # noqa: E402
+from sound_design import SFX_MIX  # noqa: E402
+from timeline import (  # noqa: E402
+    HIGHLIGHT,
+    Slice,
+    build_timeline,
+    cut_slices,
+    resolve_slices,
+    to_cut_master,
+    total_duration,
+)
 
 SCHEMA_VERSION = 1
 MAXIMUM_CAPTURED_LINES = 400
+STAGE_CACHE_NAME = "stage_cache.json"
+# Whisper resamples every input to 16 kHz mono before it listens to anything.
+TRANSCRIPT_SAMPLE_RATE = 16000
+# The same v3 timeline under the --export name each auto-editor version knows.
+CUT_LIST_EXPORTS = ("v3", "json")
 
 __all__ = [
     "Highlight",
     "HighlightPlan",
     "PipelineConfig",
+    "StageCache",
     "VideoInfo",
     "ai_plan_schema",
     "build_ai_plan",
@@ -63,6 +86,7 @@ class VideoInfo:
     duration: float
     width: int
     height: int
+    frame_rate: float = 0.0
 
 
 @dataclass(frozen=True)
@@ -81,6 +105,92 @@ class PipelineConfig:
     manual_highlights: tuple[dict[str, float], ...] = ()
     transcript_command: tuple[str, ...] = ()
     auto_editor: AutoEditorConfig = AutoEditorConfig()
+    cut_list_only: bool = False
+    pipelined: bool = False
+
+
+def file_identity(path: Path) -> list[Any]:
+    """Return what changes whenever a file is replaced or rewritten."""
+    status = path.stat()
+    return [str(path.resolve()), status.st_size, status.st_mtime_ns]
+
+
+def stage_key(*parts: Any) -> str:
+    """Digest everything a stage's output depends on into one cache key."""
+    identity = json.dumps(parts, ensure_ascii=False, default=str)
+    return hashlib.sha1(identity.encode("utf-8")).hexdigest()
+
+
+class StageCache:
+    """Remember which stage outputs in an output directory match their inputs.
+
+    Every entry names the artifact a stage wrote, the key of the inputs it was
+    made from, and the artifact's own size and modification time. A stage is
+    skipped only when all three still agree, so a changed recording, a changed
+    silence threshold or transcript command, or an artifact rewritten by hand
+    all run the stage again. An unreadable cache file is an empty cache.
+    """
+
+    def __init__(self, output_dir: Path, *, enabled: bool = True) -> None:
+        self.path = output_dir / STAGE_CACHE_NAME
+        self.enabled = enabled
+        self.hits: list[str] = []
+        self._entries: dict[str, dict[str, Any]] = {}
+        if enabled:
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            if isinstance(data, dict):
+                self._entries = {
+                    stage: entry for stage, entry in data.items() if isinstance(entry, dict)
+                }
+
+    def lookup(self, stage: str, key: str) -> dict[str, Any] | None:
+        """Return a stage's entry when its artifact can be reused, else None."""
+        entry = self._valid_entry(stage, key)
+        if entry is not None and stage not in self.hits:
+            self.hits.append(stage)
+        return entry
+
+    def holds(self, stage: str, key: str) -> bool:
+        """Tell whether a stage will be reused, without counting it as a hit."""
+        return self._valid_entry(stage, key) is not None
+
+    def _valid_entry(self, stage: str, key: str) -> dict[str, Any] | None:
+        entry = self._entries.get(stage) if self.enabled else None
+        if entry is None or entry.get("key") != key:
+            return None
+        artifact = Path(str(entry.get("artifact", "")))
+        try:
+            status = artifact.stat()
+        except OSError:
+            return None
+        if status.st_size == 0 or [status.st_size, status.st_mtime_ns] != entry.get(
+            "artifact_identity"
+        ):
+            return None
+        return entry
+
+    def store(self, stage: str, key: str, artifact: Path, **details: Any) -> None:
+        """Record a stage's fresh output; failing to write only loses the cache."""
+        if not self.enabled:
+            return
+        status = artifact.stat()
+        self._entries[stage] = {
+            "key": key,
+            "artifact": str(artifact),
+            "artifact_identity": [status.st_size, status.st_mtime_ns],
+            **details,
+        }
+        partial = self.path.with_name(f"{self.path.name}.partial")
+        try:
+            partial.write_text(
+                json.dumps(self._entries, ensure_ascii=False, indent=2), encoding="utf-8"
+            )
+            partial.replace(self.path)
+        except OSError:
+            pass
 
 
 def build_ai_plan(
@@ -251,18 +361,157 @@ def render_cut_master(
     raise RuntimeError("auto-editor could not preserve the recording")
 
 
+def export_cut_list(
+    source: Path,
+    output_dir: Path,
+    reporter: ProgressReporter | None = None,
+    auto_editor: AutoEditorConfig = AutoEditorConfig(),
+) -> Path | None:
+    """Ask auto-editor only where the silences are, without rendering anything.
+
+    Returns the v3 timeline it wrote, or None when the silence cut would empty
+    the timeline and the whole recording is kept, as `render_cut_master` does.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    requested = output_dir / f"{source.stem}.cut_list.v3"
+    for export in CUT_LIST_EXPORTS:
+        for stale in output_dir.glob(f"{source.stem}.cut_list.*"):
+            stale.unlink()
+        command = [
+            "auto-editor",
+            str(source),
+            "--no-open",
+            "--margin",
+            auto_editor.margin,
+            "--edit",
+            auto_editor.edit_expression,
+            "--export",
+            export,
+            "-o",
+            str(requested),
+        ]
+        try:
+            _run(command, cwd=source.parent, reporter=reporter)
+        except subprocess.CalledProcessError as error:
+            diagnostic = f"{error.stdout}\n{error.stderr}"
+            if "Timeline is empty" in diagnostic:
+                if reporter is not None:
+                    reporter.warn("silence cut emptied the timeline, keeping every cut")
+                return None
+            if "Invalid export format" in diagnostic or "Export must be" in diagnostic:
+                continue
+            raise
+        # Newer versions replace the extension they were given with their own.
+        written = sorted(output_dir.glob(f"{source.stem}.cut_list.*"))
+        if written and written[0].stat().st_size > 0:
+            return written[0]
+        raise RuntimeError("auto-editor did not write a cut list")
+    raise RuntimeError("auto-editor cannot export a v3 cut list")
+
+
+def read_cut(path: Path | None, duration: float) -> tuple[Slice, ...]:
+    """Read a cut list as slices of the recording, kept within its duration."""
+    if path is None:
+        return cut_slices([(0.0, duration)])
+    document = read_cut_list_document(path)
+    frame_rate = float(cut_list_frame_rate(document))
+    return cut_slices(
+        (segment.source_frame / frame_rate, min(duration, segment.source_end / frame_rate))
+        for segment in parse_cut_list(document)
+    )
+
+
+def map_segments_to_cut(
+    segments: Sequence[dict[str, Any]], cut: Sequence[Slice]
+) -> list[dict[str, Any]]:
+    """Move transcript timestamps from the recording onto the cut master.
+
+    Segments spoken entirely inside a removed silence are dropped, so every
+    index the planners see still points at words the viewer hears.
+    """
+    mapped: list[dict[str, Any]] = []
+    for item in segments:
+        placed = to_cut_master(
+            cut, float(item.get("start", 0)), float(item.get("end", 0))
+        )
+        if placed is not None:
+            mapped.append({**item, "start": round(placed[0], 3), "end": round(placed[1], 3)})
+    return mapped
+
+
+def wants_audio(command_template: Sequence[str]) -> bool:
+    """Tell whether a transcription command listens to the extracted audio."""
+    return not command_template or any("{audio}" in token for token in command_template)
+
+
+def extract_audio(media: Path, output_dir: Path) -> Path:
+    """Decode the soundtrack once into the 16 kHz mono WAV a speech model reads.
+
+    Whisper would otherwise demux and decode the whole video itself just to
+    throw the picture away, and the WAV is a small fraction of a 40 Mbit/s
+    video on a synced folder.
+    """
+    ffmpeg = shutil.which("ffmpeg")
+    if not ffmpeg:
+        raise FileNotFoundError("ffmpeg command was not found")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output = output_dir / f"{media.stem}.wav"
+    partial = output_dir / f"{media.stem}.partial.wav"
+    _run(
+        [
+            ffmpeg,
+            "-y",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-i",
+            str(media),
+            "-vn",
+            "-ac",
+            "1",
+            "-ar",
+            str(TRANSCRIPT_SAMPLE_RATE),
+            "-c:a",
+            "pcm_s16le",
+            str(partial),
+        ]
+    )
+    if not partial.exists() or partial.stat().st_size == 0:
+        raise RuntimeError("ffmpeg did not extract the audio to transcribe")
+    partial.replace(output)
+    return output
+
+
+def start_audio_extraction(media: Path, output_dir: Path) -> Future[Path]:
+    """Begin extracting the transcription audio while the caller keeps working."""
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        return executor.submit(extract_audio, media, output_dir)
+    finally:
+        executor.shutdown(wait=False)
+
+
 def transcribe_cut_master(
     source: Path,
     output_dir: Path,
     command_template: Sequence[str] = (),
     reporter: ProgressReporter | None = None,
+    audio: Path | None = None,
 ) -> Path:
-    """Transcribe the cut master so all timestamps match the final body."""
+    """Transcribe the cut master so all timestamps match the final body.
+
+    `audio` is the soundtrack `extract_audio` wrote. The default Whisper call
+    listens to it instead of the video, and a custom command receives it as
+    `{audio}`; without it `{audio}` is the video itself.
+    """
     output_dir.mkdir(parents=True, exist_ok=True)
     if command_template:
         command = [
             token.format(
-                input=str(source), output_dir=str(output_dir), stem=source.stem
+                input=str(source),
+                audio=str(audio or source),
+                output_dir=str(output_dir),
+                stem=source.stem,
             )
             for token in command_template
         ]
@@ -272,7 +521,7 @@ def transcribe_cut_master(
             raise FileNotFoundError("whisper command was not found")
         command = [
             whisper,
-            str(source),
+            str(audio or source),
             "--language",
             "Japanese",
             "--output_format",
@@ -294,8 +543,18 @@ def transcribe_cut_master(
     return candidates[-1]
 
 
+def _frame_rate(value: str) -> float:
+    """Read an ffprobe rate such as "30000/1001", or 0.0 when it is unknown."""
+    numerator, _, denominator = value.partition("/")
+    try:
+        rate = float(numerator) / float(denominator or 1)
+    except (ValueError, ZeroDivisionError):
+        return 0.0
+    return rate if rate > 0 else 0.0
+
+
 def probe_video(path: Path) -> VideoInfo:
-    """Read duration and resolution with ffprobe."""
+    """Read duration, resolution and frame rate with ffprobe."""
     ffprobe = shutil.which("ffprobe")
     if not ffprobe:
         raise FileNotFoundError("ffprobe command was not found")
@@ -305,7 +564,7 @@ def probe_video(path: Path) -> VideoInfo:
             "-v",
             "error",
             "-show_entries",
-            "format=duration:stream=codec_type,width,height",
+            "format=duration:stream=codec_type,width,height,r_frame_rate",
             "-of",
             "json",
             str(path),
@@ -321,6 +580,7 @@ def probe_video(path: Path) -> VideoInfo:
         duration=float(data["format"]["duration"]),
         width=int(video["width"]),
         height=int(video["height"]),
+        frame_rate=_frame_rate(str(video.get("r_frame_rate", ""))),
     )
 
 
@@ -376,32 +636,59 @@ def _escape_filter_filename(name: str) -> str:
     )
 
 
-def build_ffmpeg_command(
-    source: Path,
-    subtitle: Path,
-    output: Path,
-    plan: HighlightPlan,
-) -> list[str]:
-    """Build H1[,H2...] + complete body with a large opening title."""
+def _trim_filters(
+    pieces: Sequence[tuple[float, float]],
+) -> tuple[list[str], list[str]]:
+    """Trim every piece out of the first input, returning filters and concat pads."""
     filters: list[str] = []
     concat_inputs: list[str] = []
-    for index, highlight in enumerate(plan.highlights):
+    for index, (start, end) in enumerate(pieces):
         filters.append(
-            f"[0:v]trim=start={highlight.start:.3f}:end={highlight.end:.3f},"
+            f"[0:v]trim=start={start:.3f}:end={end:.3f},"
             f"setpts=PTS-STARTPTS[v{index}]"
         )
         filters.append(
-            f"[0:a]atrim=start={highlight.start:.3f}:end={highlight.end:.3f},"
+            f"[0:a]atrim=start={start:.3f}:end={end:.3f},"
             f"asetpts=PTS-STARTPTS[a{index}]"
         )
         concat_inputs.append(f"[v{index}][a{index}]")
-    filters.extend(
-        ["[0:v]setpts=PTS-STARTPTS[vmain]", "[0:a]asetpts=PTS-STARTPTS[amain]"]
-    )
-    concat_inputs.append("[vmain][amain]")
+    return filters, concat_inputs
+
+
+def build_ffmpeg_command(
+    source: Path,
+    subtitle: Path,
+    output: Path,
+    plan: HighlightPlan,
+    *,
+    cut: Sequence[Slice] = (),
+    body: bool = True,
+) -> list[str]:
+    """Build H1[,H2...] + complete body with a large opening title.
+
+    With a `cut` the source is the original recording, and the highlights and
+    the body are trimmed out of it piece by piece, so the silence cut costs no
+    encode of its own. Without the `body` the command renders only the opening
+    reel, for `build_stitch_command` to join to a body encoded separately.
+    """
+    pieces: list[tuple[float, float]] = [
+        (highlight.start, highlight.end) for highlight in plan.highlights
+    ]
+    if cut:
+        timeline = build_timeline(plan.highlights, total_duration(cut))
+        pieces = [
+            (item.source_start, item.source_end)
+            for item in resolve_slices(timeline, cut)
+            if body or item.kind == HIGHLIGHT
+        ]
+    filters, concat_inputs = _trim_filters(pieces)
+    if body and not cut:
+        filters.extend(
+            ["[0:v]setpts=PTS-STARTPTS[vmain]", "[0:a]asetpts=PTS-STARTPTS[amain]"]
+        )
+        concat_inputs.append("[vmain][amain]")
     filters.append(
-        "".join(concat_inputs)
-        + f"concat=n={len(plan.highlights) + 1}:v=1:a=1[basev][outa]"
+        "".join(concat_inputs) + f"concat=n={len(concat_inputs)}:v=1:a=1[basev][outa]"
     )
     filters.append(f"[basev]ass={_escape_filter_filename(subtitle.name)}[outv]")
     return [
@@ -437,28 +724,252 @@ def build_ffmpeg_command(
     ]
 
 
+def build_body_command(
+    source: Path,
+    output: Path,
+    *,
+    cut: Sequence[Slice] = (),
+    crf: int = 16,
+    preset: str = "medium",
+) -> list[str]:
+    """Build the encode of the complete body alone, with nothing drawn over it.
+
+    The body needs neither the transcript nor the plan, so it can be encoded
+    while they are still being made. Its encoder settings must match the reel
+    it is stitched to, because the join copies both streams unchanged.
+    """
+    if cut:
+        filters, concat_inputs = _trim_filters(
+            [(item.source_start, item.source_end) for item in cut]
+        )
+        filters.append(
+            "".join(concat_inputs) + f"concat=n={len(concat_inputs)}:v=1:a=1[outv][outa]"
+        )
+    else:
+        filters = ["[0:v]setpts=PTS-STARTPTS[outv]", "[0:a]asetpts=PTS-STARTPTS[outa]"]
+    return [
+        "ffmpeg",
+        "-y",
+        "-hide_banner",
+        "-loglevel",
+        "warning",
+        "-i",
+        str(source),
+        "-filter_complex",
+        ";".join(filters),
+        "-map",
+        "[outv]",
+        "-map",
+        "[outa]",
+        "-c:v",
+        "libx264",
+        "-preset",
+        preset,
+        "-crf",
+        str(crf),
+        "-c:a",
+        "aac",
+        "-b:a",
+        "320k",
+        # A fallback can deliver the body as it is, so it is written like
+        # every other finished video.
+        "-movflags",
+        "+faststart",
+        str(output),
+    ]
+
+
+def write_concat_list(parts: Sequence[Path], playlist: Path) -> Path:
+    """Write the file list the concat demuxer reads, quoting every path."""
+    lines = [
+        "file '" + str(part.resolve()).replace("'", "'\\''") + "'" for part in parts
+    ]
+    playlist.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return playlist
+
+
+def build_stitch_command(
+    playlist: Path, output: Path, *, sfx: Path | None = None
+) -> list[str]:
+    """Join parts that share one encoding without encoding the picture again.
+
+    With `sfx` the sound effect track is mixed under the joined narration;
+    only the audio is encoded for that, the video is still copied.
+    """
+    command = [
+        "ffmpeg",
+        "-y",
+        "-hide_banner",
+        "-loglevel",
+        "warning",
+        "-stats",
+        "-f",
+        "concat",
+        "-safe",
+        "0",
+        "-i",
+        str(playlist),
+    ]
+    if sfx is None:
+        command.extend(["-c", "copy"])
+    else:
+        command.extend(
+            [
+                "-i",
+                str(sfx),
+                "-filter_complex",
+                f"[0:a][1:a]{SFX_MIX}[outa]",
+                "-map",
+                "0:v",
+                "-map",
+                "[outa]",
+                "-c:v",
+                "copy",
+                "-c:a",
+                "aac",
+                "-b:a",
+                "320k",
+            ]
+        )
+    command.extend(["-movflags", "+faststart", str(output)])
+    return command
+
+
+class BackgroundRender:
+    """An FFmpeg encode running beside the rest of the pipeline.
+
+    Its diagnostics go to a log file next to the output instead of the console,
+    where they would interleave with the stage that is running in front.
+    """
+
+    def __init__(self, command: Sequence[str], output: Path, *, cwd: Path) -> None:
+        self.command = list(command)
+        self.output = output
+        self.log = output.with_name(f"{output.stem}.log")
+        if output.exists():
+            output.unlink()
+        with self.log.open("w", encoding="utf-8") as log:
+            self._process = subprocess.Popen(
+                self.command,
+                cwd=str(cwd),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=log,
+            )
+
+    def wait(self) -> Path:
+        """Wait for the encode and return its output, or raise why it failed."""
+        returncode = self._process.wait()
+        if returncode != 0:
+            diagnostic = self.log.read_text(encoding="utf-8", errors="replace")
+            raise subprocess.CalledProcessError(
+                returncode, self.command, diagnostic[-4000:], ""
+            )
+        if not self.output.exists() or self.output.stat().st_size == 0:
+            raise RuntimeError(f"ffmpeg did not create {self.output.name}")
+        return self.output
+
+    def cancel(self) -> None:
+        """Stop an encode that is no longer needed and remove what it wrote."""
+        if self._process.poll() is None:
+            self._process.kill()
+            self._process.wait()
+        if self.output.exists():
+            self.output.unlink()
+
+    def close(self) -> None:
+        """Stop the encode if it is still running; a finished output is kept."""
+        if self._process.poll() is None:
+            self.cancel()
+
+
+def use_filter_script(command: list[str], script: Path) -> list[str]:
+    """Move the filter graph of a command into a file ffmpeg reads instead.
+
+    A cut list trims a long recording hundreds of times, and Windows refuses
+    any command line longer than 32,767 characters.
+    """
+    index = command.index("-filter_complex")
+    script.write_text(command[index + 1], encoding="utf-8")
+    return [
+        *command[:index],
+        "-filter_complex_script",
+        str(script),
+        *command[index + 2 :],
+    ]
+
+
 def render_highlight_video(
     source: Path,
     subtitle: Path,
     output: Path,
     plan: HighlightPlan,
     reporter: ProgressReporter | None = None,
+    *,
+    cut: Sequence[Slice] = (),
 ) -> Path:
     """Render the final highlight-first MP4 and reject partial output."""
     if not shutil.which("ffmpeg"):
         raise FileNotFoundError("ffmpeg command was not found")
     if output.exists():
         output.unlink()
-    _run(
-        build_ffmpeg_command(source, subtitle, output, plan),
-        cwd=subtitle.parent,
-        reporter=reporter,
-    )
+    command = build_ffmpeg_command(source, subtitle, output, plan, cut=cut)
+    if cut:
+        command = use_filter_script(command, subtitle.with_name("render_graph.txt"))
+    _run(command, cwd=subtitle.parent, reporter=reporter)
     if not output.exists() or output.stat().st_size == 0:
         raise RuntimeError("ffmpeg did not create a usable highlighted video")
     return output
 
 
+def start_body_render(
+    media: Path,
+    output_dir: Path,
+    stem: str,
+    cut: Sequence[Slice] = (),
+    *,
+    crf: int = 16,
+    preset: str = "medium",
+) -> BackgroundRender:
+    """Begin encoding the complete body while the transcript and plan are made."""
+    body = output_dir / f"{stem}.body.mp4"
+    command = build_body_command(media, body, cut=cut, crf=crf, preset=preset)
+    if cut:
+        command = use_filter_script(command, output_dir / "body_graph.txt")
+    return BackgroundRender(command, body, cwd=output_dir)
+
+
+def render_stitched_video(
+    source: Path,
+    subtitle: Path,
+    output: Path,
+    plan: HighlightPlan,
+    body_render: BackgroundRender,
+    reporter: ProgressReporter | None = None,
+    *,
+    cut: Sequence[Slice] = (),
+) -> Path:
+    """Render only the opening reel, then join it to the body encoded meanwhile."""
+    if not shutil.which("ffmpeg"):
+        raise FileNotFoundError("ffmpeg command was not found")
+    reel = output.with_name(f"{output.stem}.reel.mp4")
+    for stale in (reel, output):
+        if stale.exists():
+            stale.unlink()
+    command = build_ffmpeg_command(source, subtitle, reel, plan, cut=cut, body=False)
+    if cut:
+        command = use_filter_script(command, subtitle.with_name("reel_graph.txt"))
+    _run(command, cwd=subtitle.parent, reporter=reporter)
+    if not reel.exists() or reel.stat().st_size == 0:
+        raise RuntimeError("ffmpeg did not create a usable highlight reel")
+    body = body_render.wait()
+    playlist = write_concat_list((reel, body), output.with_name(f"{output.stem}.parts.txt"))
+    _run(build_stitch_command(playlist, output), cwd=subtitle.parent, reporter=reporter)
+    if not output.exists() or output.stat().st_size == 0:
+        raise RuntimeError("ffmpeg did not join the reel and the body")
+    return output
+
+
 def _read_segments(path: Path) -> list[dict[str, Any]]:
     data = json.loads(path.read_text(encoding="utf-8"))
     segments = data.get("segments", []) if isinstance(data, dict) else []
@@ -469,18 +980,21 @@ def _write_manifest(
     output_dir: Path,
     *,
     source: Path,
-    cut_master: Path,
+    cut_master: Path | None,
     transcript: Path | None,
     plan: HighlightPlan,
     output: Path,
     status: str,
     fallback_reason: str = "",
+    cache_hits: Sequence[str] = (),
+    cut_list: Path | None = None,
 ) -> None:
     payload = {
         "schema_version": SCHEMA_VERSION,
         "status": status,
         "source": str(source),
-        "cut_master": str(cut_master),
+        "cut_master": str(cut_master) if cut_master else "",
+        "cut_list": str(cut_list) if cut_list else "",
         "transcript": str(transcript) if transcript else "",
         "takeaway": plan.title,
         "highlights": [asdict(item) for item in plan.highlights],
@@ -491,6 +1005,7 @@ def _write_manifest(
         + ["complete_cut_master"],
         "output": str(output),
         "fallback_reason": fallback_reason,
+        "cache_hits": list(cache_hits),
     }
     (output_dir / "highlight_plan.json").write_text(
         json.dumps(payload, ensure_ascii=False, indent=2),
@@ -500,15 +1015,16 @@ def _write_manifest(
 
 def _pipeline_steps(config: PipelineConfig) -> tuple[str, ...]:
     """Name every stage so the console can show real progress."""
-    common = ("Removing silence (auto-editor)", "Reading video properties (ffprobe)")
+    if config.cut_list_only:
+        common = ("Finding the silences (auto-editor)", "Reading video properties (ffprobe)")
+        transcribe = "Transcribing the recording (whisper)"
+    else:
+        common = ("Removing silence (auto-editor)", "Reading video properties (ffprobe)")
+        transcribe = "Transcribing the cut master (whisper)"
     tail = ("Rendering the highlight video (ffmpeg)",)
     if config.manual_title and config.manual_highlights:
         return common + ("Applying the manual highlight ranges",) + tail
-    return (
-        common
-        + ("Transcribing the cut master (whisper)", "Choosing highlights (claude)")
-        + tail
-    )
+    return common + (transcribe, "Choosing highlights (claude)") + tail
 
 
 def _select_plan(
@@ -533,152 +1049,369 @@ def _select_plan(
     )
 
 
+def _cached_cut_master(
+    source: Path,
+    output_dir: Path,
+    config: PipelineConfig,
+    reporter: ProgressReporter,
+    cache: StageCache,
+) -> tuple[Path, bool]:
+    """Reuse the cut master of an unchanged recording and silence setting."""
+    key = stage_key(
+        "cut_master",
+        file_identity(source),
+        config.auto_editor.edit_expression,
+        config.auto_editor.margin,
+    )
+    entry = cache.lookup("cut_master", key)
+    if entry is not None:
+        return Path(entry["artifact"]), True
+    cut_master = render_cut_master(source, output_dir, reporter, config.auto_editor)
+    cache.store("cut_master", key, cut_master)
+    return cut_master, False
+
+
+def _cached_cut_list(
+    source: Path,
+    output_dir: Path,
+    config: PipelineConfig,
+    reporter: ProgressReporter,
+    cache: StageCache,
+) -> tuple[Path | None, bool]:
+    """Reuse the cut list of an unchanged recording and silence setting."""
+    key = stage_key(
+        "cut_list",
+        file_identity(source),
+        config.auto_editor.edit_expression,
+        config.auto_editor.margin,
+    )
+    entry = cache.lookup("cut_list", key)
+    if entry is not None:
+        return Path(entry["artifact"]), True
+    cut_list = export_cut_list(source, output_dir, reporter, config.auto_editor)
+    if cut_list is not None:
+        cache.store("cut_list", key, cut_list)
+    return cut_list, False
+
+
+def _fallback_video(
+    source: Path,
+    output_dir: Path,
+    config: PipelineConfig,
+    reporter: ProgressReporter,
+    cache: StageCache,
+    cut_master: Path | None,
+    body_render: BackgroundRender | None = None,
+) -> Path:
+    """Return the plain silence cut, rendering it now when only a cut list exists.
+
+    A body encoded alongside the run is that same silence cut, so it is kept
+    when there is no cut master and stopped when there is one.
+    """
+    if body_render is not None:
+        if cut_master is not None:
+            body_render.cancel()
+        else:
+            try:
+                return body_render.wait()
+            except (OSError, RuntimeError, subprocess.SubprocessError) as error:
+                reporter.warn(f"the body encode failed as well: {error}")
+    if cut_master is not None:
+        return cut_master
+    reporter.warn("rendering the plain silence cut instead")
+    cut_master, _ = _cached_cut_master(source, output_dir, config, reporter, cache)
+    return cut_master
+
+
+def _cached_probe(media: Path, cache: StageCache) -> tuple[VideoInfo, bool]:
+    """Reuse the properties read from the same video last time."""
+    key = stage_key("probe", file_identity(media))
+    entry = cache.lookup("probe", key)
+    if entry is not None:
+        try:
+            return VideoInfo(**entry["video"]), True
+        except (KeyError, TypeError):
+            cache.hits.remove("probe")
+    video = probe_video(media)
+    cache.store("probe", key, media, video=asdict(video))
+    return video, False
+
+
+def _extracted_audio(
+    audio_job: Future[Path] | None, reporter: ProgressReporter
+) -> Path | None:
+    """Wait for the extracted audio; a failed extraction transcribes the video."""
+    if audio_job is None:
+        return None
+    try:
+        return audio_job.result()
+    except (OSError, RuntimeError, subprocess.SubprocessError) as error:
+        reporter.warn(f"audio extraction failed, transcribing the video: {error}")
+        return None
+
+
+def _transcript_key(media: Path, config: PipelineConfig) -> str:
+    return stage_key("transcript", file_identity(media), list(config.transcript_command))
+
+
+def _cached_transcript(
+    media: Path,
+    output_dir: Path,
+    config: PipelineConfig,
+    reporter: ProgressReporter,
+    cache: StageCache,
+    audio_job: Future[Path] | None = None,
+) -> tuple[Path, bool]:
+    """Reuse the transcript of the same video made by the same command."""
+    key = _transcript_key(media, config)
+    entry = cache.lookup("transcript", key)
+    if entry is not None:
+        return Path(entry["artifact"]), True
+    transcript = transcribe_cut_master(
+        media,
+        output_dir,
+        config.transcript_command,
+        reporter,
+        _extracted_audio(audio_job, reporter),
+    )
+    cache.store("transcript", key, transcript)
+    return transcript, False
+
+
 def run_pipeline(
     source: Path,
     output_dir: Path,
     config: PipelineConfig,
     reporter: ProgressReporter | None = None,
+    *,
+    use_cache: bool = True,
 ) -> Path:
-    """Run cut -> transcribe -> select -> prepend -> title rendering."""
+    """Run cut -> transcribe -> select -> prepend -> title rendering.
+
+    The silence cut, the probe and the transcript are kept in `output_dir` and
+    reused while their inputs are unchanged, so a run that only changes how the
+    result looks goes straight to choosing and rendering.
+
+    With `config.cut_list_only` auto-editor only reports where the silences
+    are. The recording itself is transcribed, its timestamps are moved onto
+    the cut, and the final render trims the recording directly, so the video
+    is encoded once instead of twice. A cut master is rendered only when the
+    run has to fall back to it.
+
+    With `config.pipelined` the body starts encoding as soon as it is known,
+    while Whisper and Claude work; the last stage then renders only the short
+    opening reel and joins the two without encoding them again.
+    """
     reporter = reporter if reporter is not None else ProgressReporter(enabled=False)
     steps = _pipeline_steps(config)
     source = source.resolve()
     output_dir.mkdir(parents=True, exist_ok=True)
+    cache = StageCache(output_dir, enabled=use_cache)
+    cut_master: Path | None = None
+    cut_list: Path | None = None
 
     reporter.start_stage(steps[0], step=1, steps=len(steps))
-    cut_master = render_cut_master(
-        source,
-        output_dir,
-        reporter,
-        config.auto_editor,
-    )
-    reporter.finish_stage(cut_master.name)
+    if config.cut_list_only:
+        cut_list, reused = _cached_cut_list(source, output_dir, config, reporter, cache)
+        media = source
+        made = cut_list.name if cut_list else "nothing to cut"
+    else:
+        cut_master, reused = _cached_cut_master(
+            source, output_dir, config, reporter, cache
+        )
+        media = cut_master
+        made = cut_master.name
+    reporter.finish_stage(f"reusing {made}" if reused else made)
+
+    manual = bool(config.manual_title and config.manual_highlights)
+    audio_job: Future[Path] | None = None
+    if (
+        not manual
+        and wants_audio(config.transcript_command)
+        and not cache.holds("transcript", _transcript_key(media, config))
+    ):
+        audio_job = start_audio_extraction(media, output_dir)
 
     reporter.start_stage(steps[1], step=2, steps=len(steps))
-    video = probe_video(cut_master)
+    video, reused = _cached_probe(media, cache)
+    transcribed_seconds = video.duration
+    cut: tuple[Slice, ...] = ()
+    if config.cut_list_only:
+        cut = read_cut(cut_list, video.duration)
+        video = replace(video, duration=total_duration(cut))
     reporter.finish_stage(
         f"{video.width}x{video.height}, {format_clock(video.duration)} long"
+        + (f" after {len(cut)} kept stretches" if cut else "")
+        + (", cached" if reused else "")
     )
-    transcript: Path | None = None
-    plan: HighlightPlan
+    body_render: BackgroundRender | None = None
+    if config.pipelined:
+        try:
+            body_render = start_body_render(media, output_dir, source.stem, cut)
+        except OSError as error:
+            reporter.warn(f"could not encode the body alongside, rendering in one pass: {error}")
+    # Whatever ends the run from here - a fallback, an unexpected error or
+    # Ctrl+C - the body encode must not outlive it.
+    try:
+        transcript: Path | None = None
+        plan: HighlightPlan
 
-    if config.manual_title and config.manual_highlights:
-        reporter.start_stage(steps[2], step=3, steps=len(steps))
-        plan = build_manual_plan(
-            title=config.manual_title,
-            highlights=config.manual_highlights,
-            video_duration=video.duration,
-            maximum_highlights=config.maximum_highlights,
-            maximum_total_seconds=config.maximum_total_highlight_seconds,
+        if manual:
+            reporter.start_stage(steps[2], step=3, steps=len(steps))
+            plan = build_manual_plan(
+                title=config.manual_title,
+                highlights=config.manual_highlights,
+                video_duration=video.duration,
+                maximum_highlights=config.maximum_highlights,
+                maximum_total_seconds=config.maximum_total_highlight_seconds,
+            )
+            reporter.finish_stage(f"{len(plan.highlights)} highlights")
+        else:
+            reporter.start_stage(
+                steps[2],
+                step=3,
+                steps=len(steps),
+                total_seconds=transcribed_seconds,
+            )
+            try:
+                transcript, reused = _cached_transcript(
+                    media, output_dir, config, reporter, cache, audio_job
+                )
+                segments = _read_segments(transcript)
+                if cut:
+                    segments = map_segments_to_cut(segments, cut)
+                    transcript = output_dir / f"{source.stem}.cut_transcript.json"
+                    transcript.write_text(
+                        json.dumps({"segments": segments}, ensure_ascii=False, indent=2),
+                        encoding="utf-8",
+                    )
+            except (
+                OSError,
+                RuntimeError,
+                subprocess.SubprocessError,
+                json.JSONDecodeError,
+            ) as error:
+                reporter.finish_stage("failed")
+                reporter.warn(f"transcription failed, keeping the cut master: {error}")
+                fallback = _fallback_video(
+                    source, output_dir, config, reporter, cache, cut_master, body_render
+                )
+                _write_manifest(
+                    output_dir,
+                    source=source,
+                    cut_master=fallback,
+                    transcript=None,
+                    plan=HighlightPlan("", ()),
+                    output=fallback,
+                    status="fallback",
+                    fallback_reason=f"transcription_failed: {error}",
+                    cache_hits=cache.hits,
+                    cut_list=cut_list,
+                )
+                return fallback
+            reporter.finish_stage(
+                f"{len(segments)} segments" + (", reused transcript" if reused else "")
+            )
+
+            reporter.start_stage(steps[3], step=4, steps=len(steps))
+            plan = _select_plan(
+                segments,
+                video_duration=video.duration,
+                config=config,
+                reporter=reporter,
+            )
+            reporter.finish_stage(f"{len(plan.highlights)} highlights, title: {plan.title}")
+        plan = _limit_total_duration(plan, config.maximum_total_highlight_seconds)
+        if not plan.title or not plan.highlights:
+            reporter.warn("no usable highlight plan, keeping the cut master")
+            fallback = _fallback_video(
+                source, output_dir, config, reporter, cache, cut_master, body_render
+            )
+            _write_manifest(
+                output_dir,
+                source=source,
+                cut_master=fallback,
+                transcript=transcript,
+                plan=plan,
+                output=fallback,
+                status="fallback",
+                fallback_reason="no_usable_highlight_plan",
+                cache_hits=cache.hits,
+                cut_list=cut_list,
+            )
+            return fallback
+
+        subtitle = output_dir / "opening_title.ass"
+        display_seconds = min(
+            config.opening_title_seconds,
+            sum(item.end - item.start for item in plan.highlights),
         )
-        reporter.finish_stage(f"{len(plan.highlights)} highlights")
-    else:
+        write_opening_ass(
+            subtitle,
+            title=plan.title,
+            display_seconds=display_seconds,
+            resolution=(video.width, video.height),
+            font_name=config.font_name,
+            font_size=config.font_size,
+        )
+        output = output_dir / f"{source.stem}.highlighted.mp4"
+        highlight_seconds = sum(item.end - item.start for item in plan.highlights)
         reporter.start_stage(
-            steps[2], step=3, steps=len(steps), total_seconds=video.duration
+            steps[-1],
+            step=len(steps),
+            steps=len(steps),
+            total_seconds=(
+                highlight_seconds
+                if body_render is not None
+                else video.duration + highlight_seconds
+            ),
         )
         try:
-            transcript = transcribe_cut_master(
-                cut_master,
-                output_dir,
-                config.transcript_command,
-                reporter,
-            )
-            segments = _read_segments(transcript)
-        except (
-            OSError,
-            RuntimeError,
-            subprocess.SubprocessError,
-            json.JSONDecodeError,
-        ) as error:
+            if body_render is not None:
+                rendered = render_stitched_video(
+                    media, subtitle, output, plan, body_render, reporter, cut=cut
+                )
+            else:
+                rendered = render_highlight_video(
+                    media, subtitle, output, plan, reporter, cut=cut
+                )
+        except (OSError, RuntimeError, subprocess.SubprocessError) as error:
             reporter.finish_stage("failed")
-            reporter.warn(f"transcription failed, keeping the cut master: {error}")
-            fallback = HighlightPlan("", ())
+            reporter.warn(f"rendering failed, keeping the cut master: {error}")
+            if output.exists():
+                output.unlink()
+            fallback = _fallback_video(
+                source, output_dir, config, reporter, cache, cut_master, body_render
+            )
             _write_manifest(
                 output_dir,
                 source=source,
-                cut_master=cut_master,
-                transcript=None,
-                plan=fallback,
-                output=cut_master,
+                cut_master=fallback,
+                transcript=transcript,
+                plan=plan,
+                output=fallback,
                 status="fallback",
-                fallback_reason=f"transcription_failed: {error}",
+                fallback_reason=f"render_failed: {error}",
+                cache_hits=cache.hits,
+                cut_list=cut_list,
             )
-            return cut_master
-        reporter.finish_stage(f"{len(segments)} segments")
-
-        reporter.start_stage(steps[3], step=4, steps=len(steps))
-        plan = _select_plan(
-            segments,
-            video_duration=video.duration,
-            config=config,
-            reporter=reporter,
-        )
-        reporter.finish_stage(f"{len(plan.highlights)} highlights, title: {plan.title}")
-    plan = _limit_total_duration(plan, config.maximum_total_highlight_seconds)
-    if not plan.title or not plan.highlights:
-        reporter.warn("no usable highlight plan, keeping the cut master")
-        _write_manifest(
-            output_dir,
-            source=source,
-            cut_master=cut_master,
-            transcript=transcript,
-            plan=plan,
-            output=cut_master,
-            status="fallback",
-            fallback_reason="no_usable_highlight_plan",
-        )
-        return cut_master
-
-    subtitle = output_dir / "opening_title.ass"
-    display_seconds = min(
-        config.opening_title_seconds,
-        sum(item.end - item.start for item in plan.highlights),
-    )
-    write_opening_ass(
-        subtitle,
-        title=plan.title,
-        display_seconds=display_seconds,
-        resolution=(video.width, video.height),
-        font_name=config.font_name,
-        font_size=config.font_size,
-    )
-    output = output_dir / f"{source.stem}.highlighted.mp4"
-    highlight_seconds = sum(item.end - item.start for item in plan.highlights)
-    reporter.start_stage(
-        steps[-1],
-        step=len(steps),
-        steps=len(steps),
-        total_seconds=video.duration + highlight_seconds,
-    )
-    try:
-        rendered = render_highlight_video(cut_master, subtitle, output, plan, reporter)
-    except (OSError, RuntimeError, subprocess.SubprocessError) as error:
-        reporter.finish_stage("failed")
-        reporter.warn(f"rendering failed, keeping the cut master: {error}")
-        if output.exists():
-            output.unlink()
+            return fallback
+        reporter.finish_stage(rendered.name)
         _write_manifest(
             output_dir,
             source=source,
             cut_master=cut_master,
             transcript=transcript,
             plan=plan,
-            output=cut_master,
-            status="fallback",
-            fallback_reason=f"render_failed: {error}",
+            output=rendered,
+            status="success",
+            cache_hits=cache.hits,
+            cut_list=cut_list,
         )
-        return cut_master
-    reporter.finish_stage(rendered.name)
-    _write_manifest(
-        output_dir,
-        source=source,
-        cut_master=cut_master,
-        transcript=transcript,
-        plan=plan,
-        output=rendered,
-        status="success",
-    )
-    return rendered
+        return rendered
+    finally:
+        if body_render is not None:
+            body_render.close()
 
 
 def load_config(path: Path | None) -> tuple[list[Path], Path | None, PipelineConfig]:
@@ -706,6 +1439,8 @@ def load_config(path: Path | None) -> tuple[list[Path], Path | None, PipelineCon
         manual_highlights=tuple(item for item in manual if isinstance(item, dict)),
         transcript_command=tuple(str(item) for item in transcript_command),
         auto_editor=parse_auto_editor_config(data),
+        cut_list_only=bool(section.get("cut_list_only", False)),
+        pipelined=bool(section.get("pipelined", False)),
     )
     working_dirs = [Path(item) for item in data.get("working_dirs", [])]
     output_value = section.get("output_dir")
@@ -751,6 +1486,23 @@ def main(argv: Sequence[str] | None = None) -> int:
         default=20.0,
         help="how long a silent step may run before it reports it is alive",
     )
+    parser.add_argument(
+        "--cut-list-only",
+        action="store_true",
+        help="render straight from the recording with auto-editor's cut list, "
+        "skipping the cut master encode",
+    )
+    parser.add_argument(
+        "--pipelined",
+        action="store_true",
+        help="encode the body while transcribing, then render only the opening "
+        "reel and join the two",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="run every stage again even when its earlier output is still valid",
+    )
     args = parser.parse_args(argv)
     _use_replacement_characters()
     script_dir = Path(__file__).resolve().parent
@@ -768,6 +1520,10 @@ def main(argv: Sequence[str] | None = None) -> int:
             None,
         )
     working_dirs, configured_output, config = load_config(config_path)
+    if args.cut_list_only:
+        config = replace(config, cut_list_only=True)
+    if args.pipelined:
+        config = replace(config, pipelined=True)
     source = args.input or latest_recording(working_dirs)
     output_dir = (
         args.output_dir
@@ -781,7 +1537,9 @@ def main(argv: Sequence[str] | None = None) -> int:
     if not args.quiet:
         print(f"Source: {source}")
         print(f"Output directory: {output_dir}")
-    result = run_pipeline(source, output_dir, config, reporter)
+    result = run_pipeline(
+        source, output_dir, config, reporter, use_cache=not args.no_cache
+    )
     reporter.summary()
     print(result)
     return 0
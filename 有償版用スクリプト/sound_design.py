@@ -19,6 +19,13 @@ from edit_plan import Chapter, SoundCue
 from timeline import BODY, Slice, map_instant, transition_positions
 
 MAXIMUM_CUES = 48
+# normalize=0 keeps the narration at its original level; the default would
+# halve it the moment a single effect plays. The limiter only catches the
+# moment an effect lands on an already loud word; without it that frame clips.
+SFX_MIX = (
+    "amix=inputs=2:normalize=0:duration=first:dropout_transition=0,"
+    "alimiter=limit=0.95"
+)
 MINIMUM_CUE_GAP_SECONDS = 0.4
 SAMPLE_RATE = 48000
 
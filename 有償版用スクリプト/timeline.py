@@ -7,6 +7,10 @@ highlight and once in the body. Every overlay has to follow it to both places,
 and every position in the reel has to be renumbered from zero. Keeping that
 arithmetic in one tested module is what makes captions, telops, chapter cards
 and sound cues line up in a single render.
+
+A silence cut is the same kind of mapping one step earlier, from the recording
+to the cut master. Expressed as slices it lets the final render trim the
+recording directly, so the cut master never has to be encoded at all.
 """
 
 from __future__ import annotations
@@ -111,3 +115,124 @@ def map_instant(
 def transition_positions(slices: Sequence[Slice]) -> tuple[float, ...]:
     """Return where the finished video jumps from one piece to another."""
     return tuple(item.output_start for item in slices[1:])
+
+
+def cut_slices(kept: Iterable[tuple[float, float]]) -> tuple[Slice, ...]:
+    """Lay the stretches a silence cut keeps end to end, as the cut master would.
+
+    Each slice's source is the recording and its output position is the cut
+    master, so a cut list can stand in for the rendered cut master: the same
+    arithmetic that places the body in the finished video places every kept
+    stretch in the cut master. Touching or overlapping stretches become one.
+    """
+    merged: list[list[float]] = []
+    for start, end in sorted(kept):
+        if end <= start:
+            continue
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    slices: list[Slice] = []
+    cursor = 0.0
+    for start, end in merged:
+        slices.append(Slice(start, end, cursor, BODY))
+        cursor += end - start
+    return tuple(slices)
+
+
+def to_recording(
+    cut: Iterable[Slice], start: float, end: float
+) -> tuple[tuple[float, float], ...]:
+    """Return the recording ranges that play one cut-master range, in order."""
+    ranges: list[tuple[float, float]] = []
+    for item in cut:
+        overlap_start = max(start, item.output_start)
+        overlap_end = min(end, item.output_end)
+        if overlap_end <= overlap_start:
+            continue
+        offset = item.source_start - item.output_start
+        ranges.append((overlap_start + offset, overlap_end + offset))
+    return tuple(ranges)
+
+
+def to_cut_master(
+    cut: Iterable[Slice], start: float, end: float
+) -> tuple[float, float] | None:
+    """Return where a recording range lands in the cut master, or None if cut away.
+
+    A range that spans a cut keeps both sides and simply loses the silence
+    between them, which is what the viewer of the cut master hears.
+    """
+    placements: list[tuple[float, float]] = []
+    for item in cut:
+        overlap_start = max(start, item.source_start)
+        overlap_end = min(end, item.source_end)
+        if overlap_end <= overlap_start:
+            continue
+        offset = item.output_start - item.source_start
+        placements.append((overlap_start + offset, overlap_end + offset))
+    if not placements:
+        return None
+    return placements[0][0], placements[-1][1]
+
+
+def resolve_slices(slices: Iterable[Slice], cut: Sequence[Slice]) -> tuple[Slice, ...]:
+    """Re-express slices of the cut master as slices of the original recording.
+
+    A highlight or body that spans cuts becomes several pieces; their output
+    positions still add up to the same finished video.
+    """
+    resolved: list[Slice] = []
+    for item in slices:
+        cursor = item.output_start
+        for start, end in to_recording(cut, item.source_start, item.source_end):
+            resolved.append(Slice(start, end, cursor, item.kind))
+            cursor += end - start
+    return tuple(resolved)
+
+
+def segment_windows(
+    total: float,
+    count: int,
+    *,
+    frame_rate: float = 0.0,
+    minimum_seconds: float = 30.0,
+) -> tuple[tuple[float, float], ...]:
+    """Split the finished video into at most `count` consecutive windows.
+
+    Windows shorter than `minimum_seconds` are not worth a separate encoder, so
+    a short video gets fewer of them. With a known frame rate every boundary
+    falls on a frame, and joining the windows neither repeats nor drops one.
+    """
+    if total <= 0:
+        return ()
+    count = max(1, min(count, int(total // max(minimum_seconds, 1e-3))))
+    bounds = [0.0]
+    for index in range(1, count):
+        boundary = total * index / count
+        if frame_rate > 0:
+            boundary = round(boundary * frame_rate) / frame_rate
+        if bounds[-1] < boundary < total:
+            bounds.append(boundary)
+    bounds.append(total)
+    return tuple(zip(bounds, bounds[1:]))
+
+
+def clip_slices(slices: Iterable[Slice], start: float, end: float) -> tuple[Slice, ...]:
+    """Return the parts of the slices that play inside one finished-video window.
+
+    Output positions stay those of the whole video, so overlays built for the
+    complete timeline still apply to the window.
+    """
+    clipped: list[Slice] = []
+    for item in slices:
+        overlap_start = max(start, item.output_start)
+        overlap_end = min(end, item.output_end)
+        if overlap_end <= overlap_start:
+            continue
+        offset = item.source_start - item.output_start
+        clipped.append(
+            Slice(overlap_start + offset, overlap_end + offset, overlap_start, item.kind)
+        )
+    return tuple(clipped)